@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Benchmark: INT8 vs FP32 YOLO Detector
+
+Compares the quantized detector against the FP32 model on a fixed screenshot corpus:
+1. Latency - per-image detect_ui_elements wall time (mean, p50, p95) and speedup
+2. Agreement - INT8 detections matched to FP32 by class and IoU (precision, recall, F1)
+
+Usage:
+    python scripts/benchmark_quantized_detector.py --corpus eval/screenshots
+    python scripts/benchmark_quantized_detector.py --corpus eval/screenshots --quantize static
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from vision.cache import get_result_cache
+from vision.detector import Detection, detect_ui_elements
+from vision.nms import box_iou
+from vision.setup_models import get_model_paths, setup_quantized_yolo_model
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def load_corpus(corpus_dir: Path) -> list[tuple[str, np.ndarray]]:
+    """Load all screenshots from the corpus directory in a stable order"""
+    images = []
+    for path in sorted(corpus_dir.iterdir()):
+        if path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        image = cv2.imread(str(path))
+        if image is not None:
+            images.append((path.name, image))
+    return images
+
+
+def time_variant(
+    images: list[tuple[str, np.ndarray]], variant: str, runs: int, confidence_threshold: float
+) -> tuple[list[float], dict[str, list[Detection]]]:
+    """Run the detector on every image and collect latencies and detections"""
+    # Repeated calls on the same frame would be result cache hits, so time with it off
+    cache = get_result_cache()
+    cache_bytes = cache.max_bytes
+    cache.resize(0)
+    try:
+        # Warm-up so session load is not counted
+        detect_ui_elements(images[0][1], confidence_threshold, model_variant=variant)
+
+        latencies = []
+        detections = {}
+        for name, image in images:
+            for _ in range(runs):
+                start_time = time.perf_counter()
+                detections[name] = detect_ui_elements(
+                    image, confidence_threshold, ui_focused=False, model_variant=variant
+                )
+                latencies.append(time.perf_counter() - start_time)
+    finally:
+        cache.resize(cache_bytes)
+
+    return latencies, detections
+
+
+def match_detections(
+    reference: list[Detection], candidate: list[Detection], iou_threshold: float
+) -> tuple[int, list[float]]:
+    """Greedily match candidate detections to reference ones of the same class"""
+    if not reference or not candidate:
+        return 0, []
+
+    ious = box_iou([d.bbox for d in reference], [d.bbox for d in candidate])
+    same_class = np.array(
+        [[r.class_name == c.class_name for c in candidate] for r in reference], dtype=bool
+    )
+    ious[~same_class] = 0.0
+
+    matches = 0
+    confidence_deltas = []
+    while True:
+        ref_idx, cand_idx = np.unravel_index(np.argmax(ious), ious.shape)
+        if ious[ref_idx, cand_idx] < iou_threshold:
+            break
+        matches += 1
+        confidence_deltas.append(
+            abs(reference[ref_idx].confidence - candidate[cand_idx].confidence)
+        )
+        ious[ref_idx, :] = 0.0
+        ious[:, cand_idx] = 0.0
+
+    return matches, confidence_deltas
+
+
+def summarize_latency(latencies: list[float]) -> dict[str, float]:
+    """Latency summary in milliseconds"""
+    values = np.array(latencies) * 1000
+    return {
+        "mean_ms": float(values.mean()),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+    }
+
+
+def main() -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark INT8 vs FP32 YOLO detector")
+    parser.add_argument("--corpus", required=True, help="Directory of screenshots")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per image")
+    parser.add_argument("--confidence", type=float, default=0.25, help="Confidence threshold")
+    parser.add_argument("--iou", type=float, default=0.5, help="IoU for a detection match")
+    parser.add_argument(
+        "--quantize",
+        choices=["dynamic", "static"],
+        default="dynamic",
+        help="Quantization mode if the INT8 model does not exist yet",
+    )
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    corpus_dir = Path(args.corpus)
+    images = load_corpus(corpus_dir)
+    if not images:
+        print(f"❌ No screenshots found in {corpus_dir}")
+        return 1
+
+    print("📊 INT8 vs FP32 Detector Benchmark")
+    print("=" * 40)
+    print(f"Corpus: {corpus_dir} ({len(images)} images, {args.runs} runs each)")
+
+    if not Path(get_model_paths()["yolo_onnx_int8"]).exists():
+        setup_quantized_yolo_model(
+            mode=args.quantize,
+            calibration_dir=str(corpus_dir) if args.quantize == "static" else None,
+        )
+
+    fp32_latencies, fp32_detections = time_variant(images, "fp32", args.runs, args.confidence)
+    int8_latencies, int8_detections = time_variant(images, "int8", args.runs, args.confidence)
+
+    total_fp32 = sum(len(d) for d in fp32_detections.values())
+    total_int8 = sum(len(d) for d in int8_detections.values())
+    total_matches = 0
+    confidence_deltas = []
+    for name, _ in images:
+        matches, deltas = match_detections(fp32_detections[name], int8_detections[name], args.iou)
+        total_matches += matches
+        confidence_deltas.extend(deltas)
+
+    precision = total_matches / total_int8 if total_int8 else 1.0
+    recall = total_matches / total_fp32 if total_fp32 else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+    fp32_summary = summarize_latency(fp32_latencies)
+    int8_summary = summarize_latency(int8_latencies)
+
+    report = {
+        "images": len(images),
+        "runs_per_image": args.runs,
+        "latency": {
+            "fp32": fp32_summary,
+            "int8": int8_summary,
+            "speedup": fp32_summary["mean_ms"] / int8_summary["mean_ms"],
+        },
+        "agreement": {
+            "fp32_detections": total_fp32,
+            "int8_detections": total_int8,
+            "matched": total_matches,
+            "precision": precision,
+            "recall": recall,
+            "f1": f1,
+            "mean_confidence_delta": float(np.mean(confidence_deltas))
+            if confidence_deltas
+            else 0.0,
+        },
+    }
+
+    print("\n⏱️  Latency (ms)")
+    for variant in ("fp32", "int8"):
+        summary = report["latency"][variant]
+        print(
+            f"  {variant}: mean {summary['mean_ms']:.1f}  "
+            f"p50 {summary['p50_ms']:.1f}  p95 {summary['p95_ms']:.1f}"
+        )
+    print(f"  speedup: {report['latency']['speedup']:.2f}x")
+
+    agreement = report["agreement"]
+    print("\n🎯 Agreement (INT8 vs FP32)")
+    print(f"  detections: {agreement['int8_detections']} vs {agreement['fp32_detections']}")
+    print(f"  precision {precision:.3f}  recall {recall:.3f}  F1 {f1:.3f}")
+    print(f"  mean confidence delta: {agreement['mean_confidence_delta']:.3f}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Report saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
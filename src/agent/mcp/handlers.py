@@ -87,12 +87,17 @@ def handle_detect_elements(parameters: dict[str, Any]) -> dict[str, Any]:
         # Decode image
         image = decode_base64_image(validated_params["image_base64"])
 
+        # Optional regions to restrict detection to
+        regions = validated_params.get("regions")
+
         # Call OCR function
         detections = detect_ui_elements(
             image=image,
             confidence_threshold=validated_params.get("confidence_threshold", 0.6),
             ui_focused=validated_params.get("ui_focused", True),
             max_detections=validated_params.get("max_detections", 50),
+            regions=[tuple(region) for region in regions] if regions else None,
+            tiled=validated_params.get("tiled", False) and not regions,
         )
 
         # Format response
@@ -205,6 +210,7 @@ def handle_find_elements(parameters: dict[str, Any]) -> dict[str, Any]:
             confidence_threshold=validated_params.get("confidence_threshold", 0.6),
             search_radius=validated_params.get("search_radius", 100),
             case_sensitive=validated_params.get("case_sensitive", False),
+            fuzzy=validated_params.get("fuzzy", False),
         )
 
         # Format response
@@ -206,6 +206,33 @@ def main():
     except Exception as e:
         print(f"⚠️  Could not verify models: {e}", file=sys.stderr)
 
+    # Report execution profile, pre-warm OCR engines listed in VISION_OCR_PREWARM and
+    # VISION_OCR_RECOGNIZER_PREWARM, and start VISION_OCR_WORKERS worker processes
+    try:
+        from vision import (
+            get_execution_profile,
+            prewarm_ocr_engines,
+            prewarm_text_recognizers,
+            start_ocr_workers,
+        )
+
+        print(f"⚙️  ONNX execution profile: {get_execution_profile().name}", file=sys.stderr)
+
+        warmed = prewarm_ocr_engines()
+        if warmed:
+            print(f"🔥 OCR engines pre-warmed: {warmed}", file=sys.stderr)
+
+        warmed = prewarm_text_recognizers()
+        if warmed:
+            print(f"🔥 Text recognizers pre-warmed: {warmed}", file=sys.stderr)
+
+        workers = start_ocr_workers()
+        if workers:
+            print(f"🔥 OCR worker processes started: {workers.num_workers}", file=sys.stderr)
+
+    except Exception as e:
+        print(f"⚠️  Could not pre-warm OCR engines: {e}", file=sys.stderr)
+
     # Run server
     try:
         asyncio.run(start_server())
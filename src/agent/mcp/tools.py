@@ -51,6 +51,21 @@ def get_function_tools() -> list[dict[str, Any]]:
                             "maximum": 200,
                             "description": "Maximum number of detections to return",
                         },
+                        "regions": {
+                            "type": "array",
+                            "items": {
+                                "type": "array",
+                                "items": {"type": "integer"},
+                                "minItems": 4,
+                                "maxItems": 4,
+                            },
+                            "description": "Optional regions [[x1, y1, x2, y2], ...] to restrict detection to specific areas",
+                        },
+                        "tiled": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Detect in overlapping tiles to find small elements on high-resolution screens (ignored when regions are given)",
+                        },
                     },
                     "required": ["image_base64"],
                 },
@@ -134,6 +149,11 @@ def get_function_tools() -> list[dict[str, Any]]:
                             "maximum": 500,
                             "description": "Radius in pixels to search for nearby visual elements",
                         },
+                        "fuzzy": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Also match text with small OCR errors (e.g. 'Subrnit' for 'Submit')",
+                        },
                     },
                     "required": ["image_base64", "text_query"],
                 },
@@ -5,6 +5,7 @@ import time
 from typing import Any
 
 from automation.remote.agents.shared_context import VMSession, VMTarget
+from vision import call_vision
 
 
 class AppControllerTools:
@@ -76,7 +77,9 @@ class AppControllerTools:
                 )
 
                 # Strategy 1: Direct text search
-                elements = self.ui_finder.find_element_by_text(screenshot, element_description)
+                elements = call_vision(
+                    self.ui_finder.find_element_by_text, screenshot, element_description
+                )
                 if elements:
                     best_element = max(elements, key=lambda x: x.confidence)
                     self.session.log_action(
@@ -96,7 +99,7 @@ class AppControllerTools:
                     }
 
                 # Strategy 2: Look for clickable elements with partial text match
-                clickable_elements = self.ui_finder.find_clickable_elements(screenshot)
+                clickable_elements = call_vision(self.ui_finder.find_clickable_elements, screenshot)
                 for element in clickable_elements:
                     if element.text and element_description.lower() in element.text.lower():
                         self.session.log_action(
@@ -116,7 +119,7 @@ class AppControllerTools:
 
                 # Strategy 3: Keyword-based search
                 keywords = element_description.lower().split()
-                for element in self.ui_finder.find_ui_elements(screenshot):
+                for element in call_vision(self.ui_finder.find_ui_elements, screenshot):
                     if element.text:
                         element_text_lower = element.text.lower()
                         if any(keyword in element_text_lower for keyword in keywords):
@@ -185,8 +188,8 @@ class AppControllerTools:
             self.session.add_screenshot(after_screenshot, f"After clicking {element_text}")
 
             # Verify click was successful
-            verification = self.verifier.verify_click_success(
-                before_screenshot, after_screenshot, "any"
+            verification = call_vision(
+                self.verifier.verify_click_success, before_screenshot, after_screenshot, "any"
             )
 
             if verification.success:
@@ -228,7 +231,7 @@ class AppControllerTools:
             missing_outcomes = []
 
             for expected in expected_outcomes:
-                elements = self.ui_finder.find_element_by_text(screenshot, expected)
+                elements = call_vision(self.ui_finder.find_element_by_text, screenshot, expected)
                 if elements:
                     found_outcomes.append(expected)
                     self.session.log_action(f"✓ Found expected outcome: {expected}")
@@ -360,28 +363,38 @@ class AppControllerAgent:
             for step_name, step_func in steps:
                 self.session.log_action(f"Executing: {step_name}")
 
+                # Synchronous tool steps (capture, input, waits) run in a worker thread so
+                # other sessions on this event loop keep running; their detection and OCR
+                # go through call_vision onto the bounded vision pool
                 if step_name == "Find target element":
                     # Try direct search first, then scroll if needed
-                    result = self.tools.find_target_element_with_retry(
-                        self.vm_target.target_button_text
+                    result = await asyncio.to_thread(
+                        self.tools.find_target_element_with_retry,
+                        self.vm_target.target_button_text,
                     )
 
                     if not result["success"]:
                         self.session.log_action("Direct search failed, trying scroll search...")
-                        result = self.tools.scroll_and_search(self.vm_target.target_button_text)
+                        result = await asyncio.to_thread(
+                            self.tools.scroll_and_search, self.vm_target.target_button_text
+                        )
 
                     if result["success"]:
                         element_info = result["element"]
 
                 elif step_name == "Click element":
                     if element_info:
-                        result = self.tools.click_element_verified(element_info)
+                        result = await asyncio.to_thread(
+                            self.tools.click_element_verified, element_info
+                        )
                     else:
                         result = {"success": False, "error": "No element found to click"}
 
                 elif step_name == "Verify action outcome":
                     if expected_outcomes:
-                        result = self.tools.verify_action_outcome(expected_outcomes)
+                        result = await asyncio.to_thread(
+                            self.tools.verify_action_outcome, expected_outcomes
+                        )
                     else:
                         # Default verification - check if element is still there or changed
                         result = {
@@ -390,7 +403,7 @@ class AppControllerAgent:
                         }
 
                 else:
-                    result = step_func()
+                    result = await asyncio.to_thread(step_func)
 
                 if not result["success"]:
                     self.session.add_error(
@@ -448,7 +461,9 @@ class AppControllerAgent:
                 self.session.log_action(f"Filling field: {field_name} = {field_value}")
 
                 # Find field
-                field_result = self.tools.find_target_element_with_retry(field_name)
+                field_result = await asyncio.to_thread(
+                    self.tools.find_target_element_with_retry, field_name
+                )
                 if not field_result["success"]:
                     return {
                         "success": False,
@@ -457,7 +472,9 @@ class AppControllerAgent:
                     }
 
                 # Click field to focus
-                click_result = self.tools.click_element_verified(field_result["element"])
+                click_result = await asyncio.to_thread(
+                    self.tools.click_element_verified, field_result["element"]
+                )
                 if not click_result["success"]:
                     return {
                         "success": False,
@@ -466,7 +483,9 @@ class AppControllerAgent:
                     }
 
                 # Type value
-                type_result = self.tools.input_actions.type_text(field_value)
+                type_result = await asyncio.to_thread(
+                    self.tools.input_actions.type_text, field_value
+                )
                 if not type_result.success:
                     return {
                         "success": False,
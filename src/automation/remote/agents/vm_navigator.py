@@ -13,8 +13,10 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 # from vision.verification import ActionVerifier
 from automation.remote.agents.shared_context import VMSession, VMTarget
 from vision import (
+    IncrementalOCR,
+    ScreenIndex,
+    call_vision,
     detect_ui_elements,
-    extract_text,
     find_elements_by_text,
     verify_click_success,
     verify_page_loaded,
@@ -42,6 +44,9 @@ class VMNavigatorTools:
         # No need for UIFinder initialization - using pure functions
         # ActionVerifier will need to be updated separately
 
+        # Polling loops re-read only the parts of the screen that changed
+        self.text_reader = IncrementalOCR(confidence_threshold=0.5)
+
     def connect_to_vm(self) -> dict[str, Any]:
         """Connect to the VM"""
         try:
@@ -126,10 +131,12 @@ class VMNavigatorTools:
                 self.session.add_screenshot(screenshot, "Intermediate screen check")
 
                 # First check if this is an Acceptable Use screen
-
-                elements = find_elements_by_text(
-                    screenshot, "Acceptable Use", confidence_threshold=0.7
+                screen = ScreenIndex(
+                    screenshot,
+                    confidence_threshold=0.7,
+                    text_results=call_vision(self.text_reader.update, screenshot),
                 )
+                elements = screen.find_text("Acceptable Use")
                 if elements:
                     best_element = max(elements, key=lambda x: x.confidence)
                     self.session.log_action("Found Acceptable Use screen")
@@ -138,7 +145,7 @@ class VMNavigatorTools:
 
                 # If Acceptable Use screen found, look specifically for OK button to click
                 if acceptable_use_found:
-                    ok_elements = find_elements_by_text(screenshot, "OK", confidence_threshold=0.7)
+                    ok_elements = screen.find_text("OK")
                     if ok_elements:
                         best_ok = max(ok_elements, key=lambda x: x.confidence)
                         if self.input_actions is None:
@@ -202,7 +209,7 @@ class VMNavigatorTools:
 
                 # TODO: Update ActionVerifier to work with new clean OCR functions
                 # For now, we'll do a basic check for any text elements
-                text_elements = extract_text(screenshot, confidence_threshold=0.5)
+                text_elements = call_vision(self.text_reader.update, screenshot)
                 desktop_loaded = len(text_elements) > 0
 
                 if desktop_loaded:
@@ -243,7 +250,9 @@ class VMNavigatorTools:
                 )
 
                 # Look for the application by name/text
-                elements = find_elements_by_text(screenshot, app_name, confidence_threshold=0.6)
+                elements = call_vision(
+                    find_elements_by_text, screenshot, app_name, confidence_threshold=0.6
+                )
 
                 if elements:
                     best_element = max(elements, key=lambda x: x.confidence)
@@ -315,7 +324,9 @@ class VMNavigatorTools:
             self.session.add_screenshot(after_screenshot, "After launching application")
 
             # Verify that something changed (app launched) using clean verification
-            verification = verify_click_success(before_screenshot, after_screenshot, "page_change")
+            verification = call_vision(
+                verify_click_success, before_screenshot, after_screenshot, "page_change"
+            )
 
             if verification.success:
                 self.session.log_action(
@@ -358,10 +369,10 @@ class VMNavigatorTools:
             banner_region = (0, 0, width, int(height * 0.2))
 
             # Read text from patient banner area using clean OCR
-            from vision import extract_text_from_region
+            from vision import extract_text_from_region, normalize_text
 
-            text_detections = extract_text_from_region(
-                screenshot, banner_region, confidence_threshold=0.5
+            text_detections = call_vision(
+                extract_text_from_region, screenshot, banner_region, confidence_threshold=0.5
             )
 
             if not text_detections:
@@ -371,9 +382,10 @@ class VMNavigatorTools:
                     "safety_critical": True,
                 }
 
-            # Extract all text from banner
+            # Extract all text from banner (normalized, but never fuzzy-matched:
+            # an identifier one character off is a different patient)
             banner_texts = [detection.text.strip() for detection in text_detections]
-            banner_text_combined = " ".join(banner_texts).upper()
+            banner_text_combined = normalize_text(" ".join(banner_texts))
 
             # Verify patient identifiers
             verified_fields = []
@@ -383,10 +395,10 @@ class VMNavigatorTools:
                 if not expected_value:  # Skip empty values
                     continue
 
-                expected_upper = expected_value.upper().strip()
+                expected_normalized = normalize_text(expected_value)
 
                 # Check if expected value appears in banner text
-                if expected_upper in banner_text_combined:
+                if expected_normalized in banner_text_combined:
                     verified_fields.append(field_name)
                     self.session.log_action(f"✓ Patient {field_name} verified: {expected_value}")
                 else:
@@ -442,20 +454,25 @@ class VMNavigatorTools:
 
             # 1. Check for expected app elements
             if self.vm_target.expected_app_elements:
-                result = verify_page_loaded(
-                    screenshot, self.vm_target.expected_app_elements, confidence_threshold=0.5
+                result = call_vision(
+                    verify_page_loaded,
+                    screenshot,
+                    self.vm_target.expected_app_elements,
+                    confidence_threshold=0.5,
+                    text_results=call_vision(self.text_reader.update, screenshot),
                 )
                 verification_results.append(("app_elements", result.success, result.message))
 
             # 2. Check for any UI elements (generic check)
-            elements = detect_ui_elements(screenshot, confidence_threshold=0.6)
+            elements = call_vision(detect_ui_elements, screenshot, confidence_threshold=0.6)
             ui_elements_found = len(elements) > 0
             verification_results.append(
                 ("ui_elements", ui_elements_found, f"Found {len(elements)} UI elements")
             )
 
             # 3. Check window title or specific text
-            app_name_elements = find_elements_by_text(
+            app_name_elements = call_vision(
+                find_elements_by_text,
                 screenshot,
                 self.vm_target.target_app_name.replace(".exe", ""),
                 confidence_threshold=0.6,
@@ -555,20 +572,27 @@ class VMNavigatorAgent:
             for step_name, step_func in steps:
                 self.session.log_action(f"Executing: {step_name}")
 
+                # Synchronous tool steps (capture, input, waits) run in a worker thread so
+                # other sessions on this event loop keep running; their detection and OCR
+                # go through call_vision onto the bounded vision pool
                 if step_name == "Launch application":
                     if app_element:
-                        result = self.tools.launch_application_verified(app_element)
+                        result = await asyncio.to_thread(
+                            self.tools.launch_application_verified, app_element
+                        )
                     else:
                         result = {"success": False, "error": "No app element found"}
 
                 elif step_name == "Find application":
-                    result = step_func()
+                    result = await asyncio.to_thread(step_func)
                     if result["success"]:
                         app_element = result["element"]
 
                 elif step_name == "Verify patient identity":
                     if patient_info:
-                        result = self.tools.verify_patient_banner(patient_info)
+                        result = await asyncio.to_thread(
+                            self.tools.verify_patient_banner, patient_info
+                        )
                         # Patient verification failure should stop the workflow
                         if not result["success"]:
                             return {
@@ -588,7 +612,7 @@ class VMNavigatorAgent:
                     if asyncio.iscoroutinefunction(step_func):
                         result = await step_func()
                     else:
-                        result = step_func()
+                        result = await asyncio.to_thread(step_func)
 
                 if not result["success"]:
                     self.session.add_error(
@@ -7,6 +7,7 @@ import numpy as np
 
 from automation.core.base import VMConnection
 from automation.remote import create_connection
+from vision.change import detect_screen_change
 
 
 class ScreenCapture:
@@ -120,13 +121,14 @@ class ScreenCapture:
 
         return False
 
-    def wait_for_screen_change(self, timeout: int = 10, threshold: float = 0.1) -> bool:
+    def wait_for_screen_change(self, timeout: int = 10, threshold: float | None = None) -> bool:
         """
         Wait for screen to change (useful after actions)
 
         Args:
             timeout: Maximum wait time in seconds
-            threshold: Change threshold (0-1)
+            threshold: Fraction of the screen that must change (0-1). If None, any
+                change larger than a caret blink counts
 
         Returns:
             True if screen changed within timeout
@@ -154,20 +156,17 @@ class ScreenCapture:
         return False
 
     def _screens_different(
-        self, screen1: np.ndarray, screen2: np.ndarray, threshold: float
+        self, screen1: np.ndarray, screen2: np.ndarray, threshold: float | None
     ) -> bool:
         """Check if two screens are significantly different"""
         if screen1.shape != screen2.shape:
             return True
 
-        # Calculate mean squared difference
-        diff = cv2.absdiff(screen1, screen2)
-        mse = np.mean(diff**2)
+        # Changed area of downsampled thumbnails; the reference frame's thumbnail is
+        # cached across polls
+        change = detect_screen_change(screen1, screen2)
 
-        # Normalize MSE (rough approximation)
-        normalized_mse = mse / (255**2)
-
-        return bool(normalized_mse > threshold)
+        return change.changed and (threshold is None or change.score >= threshold)
 
     def get_screen_resolution(self) -> tuple[int, int] | None:
         """
@@ -18,16 +18,66 @@ Example usage:
     buttons = find_elements_by_text(image, "Submit")
 """
 
-from .detector import Detection, detect_ui_elements
+from .async_api import (
+    aanalyze_screen_content,
+    adetect_ui_elements,
+    adetect_ui_elements_batch,
+    aextract_text,
+    aextract_text_from_region,
+    aextract_text_from_regions,
+    aextract_text_two_stage,
+    afind_clickable_elements,
+    afind_elements_by_text,
+    arecognize_text,
+    averify_click_success,
+    averify_element_present,
+    averify_text_input,
+    call_vision,
+    configure_async_vision,
+    run_vision_call,
+)
+from .cache import clear_result_cache, configure_result_cache, get_result_cache_stats
+from .change import ScreenChange, detect_screen_change
+from .detector import Detection, detect_ui_elements, detect_ui_elements_batch
 from .finder import (
     ScreenAnalysis,
+    ScreenIndex,
     UIElement,
     analyze_screen_content,
+    configure_finder_concurrency,
     find_clickable_elements,
     find_elements_by_text,
 )
-from .reader import TextResult, extract_text, extract_text_from_region
+from .incremental import IncrementalOCR
+from .nms import box_iou, non_max_suppression, soft_nms
+from .ocr_engines import (
+    configure_ocr_engines,
+    get_ocr_engine_stats,
+    prewarm_ocr_engines,
+    prewarm_text_recognizers,
+)
+from .ocr_workers import OCRWorkerPool, start_ocr_workers, stop_ocr_workers
+from .reader import (
+    OCRScalePolicy,
+    TextResult,
+    extract_text,
+    extract_text_from_region,
+    extract_text_from_regions,
+    extract_text_two_stage,
+    get_two_stage_ocr_stats,
+    recognize_text,
+)
+from .sessions import (
+    get_execution_profile,
+    get_session_stats,
+    optimize_model,
+    preload_model,
+    set_execution_profile,
+    unload_model,
+)
 from .setup_models import download_models, get_model_paths, setup_models
+from .spatial import SpatialIndex
+from .text_index import TextIndex, TextMatch, normalize_text, text_similarity
 from .verification import (
     VerificationResult,
     compare_screenshots,
@@ -44,17 +94,34 @@ __version__ = "1.0.0"
 __all__ = [
     # Detection functions
     "detect_ui_elements",
+    "detect_ui_elements_batch",
     "Detection",
+    "non_max_suppression",
+    "soft_nms",
+    "box_iou",
+    "SpatialIndex",
     # Text extraction functions
     "extract_text",
     "extract_text_from_region",
+    "extract_text_from_regions",
+    "recognize_text",
+    "extract_text_two_stage",
+    "OCRScalePolicy",
+    "get_two_stage_ocr_stats",
+    "IncrementalOCR",
     "TextResult",
+    "TextIndex",
+    "TextMatch",
+    "normalize_text",
+    "text_similarity",
     # Combined search functions
     "find_elements_by_text",
     "find_clickable_elements",
     "analyze_screen_content",
     "UIElement",
     "ScreenAnalysis",
+    "ScreenIndex",
+    "configure_finder_concurrency",
     # Verification functions
     "verify_click_success",
     "verify_text_input",
@@ -63,9 +130,45 @@ __all__ = [
     "wait_for_element",
     "compare_screenshots",
     "create_diff_visualization",
+    "detect_screen_change",
+    "ScreenChange",
     "VerificationResult",
     # Model management
     "setup_models",
     "download_models",
     "get_model_paths",
+    "preload_model",
+    "unload_model",
+    "get_session_stats",
+    "set_execution_profile",
+    "get_execution_profile",
+    "optimize_model",
+    "configure_ocr_engines",
+    "prewarm_ocr_engines",
+    "prewarm_text_recognizers",
+    "get_ocr_engine_stats",
+    "OCRWorkerPool",
+    "start_ocr_workers",
+    "stop_ocr_workers",
+    # Async API
+    "adetect_ui_elements",
+    "adetect_ui_elements_batch",
+    "aextract_text",
+    "aextract_text_from_region",
+    "aextract_text_from_regions",
+    "aextract_text_two_stage",
+    "arecognize_text",
+    "afind_elements_by_text",
+    "afind_clickable_elements",
+    "aanalyze_screen_content",
+    "averify_click_success",
+    "averify_text_input",
+    "averify_element_present",
+    "run_vision_call",
+    "call_vision",
+    "configure_async_vision",
+    # Result caching
+    "configure_result_cache",
+    "clear_result_cache",
+    "get_result_cache_stats",
 ]
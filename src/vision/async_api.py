@@ -0,0 +1,177 @@
+"""Awaitable Vision Functions
+
+Async counterparts of the detection, OCR, search and verification functions for
+asyncio agents. Calls run on a bounded thread pool shared by the process, so a
+slow OCR pass never blocks the event loop and one loop can drive many sessions.
+Worker threads share the same pool through call_vision.
+
+Async API: Bounded executor, per-call timeouts, cancellation of queued work
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from .detector import detect_ui_elements, detect_ui_elements_batch
+from .finder import analyze_screen_content, find_clickable_elements, find_elements_by_text
+from .reader import (
+    extract_text,
+    extract_text_from_region,
+    extract_text_from_regions,
+    extract_text_two_stage,
+    recognize_text,
+)
+from .verification import verify_click_success, verify_element_present, verify_text_input
+
+# Default vision threads (VISION_ASYNC_WORKERS overrides)
+DEFAULT_ASYNC_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# Set while a vision pool thread runs a call, so nested call_vision runs inline
+_pool_thread = threading.local()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = int(os.getenv("VISION_ASYNC_WORKERS") or DEFAULT_ASYNC_WORKERS)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vision")
+        return _executor
+
+
+def configure_async_vision(max_workers: int):
+    """
+    Set the number of threads awaitable vision calls run on
+
+    Calls already running finish on the previous pool.
+
+    Args:
+        max_workers: Maximum concurrent vision calls
+    """
+    global _executor
+    with _executor_lock:
+        previous, _executor = (
+            _executor,
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vision"),
+        )
+    if previous is not None:
+        previous.shutdown(wait=False, cancel_futures=False)
+
+
+async def run_vision_call(
+    func: Callable[..., Any], *args: Any, timeout: float | None = None, **kwargs: Any
+) -> Any:
+    """
+    Run a synchronous vision function on the vision thread pool
+
+    Cancelling the awaiting task (or hitting the timeout) drops the call if it has
+    not started yet; a call already running finishes in the background and its
+    result is discarded.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments for func
+        timeout: Seconds to wait for the result (no limit if None)
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        TimeoutError: If the call did not finish within the timeout
+    """
+    future = asyncio.wrap_future(_submit(func, args, kwargs))
+    return await asyncio.wait_for(future, timeout)
+
+
+def call_vision(
+    func: Callable[..., Any], *args: Any, timeout: float | None = None, **kwargs: Any
+) -> Any:
+    """
+    Run a synchronous vision function on the vision thread pool and wait for it
+
+    For worker threads that orchestrate capture, input and waits (such as agent steps
+    run with asyncio.to_thread), so their detection and OCR share the bounded pool
+    with awaitable calls. Calls made from a vision pool thread run inline.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments for func
+        timeout: Seconds to wait for the result (no limit if None)
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        TimeoutError: If the call did not finish within the timeout
+
+    Example:
+        elements = call_vision(find_elements_by_text, screenshot, "Submit")
+    """
+    if getattr(_pool_thread, "active", False):
+        return func(*args, **kwargs)
+
+    future = _submit(func, args, kwargs)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def _run_on_pool(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    _pool_thread.active = True
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _pool_thread.active = False
+
+
+def _submit(func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]) -> Future:
+    """Submit a call to the vision pool in the caller's context"""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, _run_on_pool, func, *args, **kwargs)
+    try:
+        return _get_executor().submit(call)
+    except RuntimeError:
+        # configure_async_vision shut the pool down after it was fetched
+        return _get_executor().submit(call)
+
+
+def _awaitable(func: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Async counterpart of a vision function taking an extra timeout keyword"""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, timeout: float | None = None, **kwargs: Any) -> Any:
+        return await run_vision_call(func, *args, timeout=timeout, **kwargs)
+
+    wrapper.__doc__ = (
+        f"Awaitable {func.__name__} run on the vision thread pool.\n\n"
+        "Takes the same arguments plus timeout (seconds, raises TimeoutError).\n\n"
+        f"{func.__doc__ or ''}"
+    )
+    return wrapper
+
+
+adetect_ui_elements = _awaitable(detect_ui_elements)
+adetect_ui_elements_batch = _awaitable(detect_ui_elements_batch)
+aextract_text = _awaitable(extract_text)
+aextract_text_from_region = _awaitable(extract_text_from_region)
+aextract_text_from_regions = _awaitable(extract_text_from_regions)
+aextract_text_two_stage = _awaitable(extract_text_two_stage)
+arecognize_text = _awaitable(recognize_text)
+afind_elements_by_text = _awaitable(find_elements_by_text)
+afind_clickable_elements = _awaitable(find_clickable_elements)
+aanalyze_screen_content = _awaitable(analyze_screen_content)
+averify_click_success = _awaitable(verify_click_success)
+averify_text_input = _awaitable(verify_text_input)
+averify_element_present = _awaitable(verify_element_present)
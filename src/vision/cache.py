@@ -0,0 +1,310 @@
+"""Vision Result Cache
+
+Bounded LRU cache of detection, OCR and finder results keyed by an image
+fingerprint plus call parameters, so re-analyzing an unchanged frame skips
+YOLO and PaddleOCR entirely.
+
+Result Caching: Content-hash keys, memory budget with LRU eviction, hit/miss metrics
+"""
+
+import copy
+import functools
+import inspect
+import os
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field, is_dataclass
+from typing import Any
+
+import numpy as np
+
+# Default memory budget for cached results (VISION_RESULT_CACHE_MB, 0 disables)
+DEFAULT_CACHE_MB = 32
+
+# Cache key: (namespace, image fingerprint, normalized call parameters)
+CacheKey = tuple[str, tuple, tuple]
+
+
+def image_fingerprint(image: np.ndarray) -> tuple:
+    """
+    Fast content fingerprint of an image
+
+    Args:
+        image: Input image as numpy array
+
+    Returns:
+        Hashable (shape, dtype, checksum) tuple identifying the pixel content
+    """
+    data = np.ascontiguousarray(image)
+    return (data.shape, data.dtype.str, zlib.crc32(data.data))
+
+
+@dataclass
+class _Entry:
+    """Cached value with its estimated size"""
+
+    value: Any
+    size: int
+
+
+@dataclass
+class _NamespaceStats:
+    """Hit/miss counters for one cached function"""
+
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class _CacheStats:
+    """Cache-wide counters"""
+
+    evictions: int = 0
+    namespaces: dict[str, _NamespaceStats] = field(default_factory=dict)
+
+
+class ResultCache:
+    """Thread-safe LRU cache of vision results bounded by estimated memory"""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MB * 1024 * 1024):
+        """
+        Initialize result cache
+
+        Args:
+            max_bytes: Memory budget for cached results (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = _CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (hit, result copy)
+        """
+        with self._lock:
+            counters = self._stats.namespaces.setdefault(key[0], _NamespaceStats())
+            entry = self._entries.get(key)
+            if entry is None:
+                counters.misses += 1
+                return False, None
+            counters.hits += 1
+            self._entries.move_to_end(key)
+            value = entry.value
+
+        return True, _copy_result(value)
+
+    def put(self, key: CacheKey, value: Any):
+        """
+        Store a result, evicting least recently used entries to fit the budget
+
+        Args:
+            key: Cache key
+            value: Result to cache (copied so callers may mutate their own result)
+        """
+        size = _estimate_bytes(value) + _estimate_bytes(key)
+        if size > self.max_bytes:
+            return
+
+        value = _copy_result(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+
+            while self._entries and self._bytes + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats.evictions += 1
+
+            self._entries[key] = _Entry(value, size)
+            self._bytes += size
+
+    def resize(self, max_bytes: int):
+        """Change the memory budget, evicting entries that no longer fit"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._entries and self._bytes > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats.evictions += 1
+
+    def clear(self) -> int:
+        """
+        Drop all cached results
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            hits = sum(c.hits for c in self._stats.namespaces.values())
+            misses = sum(c.misses for c in self._stats.namespaces.values())
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "evictions": self._stats.evictions,
+                "namespaces": {
+                    name: {"hits": c.hits, "misses": c.misses}
+                    for name, c in self._stats.namespaces.items()
+                },
+            }
+
+
+def _cache_bytes_from_env() -> int:
+    """Memory budget from VISION_RESULT_CACHE_MB"""
+    value = os.getenv("VISION_RESULT_CACHE_MB") or DEFAULT_CACHE_MB
+    try:
+        return int(float(value) * 1024 * 1024)
+    except (ValueError, OverflowError):
+        print(f"Invalid VISION_RESULT_CACHE_MB '{value}', using {DEFAULT_CACHE_MB} MB")
+        return DEFAULT_CACHE_MB * 1024 * 1024
+
+
+# Global result cache shared by detection, OCR and finder calls in this process
+_cache = ResultCache(_cache_bytes_from_env())
+
+
+def get_result_cache() -> ResultCache:
+    """Get the process-wide result cache"""
+    return _cache
+
+
+def configure_result_cache(max_mb: float):
+    """
+    Set the result cache memory budget
+
+    Args:
+        max_mb: Budget in megabytes (0 disables caching)
+    """
+    _cache.resize(int(max_mb * 1024 * 1024))
+
+
+def clear_result_cache() -> int:
+    """
+    Drop all cached results, e.g. after the screen is known to have changed
+
+    Returns:
+        Number of entries removed
+    """
+    return _cache.clear()
+
+
+def get_result_cache_stats() -> dict[str, Any]:
+    """Get result cache statistics"""
+    return _cache.stats()
+
+
+def cached_result(namespace: str) -> Callable:
+    """
+    Cache a function whose first argument is an image
+
+    Calls are keyed by the image fingerprint plus all other arguments (defaults
+    applied), so positional and keyword spellings of a call share one entry.
+    Exceptions are never cached.
+
+    Args:
+        namespace: Name the function's hits and misses are reported under
+
+    Example:
+        @cached_result("detect_ui_elements")
+        def detect_ui_elements(image, confidence_threshold=0.6): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _cache
+            if not cache.enabled:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            image, *params = bound.arguments.values()
+            if not isinstance(image, np.ndarray):
+                return func(*args, **kwargs)
+
+            key = (namespace, image_fingerprint(image), _freeze(params))
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _freeze(value: Any) -> Any:
+    """Convert call parameters into a hashable form"""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, set | frozenset):
+        return frozenset(value)
+    if isinstance(value, np.ndarray):
+        return image_fingerprint(value)
+    return value
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a result so cached entries are isolated from callers mutating theirs"""
+    if isinstance(value, list):
+        return [copy.copy(item) for item in value]
+    return copy.deepcopy(value)
+
+
+def _estimate_bytes(value: Any, seen: set[int] | None = None) -> int:
+    """Approximate memory held by a result, counting shared objects once"""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (value.nbytes if value.base is None else 0)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = [*value.keys(), *value.values()]
+    elif isinstance(value, list | tuple | set | frozenset):
+        items = list(value)
+    elif is_dataclass(value) or hasattr(value, "__dict__"):
+        items = list(vars(value).values())
+    else:
+        return size
+
+    return size + sum(_estimate_bytes(item, seen) for item in items)
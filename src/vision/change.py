@@ -0,0 +1,169 @@
+"""Screen Change Detection
+
+Compares screenshots through small grayscale thumbnails instead of full frames,
+so verification and polling loops spend a fraction of the time and memory of a
+full-resolution diff. Thumbnails are cached by frame content, so comparing one
+reference against many polled frames shrinks the reference only once.
+
+Change Detection: Area-averaged thumbnails, block-wise change map, changed regions
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from .cache import image_fingerprint
+from .spatial import merge_overlapping_rects
+
+# Downsampling factor per side (4 keeps 1/16 of the pixels, in one channel)
+THUMBNAIL_SCALE = 4
+
+# Thumbnail-space difference counted as a changed pixel
+CHANGE_PIXEL_THRESHOLD = 10
+
+# Changed area in full-resolution pixels below which a screen counts as unchanged.
+# A blinking caret or a clock digit stays under it on any screen size, a newly
+# shown button, label or validation message does not
+CHANGE_MIN_AREA = 256
+
+# Side of the blocks the change map is reduced to, in thumbnail pixels
+CHANGE_BLOCK_SIZE = 8
+
+# Thumbnails kept for recently compared frames
+THUMBNAIL_CACHE_SIZE = 8
+
+
+@dataclass
+class ScreenChange:
+    """Difference between two screenshots"""
+
+    score: float  # Fraction of the screen that changed (0-1)
+    mse: float  # Mean squared thumbnail difference (0 to 255**2)
+    regions: list[tuple[int, int, int, int]] = field(default_factory=list)  # Full resolution
+    area: int = 0  # Changed full-resolution pixels (estimated from the thumbnails)
+
+    @property
+    def changed(self) -> bool:
+        """Whether at least CHANGE_MIN_AREA pixels changed"""
+        return self.area >= CHANGE_MIN_AREA
+
+
+# (frame fingerprint, scale) -> thumbnail
+_thumbnails: OrderedDict[tuple[tuple, int], np.ndarray] = OrderedDict()
+_thumbnails_lock = threading.Lock()
+
+
+def screen_thumbnail(image: np.ndarray, scale: int = THUMBNAIL_SCALE) -> np.ndarray:
+    """
+    Grayscale, area-averaged thumbnail of a screenshot
+
+    Thumbnails are cached by frame content (see cache.image_fingerprint), so equal
+    frames share one thumbnail and a frame edited in place gets a new one.
+
+    Args:
+        image: Screenshot (BGR, BGRA or grayscale)
+        scale: Downsampling factor per side
+
+    Returns:
+        uint8 thumbnail of shape (height // scale, width // scale)
+    """
+    key = (image_fingerprint(image), scale)
+    with _thumbnails_lock:
+        thumbnail = _thumbnails.get(key)
+        if thumbnail is not None:
+            _thumbnails.move_to_end(key)
+            return thumbnail
+
+    height, width = image.shape[:2]
+    size = (max(1, width // scale), max(1, height // scale))
+    thumbnail = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    if thumbnail.ndim == 3:
+        code = cv2.COLOR_BGRA2GRAY if thumbnail.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        thumbnail = cv2.cvtColor(thumbnail, code)
+
+    with _thumbnails_lock:
+        _thumbnails[key] = thumbnail
+        while len(_thumbnails) > THUMBNAIL_CACHE_SIZE:
+            _thumbnails.popitem(last=False)
+    return thumbnail
+
+
+def detect_screen_change(
+    before: np.ndarray,
+    after: np.ndarray,
+    pixel_threshold: int = CHANGE_PIXEL_THRESHOLD,
+    block_size: int = CHANGE_BLOCK_SIZE,
+    scale: int = THUMBNAIL_SCALE,
+) -> ScreenChange:
+    """
+    Measure how much and where the screen changed between two screenshots
+
+    Args:
+        before: Earlier screenshot
+        after: Later screenshot
+        pixel_threshold: Minimum thumbnail difference counted as a change
+        block_size: Side of the blocks changes are grouped into, in thumbnail pixels
+        scale: Downsampling factor per side
+
+    Returns:
+        ScreenChange with the changed fraction, thumbnail MSE and changed regions
+    """
+    height, width = after.shape[:2]
+    if before.shape != after.shape:
+        return ScreenChange(1.0, float(255**2), [(0, 0, width, height)], width * height)
+
+    diff = cv2.absdiff(screen_thumbnail(before, scale), screen_thumbnail(after, scale))
+    changed = diff > pixel_threshold
+    changed_pixels = int(np.count_nonzero(changed))
+    score = changed_pixels / changed.size
+    mse = float(np.mean(np.square(diff, dtype=np.float32)))
+    if not changed_pixels:
+        return ScreenChange(0.0, mse)
+
+    # Thumbnails drop a partial last row and column, so edge regions extend over them
+    thumb_height, thumb_width = changed.shape
+    regions = [
+        (
+            x1 * scale,
+            y1 * scale,
+            width if x2 >= thumb_width else x2 * scale,
+            height if y2 >= thumb_height else y2 * scale,
+        )
+        for x1, y1, x2, y2 in changed_block_regions(changed, block_size)
+    ]
+    return ScreenChange(score, mse, merge_overlapping_rects(regions), changed_pixels * scale**2)
+
+
+def changed_block_regions(changed: np.ndarray, block_size: int) -> list[tuple[int, int, int, int]]:
+    """
+    Group a boolean change mask into block-aligned rectangles
+
+    Args:
+        changed: 2D boolean mask of changed pixels
+        block_size: Side of the blocks the mask is reduced to
+
+    Returns:
+        Rectangles (x1, y1, x2, y2) in mask coordinates, one per connected group
+        of changed blocks, clipped to the mask
+    """
+    height, width = changed.shape
+    rows, cols = -(-height // block_size), -(-width // block_size)
+    padded = np.zeros((rows * block_size, cols * block_size), dtype=bool)
+    padded[:height, :width] = changed
+    blocks = padded.reshape(rows, block_size, cols, block_size).any(axis=(1, 3))
+
+    count, _, block_stats, _ = cv2.connectedComponentsWithStats(
+        blocks.astype(np.uint8), connectivity=8
+    )
+    return [
+        (
+            int(left) * block_size,
+            int(top) * block_size,
+            min(width, int(left + block_width) * block_size),
+            min(height, int(top + block_height) * block_size),
+        )
+        for left, top, block_width, block_height, _ in block_stats[1:count]
+    ]
@@ -11,7 +11,11 @@ from pathlib import Path
 
 import cv2
 import numpy as np
-import onnxruntime as ort
+
+from .cache import cached_result
+from .nms import non_max_suppression
+from .preprocess import LetterboxBuffer, LetterboxTransform, get_tile_rects
+from .sessions import get_session
 
 
 @dataclass
@@ -124,12 +128,29 @@ FULL_COCO_CLASSES = {
 }
 
 
+# Detector model files selectable by variant name
+MODEL_VARIANTS = {
+    "fp32": "yolov8s.onnx",
+    "int8": "yolov8s.int8.onnx",  # Produced by setup_models.setup_quantized_yolo_model()
+}
+
+# Highest scoring candidates per frame considered by NMS (YOLOv8 emits 8400 anchors)
+NMS_TOP_K = 300
+
+
+@cached_result("detect_ui_elements")
 def detect_ui_elements(
     image: np.ndarray,
     confidence_threshold: float = 0.6,
     model_path: str | None = None,
     ui_focused: bool = True,
     max_detections: int = 100,
+    model_variant: str = "fp32",
+    regions: list[tuple[int, int, int, int]] | None = None,
+    tiled: bool = False,
+    tile_size: int | None = None,
+    tile_overlap: int | None = None,
+    nms_top_k: int | None = NMS_TOP_K,
 ) -> list[Detection]:
     """
     Detect UI elements in image using YOLO
@@ -140,6 +161,15 @@ def detect_ui_elements(
         model_path: Path to YOLO ONNX model (uses default if None)
         ui_focused: If True, filter to UI-relevant classes only
         max_detections: Maximum number of detections to return
+        model_variant: Default model to use when model_path is None ("fp32" or "int8")
+        regions: Only detect inside these (x1, y1, x2, y2) rectangles. Each region is
+            run at full model resolution and boxes are returned in full-image coordinates
+        tiled: Split large frames into overlapping tiles (plus one full-frame pass for
+            large elements) batched through the model, merged with cross-tile NMS
+        tile_size: Tile side in pixels (adapts to the image resolution if None)
+        tile_overlap: Overlap between tiles in pixels (adapts to tile_size if None)
+        nms_top_k: Only the nms_top_k most confident candidates per frame enter NMS
+            (all candidates if None)
 
     Returns:
         List of Detection objects sorted by confidence
@@ -149,190 +179,339 @@ def detect_ui_elements(
         detections = detect_ui_elements(image, confidence_threshold=0.7)
         for det in detections:
             print(f"Found {det.class_name} at {det.center} with confidence {det.confidence}")
+
+        # Only look at the taskbar
+        height, width = image.shape[:2]
+        taskbar = detect_ui_elements(image, regions=[(0, height - 60, width, height)])
+
+        # Small buttons on a 4K or multi-monitor capture
+        detections = detect_ui_elements(image, tiled=True)
+    """
+    if regions is not None and tiled:
+        raise ValueError("regions and tiled detection cannot be combined")
+
+    if tiled:
+        height, width = image.shape[:2]
+        tiles = get_tile_rects(image.shape, tile_size=tile_size, overlap=tile_overlap)
+        if len(tiles) > 1:
+            return _detect_in_crops(
+                image,
+                [*tiles, (0, 0, width, height)],
+                confidence_threshold=confidence_threshold,
+                model_path=model_path,
+                ui_focused=ui_focused,
+                max_detections=max_detections,
+                model_variant=model_variant,
+                nms_top_k=nms_top_k,
+                match_metric="ios",
+            )
+
+    if regions is not None:
+        return _detect_in_crops(
+            image,
+            regions,
+            confidence_threshold=confidence_threshold,
+            model_path=model_path,
+            ui_focused=ui_focused,
+            max_detections=max_detections,
+            model_variant=model_variant,
+            nms_top_k=nms_top_k,
+        )
+
+    return detect_ui_elements_batch(
+        [image],
+        confidence_threshold=confidence_threshold,
+        model_path=model_path,
+        ui_focused=ui_focused,
+        max_detections=max_detections,
+        model_variant=model_variant,
+        nms_top_k=nms_top_k,
+    )[0]
+
+
+def detect_ui_elements_batch(
+    images: list[np.ndarray],
+    confidence_threshold: float = 0.6,
+    model_path: str | None = None,
+    ui_focused: bool = True,
+    max_detections: int = 100,
+    max_batch_size: int = 8,
+    model_variant: str = "fp32",
+    nms_top_k: int | None = NMS_TOP_K,
+) -> list[list[Detection]]:
+    """
+    Detect UI elements in several images with batched YOLO inference
+
+    Frames are stacked into a single ONNX run when the model has a dynamic batch
+    axis (up to max_batch_size per run), otherwise they are run in micro-batches
+    matching the model's fixed batch size.
+
+    Args:
+        images: Input images as numpy arrays (BGR format from cv2)
+        confidence_threshold: Minimum confidence for detections (0.0-1.0)
+        model_path: Path to YOLO ONNX model (uses default if None)
+        ui_focused: If True, filter to UI-relevant classes only
+        max_detections: Maximum number of detections to return per image
+        max_batch_size: Maximum frames per inference run for dynamic-batch models
+        model_variant: Default model to use when model_path is None ("fp32" or "int8")
+        nms_top_k: Only the nms_top_k most confident candidates per frame enter NMS
+            (all candidates if None)
+
+    Returns:
+        One list of Detection objects per input image, each sorted by confidence
+
+    Example:
+        before_elements, after_elements = detect_ui_elements_batch([before, after])
     """
     # Get model path
     if model_path is None:
-        model_path = _get_default_model_path()
+        model_path = _get_default_model_path(model_variant)
 
     if not os.path.exists(model_path):
         raise FileNotFoundError(
             f"YOLO model not found at {model_path}. Run setup_models() to download the model."
         )
 
+    if not images:
+        return []
+
     # Choose class set
     classes = UI_FOCUSED_CLASSES if ui_focused else FULL_COCO_CLASSES
 
-    # Initialize ONNX session
-    session = ort.InferenceSession(model_path)
-    input_name = session.get_inputs()[0].name
-    input_shape = session.get_inputs()[0].shape
-    input_height, input_width = input_shape[2], input_shape[3]
-
-    # Preprocess image
-    processed_image = _preprocess_image(image, input_width, input_height)
-
-    # Run inference
-    outputs = session.run(None, {input_name: processed_image})
-
-    # Postprocess results
-    detections = _postprocess_outputs(
-        outputs,
-        image.shape[:2],  # original height, width
-        input_width,
-        input_height,
-        classes,
-        confidence_threshold,
-    )
-
-    # Sort by confidence and limit results
-    detections.sort(key=lambda x: x.confidence, reverse=True)
-    return detections[:max_detections]
-
-
-def _get_default_model_path() -> str:
-    """Get default YOLO model path"""
-    current_dir = Path(__file__).parent
-    models_dir = current_dir / "models"
-    return str(models_dir / "yolov8s.onnx")
+    # Get shared ONNX session (loaded once per process)
+    entry = get_session(model_path)
+    input_width, input_height = _get_input_size(entry.input_shape)
+    batch_size, dynamic_batch = _get_batch_size(entry.input_shape, max_batch_size)
 
+    # Letterbox into this session's reusable input tensor
+    buffer = _get_input_buffer(entry.local, input_width, input_height, batch_size)
 
-def _preprocess_image(image: np.ndarray, target_width: int, target_height: int) -> np.ndarray:
-    """Preprocess image for YOLO inference"""
-    # Resize image
-    resized = cv2.resize(image, (target_width, target_height))
+    results = []
+    for start in range(0, len(images), batch_size):
+        chunk = images[start : start + batch_size]
+        transforms = [buffer.fill(image, index) for index, image in enumerate(chunk)]
 
-    # Convert BGR to RGB
-    rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+        # Run inference (fixed-batch models always receive a full batch)
+        run_size = len(chunk) if dynamic_batch else batch_size
+        outputs = entry.session.run(None, {entry.input_name: buffer.batch(run_size)})
 
-    # Normalize to [0, 1] and convert to float32
-    normalized = rgb.astype(np.float32) / 255.0
+        # Postprocess results per frame
+        for index, transform in enumerate(transforms):
+            detections = _postprocess_outputs(
+                [outputs[0][index : index + 1]],
+                transform,
+                classes,
+                confidence_threshold,
+                top_k=nms_top_k,
+                max_output=max_detections,
+            )
+            results.append(detections)
 
-    # Transpose to CHW format and add batch dimension
-    input_tensor = normalized.transpose(2, 0, 1)[np.newaxis, ...]
+    return results
 
-    return input_tensor
 
-
-def _postprocess_outputs(
-    outputs: list[np.ndarray],
-    original_shape: tuple[int, int],
-    input_width: int,
-    input_height: int,
-    classes: dict,
-    confidence_threshold: float,
+def _detect_in_crops(
+    image: np.ndarray,
+    rects: list[tuple[int, int, int, int]],
+    max_detections: int = 100,
+    match_metric: str = "iou",
+    **detect_kwargs,
 ) -> list[Detection]:
-    """Postprocess YOLO outputs to detections"""
-    predictions = outputs[0]  # Shape: [1, 84, 8400] for YOLOv8s
-
-    # Transpose to [8400, 84]
-    predictions = predictions.transpose(0, 2, 1)[0]
-
-    detections = []
-    orig_h, orig_w = original_shape
-
-    for pred in predictions:
-        # Extract box coordinates and confidence
-        x_center, y_center, width, height = pred[0:4]
-        confidence = pred[4]
-        class_scores = pred[5:]
+    """Detect inside image crops in one batch and merge boxes in full-image coordinates"""
+    height, width = image.shape[:2]
+
+    # Clip rectangles to the image and drop empty ones
+    crops = []
+    for x1, y1, x2, y2 in rects:
+        x1, x2 = max(0, min(x1, width)), max(0, min(x2, width))
+        y1, y2 = max(0, min(y1, height)), max(0, min(y2, height))
+        if x2 > x1 and y2 > y1:
+            crops.append((x1, y1, x2, y2))
+
+    if not crops:
+        return []
+
+    crop_results = detect_ui_elements_batch(
+        [image[y1:y2, x1:x2] for x1, y1, x2, y2 in crops],
+        max_detections=max_detections,
+        **detect_kwargs,
+    )
 
-        if confidence < confidence_threshold:
-            continue
+    detections = [
+        _offset_detection(detection, x1, y1)
+        for (x1, y1, _, _), crop_detections in zip(crops, crop_results, strict=True)
+        for detection in crop_detections
+    ]
 
-        # Get class with highest score
-        class_id = np.argmax(class_scores)
-        class_confidence = class_scores[class_id] * confidence
+    # Overlapping crops can see the same element twice
+    detections = _merge_detections(detections, iou_threshold=0.5, match_metric=match_metric)
+    return detections[:max_detections]
 
-        if class_confidence < confidence_threshold:
-            continue
 
-        # Skip classes not in our active set
-        if class_id not in classes:
-            continue
+def _offset_detection(detection: Detection, dx: int, dy: int) -> Detection:
+    """Shift a crop-relative detection into full-image coordinates"""
+    x1, y1, x2, y2 = detection.bbox
+    return Detection(
+        class_name=detection.class_name,
+        confidence=detection.confidence,
+        bbox=(x1 + dx, y1 + dy, x2 + dx, y2 + dy),
+        center=(detection.center[0] + dx, detection.center[1] + dy),
+        area=detection.area,
+    )
 
-        # Convert to original image coordinates
-        x_center *= orig_w / input_width
-        y_center *= orig_h / input_height
-        width *= orig_w / input_width
-        height *= orig_h / input_height
 
-        # Convert to bbox format
-        x1 = int(x_center - width / 2)
-        y1 = int(y_center - height / 2)
-        x2 = int(x_center + width / 2)
-        y2 = int(y_center + height / 2)
+def _merge_detections(
+    detections: list[Detection], iou_threshold: float, match_metric: str = "iou"
+) -> list[Detection]:
+    """Suppress duplicate detections, returning the kept ones by descending confidence"""
+    if not detections:
+        return []
+
+    # Intersection over smaller box folds tile-truncated partial boxes into whole ones,
+    # so it is applied per class to keep e.g. a clock inside a laptop screen
+    class_ids = None
+    if match_metric == "ios":
+        class_index: dict[str, int] = {}
+        class_ids = np.array(
+            [class_index.setdefault(d.class_name, len(class_index)) for d in detections],
+            dtype=np.int64,
+        )
 
-        # Ensure bbox is within image bounds
-        x1 = max(0, min(x1, orig_w))
-        y1 = max(0, min(y1, orig_h))
-        x2 = max(0, min(x2, orig_w))
-        y2 = max(0, min(y2, orig_h))
+    keep = non_max_suppression(
+        np.array([d.bbox for d in detections], dtype=np.float32),
+        np.array([d.confidence for d in detections], dtype=np.float32),
+        iou_threshold=iou_threshold,
+        class_ids=class_ids,
+        match_metric=match_metric,
+    )
+    return [detections[index] for index in keep.tolist()]
 
-        # Calculate area
-        area = (x2 - x1) * (y2 - y1)
 
-        detection = Detection(
-            class_name=classes.get(class_id, f"class_{class_id}"),
-            confidence=float(class_confidence),
-            bbox=(x1, y1, x2, y2),
-            center=(int(x_center), int(y_center)),
-            area=area,
+def _get_default_model_path(model_variant: str = "fp32") -> str:
+    """Get default YOLO model path for a model variant"""
+    if model_variant not in MODEL_VARIANTS:
+        raise ValueError(
+            f"Unknown model variant '{model_variant}'. Choose from: {', '.join(MODEL_VARIANTS)}"
         )
 
-        detections.append(detection)
+    current_dir = Path(__file__).parent
+    models_dir = current_dir / "models"
+    return str(models_dir / MODEL_VARIANTS[model_variant])
 
-    # Apply Non-Maximum Suppression
-    detections = _apply_nms(detections, iou_threshold=0.5)
 
-    return detections
+def _get_input_size(input_shape: list) -> tuple[int, int]:
+    """Get model input (width, height), defaulting dynamic axes to 640"""
+    height, width = input_shape[2], input_shape[3]
+    return (
+        width if isinstance(width, int) else 640,
+        height if isinstance(height, int) else 640,
+    )
 
 
-def _apply_nms(detections: list[Detection], iou_threshold: float) -> list[Detection]:
-    """Apply Non-Maximum Suppression"""
-    if not detections:
-        return detections
+def _get_batch_size(input_shape: list, max_batch_size: int) -> tuple[int, bool]:
+    """Get frames per inference run and whether the batch axis is dynamic"""
+    batch = input_shape[0]
+    if isinstance(batch, int) and batch > 0:
+        return batch, False
+    return max(1, max_batch_size), True
 
-    # Sort by confidence
-    detections.sort(key=lambda x: x.confidence, reverse=True)
 
-    filtered_detections = []
+def _get_input_buffer(
+    local, input_width: int, input_height: int, batch_size: int = 1
+) -> LetterboxBuffer:
+    """Get the calling thread's reusable input buffer for a session"""
+    buffer = getattr(local, "letterbox", None)
+    if (
+        buffer is None
+        or (buffer.target_width, buffer.target_height) != (input_width, input_height)
+        or buffer.tensor.shape[0] < batch_size
+    ):
+        buffer = local.letterbox = LetterboxBuffer(input_width, input_height, batch_size)
+    return buffer
 
-    for detection in detections:
-        # Check if this detection overlaps significantly with any kept detection
-        keep = True
-        for kept_detection in filtered_detections:
-            if _calculate_iou(detection.bbox, kept_detection.bbox) > iou_threshold:
-                keep = False
-                break
 
-        if keep:
-            filtered_detections.append(detection)
+def _postprocess_outputs(
+    outputs: list[np.ndarray],
+    transform: LetterboxTransform,
+    classes: dict,
+    confidence_threshold: float,
+    top_k: int | None = NMS_TOP_K,
+    max_output: int | None = None,
+) -> list[Detection]:
+    """Postprocess YOLO outputs to detections, most confident first"""
+    predictions = outputs[0][0]  # Shape: [84, 8400] for YOLOv8s
+
+    # Per-anchor best class and its score, computed over the whole matrix at once
+    class_scores = _get_class_scores(predictions)
+    class_ids = class_scores.argmax(axis=0)
+    confidences = class_scores[class_ids, np.arange(class_scores.shape[1])]
+
+    # Threshold and filter to the active class set in one pass
+    allowed = _get_class_mask(classes, class_scores.shape[0])
+    keep = (confidences >= confidence_threshold) & allowed[class_ids]
+    if not keep.any():
+        return []
+
+    class_ids = class_ids[keep]
+    confidences = confidences[keep]
+
+    # Undo the letterbox to get center/size boxes in original image coordinates
+    orig_w, orig_h = transform.original_width, transform.original_height
+    centers = transform.points_to_original(predictions[0:2, keep].T)
+    half_sizes = transform.sizes_to_original(predictions[2:4, keep].T) / 2
+
+    corners = np.hstack([centers - half_sizes, centers + half_sizes]).astype(np.int64)
+    boxes = np.clip(corners, 0, [orig_w, orig_h, orig_w, orig_h])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    centers = centers.astype(np.int64)
+
+    # Apply Non-Maximum Suppression and build detections for the kept boxes only
+    kept_indices = non_max_suppression(
+        boxes, confidences, iou_threshold=0.5, top_k=top_k, max_output=max_output
+    )
 
-    return filtered_detections
+    return [
+        Detection(
+            class_name=classes.get(class_id, f"class_{class_id}"),
+            confidence=confidence,
+            bbox=tuple(box),
+            center=tuple(center),
+            area=area,
+        )
+        for class_id, confidence, box, center, area in zip(
+            class_ids[kept_indices].tolist(),
+            confidences[kept_indices].tolist(),
+            boxes[kept_indices].tolist(),
+            centers[kept_indices].tolist(),
+            areas[kept_indices].tolist(),
+            strict=True,
+        )
+    ]
 
 
-def _calculate_iou(box1: tuple[int, int, int, int], box2: tuple[int, int, int, int]) -> float:
-    """Calculate Intersection over Union"""
-    x1_1, y1_1, x2_1, y2_1 = box1
-    x1_2, y1_2, x2_2, y2_2 = box2
+def _get_class_scores(predictions: np.ndarray) -> np.ndarray:
+    """Get per-class confidence scores as a [num_classes, num_anchors] matrix"""
+    # YOLOv8 heads emit 4 box rows followed directly by class scores
+    if predictions.shape[0] == 4 + len(FULL_COCO_CLASSES):
+        return predictions[4:]
 
-    # Calculate intersection area
-    x1_i = max(x1_1, x1_2)
-    y1_i = max(y1_1, y1_2)
-    x2_i = min(x2_1, x2_2)
-    y2_i = min(y2_1, y2_2)
+    # Objectness-style heads (YOLOv5) scale class scores by row 4
+    return predictions[5:] * predictions[4]
 
-    if x2_i <= x1_i or y2_i <= y1_i:
-        return 0.0
 
-    intersection_area = (x2_i - x1_i) * (y2_i - y1_i)
+# Boolean masks of allowed class ids, keyed by class set and number of classes
+_class_masks: dict[tuple[tuple[int, ...], int], np.ndarray] = {}
 
-    # Calculate union area
-    area1 = (x2_1 - x1_1) * (y2_1 - y1_1)
-    area2 = (x2_2 - x1_2) * (y2_2 - y1_2)
-    union_area = area1 + area2 - intersection_area
 
-    return intersection_area / union_area if union_area > 0 else 0.0
+def _get_class_mask(classes: dict, num_classes: int) -> np.ndarray:
+    """Get a precomputed boolean mask of allowed class ids"""
+    key = (tuple(sorted(classes)), num_classes)
+    mask = _class_masks.get(key)
+    if mask is None:
+        mask = np.zeros(num_classes, dtype=bool)
+        mask[[class_id for class_id in classes if class_id < num_classes]] = True
+        _class_masks[key] = mask
+    return mask
 
 
 def draw_detections(image: np.ndarray, detections: list[Detection]) -> np.ndarray:
@@ -1,18 +1,29 @@
 """Combined YOLO+OCR Search and Analysis Functions
 
 Combines YOLO detection and PaddleOCR to provide intelligent UI element finding
-and screen analysis capabilities.
+and screen analysis capabilities. A ScreenIndex analyzes a screenshot once and
+answers any number of queries; the module functions are thin wrappers over it.
 
 Element Finding: Combines detection and OCR to locate UI elements by text
 """
 
-import math
+import copy
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 
 import numpy as np
 
+from .cache import cached_result
 from .detector import Detection, detect_ui_elements
-from .reader import TextResult, extract_text
+from .reader import TextResult, extract_text, recognize_text
+from .spatial import SpatialIndex
+from .text_index import TextIndex
 
 
 @dataclass
@@ -49,12 +60,394 @@ class ScreenAnalysis:
     query: str
 
 
+# Visual classes and text terms that indicate a clickable element
+CLICKABLE_VISUAL_CLASSES = {"laptop", "mouse", "remote", "keyboard", "cell phone", "book"}
+
+CLICKABLE_TEXT_TERMS = {
+    "button",
+    "click",
+    "submit",
+    "ok",
+    "cancel",
+    "close",
+    "save",
+    "open",
+    "login",
+    "sign",
+    "next",
+    "back",
+    "menu",
+    "settings",
+}
+
+
+# Default detection stages overlapped with OCR at once (VISION_FINDER_CONCURRENCY
+# overrides, 0 runs the stages one after the other)
+DEFAULT_FINDER_CONCURRENCY = min(4, os.cpu_count() or 1)
+
+_stage_executor: ThreadPoolExecutor | None = None
+_stage_concurrency: int | None = None
+_stage_lock = threading.RLock()
+
+
+def configure_finder_concurrency(max_workers: int):
+    """
+    Set how many detection stages may run alongside OCR at once
+
+    Args:
+        max_workers: Concurrent background detection stages (0 disables overlap)
+    """
+    global _stage_executor, _stage_concurrency
+    with _stage_lock:
+        previous, _stage_executor, _stage_concurrency = _stage_executor, None, max_workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def _get_stage_executor() -> ThreadPoolExecutor | None:
+    """Shared executor for detection stages, None when overlap is disabled"""
+    global _stage_executor, _stage_concurrency
+    with _stage_lock:
+        if _stage_concurrency is None:
+            value = os.getenv("VISION_FINDER_CONCURRENCY")
+            _stage_concurrency = int(value) if value else DEFAULT_FINDER_CONCURRENCY
+        if _stage_concurrency <= 0:
+            return None
+        if _stage_executor is None:
+            _stage_executor = ThreadPoolExecutor(
+                max_workers=_stage_concurrency, thread_name_prefix="finder-detect"
+            )
+        return _stage_executor
+
+
+def _submit_stage(func: Callable[[], Any]) -> Future | None:
+    """
+    Start a detection stage on the shared executor, None when overlap is disabled
+
+    Submitting under the lock keeps configure_finder_concurrency from shutting the
+    executor down between fetching and submitting to it.
+    """
+    with _stage_lock:
+        executor = _get_stage_executor()
+        return None if executor is None else executor.submit(func)
+
+
+class ScreenIndex:
+    """
+    Analysis context for one screenshot
+
+    YOLO detection and OCR run lazily, at most once each, and any number of text,
+    clickable, near-point and region queries are then answered from memory. When
+    both are needed they run concurrently; per-stage seconds are kept in timings.
+
+    Example:
+        screen = ScreenIndex(image)
+        username = screen.find_text("username")
+        password = screen.find_text("password")
+        buttons = screen.find_clickable()
+    """
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        confidence_threshold: float = 0.6,
+        language: str = "en",
+        text_results: list[TextResult] | None = None,
+    ):
+        """
+        Initialize screen index
+
+        Args:
+            image: Input image (BGR format from cv2)
+            confidence_threshold: Minimum confidence for detections and text
+            language: OCR language code
+            text_results: OCR results already read from this image (e.g. by
+                IncrementalOCR), used instead of running OCR. Results below the
+                confidence threshold are dropped
+        """
+        self.image = image
+        self.confidence_threshold = confidence_threshold
+        self.language = language
+        self.timings: dict[str, float] = {}
+
+        if text_results is not None:
+            self.__dict__["text_results"] = [
+                result for result in text_results if result.confidence >= confidence_threshold
+            ]
+
+    @functools.cached_property
+    def detections(self) -> list[Detection]:
+        """YOLO detections, computed on first access"""
+        return self._run_detection()
+
+    @functools.cached_property
+    def text_results(self) -> list[TextResult]:
+        """OCR results, computed on first access"""
+        return self._run_ocr()
+
+    @functools.cached_property
+    def elements(self) -> list[UIElement]:
+        """All UI elements with nearby detections and text combined"""
+        self.run_models()
+        return _build_ui_elements(self.detections, self.text_results)
+
+    def run_models(self):
+        """
+        Compute detections and OCR results that are still missing
+
+        If both are missing, detection runs on the shared finder executor while OCR
+        runs in the calling thread, so the wait is about the slower of the two.
+        """
+        missing_detections = "detections" not in self.__dict__
+        missing_text = "text_results" not in self.__dict__
+
+        start_time = time.perf_counter()
+        detection_future = (
+            _submit_stage(self._run_detection) if missing_detections and missing_text else None
+        )
+        if detection_future is None:
+            _ = self.detections, self.text_results
+            return
+
+        self.__dict__["text_results"] = self._run_ocr()
+        self.__dict__["detections"] = detection_future.result()
+        self.timings["models"] = time.perf_counter() - start_time
+
+    def _run_detection(self) -> list[Detection]:
+        start_time = time.perf_counter()
+        detections = detect_ui_elements(self.image, confidence_threshold=self.confidence_threshold)
+        self.timings["detection"] = time.perf_counter() - start_time
+        return detections
+
+    def _run_ocr(self) -> list[TextResult]:
+        start_time = time.perf_counter()
+        text_results = extract_text(
+            self.image, language=self.language, confidence_threshold=self.confidence_threshold
+        )
+        self.timings["ocr"] = time.perf_counter() - start_time
+        return text_results
+
+    @functools.cached_property
+    def text_index(self) -> TextIndex:
+        """Text search index over OCR results"""
+        return TextIndex(self.text_results)
+
+    @functools.cached_property
+    def detection_index(self) -> SpatialIndex:
+        """Spatial index over YOLO detections"""
+        return _build_spatial_index(self.detections)
+
+    @functools.cached_property
+    def element_index(self) -> SpatialIndex:
+        """Spatial index over combined UI elements"""
+        return _build_spatial_index(self.elements)
+
+    def find_text(
+        self,
+        text_query: str,
+        search_radius: int = 100,
+        case_sensitive: bool = False,
+        fuzzy: bool = False,
+    ) -> list[UIElement]:
+        """
+        Find UI elements that contain or are near specific text
+
+        Args:
+            text_query: Text to search for
+            search_radius: Radius to search for nearby visual elements
+            case_sensitive: Whether text search is case sensitive
+            fuzzy: Also match text within a few OCR errors of the query
+
+        Returns:
+            List of UIElement objects that match the text query, best matches first
+        """
+        # Find matching text (exact, then prefix, then substring, then fuzzy)
+        matches = self.text_index.search(
+            text_query, mode="fuzzy" if fuzzy else "substring", case_sensitive=case_sensitive
+        )
+        matching_text = [match.result for match in matches]
+
+        if not matching_text:
+            return []
+
+        # Visual detections are only needed once some text matched
+        visual_detections = self.detections
+        detection_index = self.detection_index
+
+        elements = []
+
+        for text_result in matching_text:
+            # Create text element
+            text_element = UIElement(
+                element_type="text",
+                bbox=text_result.rect_bbox,
+                center=text_result.center,
+                confidence=text_result.confidence,
+                area=text_result.area,
+                text_detection=text_result,
+                text=text_result.text,
+                description=f"Text: '{text_result.text}'",
+            )
+
+            # Look for the closest visual element within the search radius
+            nearest, _ = detection_index.nearest(
+                text_result.center, k=1, max_distance=search_radius
+            )
+            nearby_visual = visual_detections[nearest[0]] if len(nearest) else None
+
+            if nearby_visual:
+                # Create combined element
+                combined_bbox = _merge_bboxes(text_result.rect_bbox, nearby_visual.bbox)
+                combined_center = (
+                    (text_result.center[0] + nearby_visual.center[0]) // 2,
+                    (text_result.center[1] + nearby_visual.center[1]) // 2,
+                )
+                combined_area = (combined_bbox[2] - combined_bbox[0]) * (
+                    combined_bbox[3] - combined_bbox[1]
+                )
+
+                combined_element = UIElement(
+                    element_type="combined",
+                    bbox=combined_bbox,
+                    center=combined_center,
+                    confidence=(text_result.confidence + nearby_visual.confidence) / 2,
+                    area=combined_area,
+                    visual_detection=nearby_visual,
+                    text_detection=text_result,
+                    text=text_result.text,
+                    description=f"{nearby_visual.class_name}: '{text_result.text}'",
+                )
+                elements.append(combined_element)
+            else:
+                elements.append(text_element)
+
+        return elements
+
+    def find_clickable(self) -> list[UIElement]:
+        """
+        Find elements that are likely to be clickable
+
+        Returns:
+            List of potentially clickable UIElement objects
+        """
+        return [copy.copy(element) for element in self.elements if _is_clickable(element)]
+
+    def find_near_point(self, point: tuple[int, int], radius: int = 50) -> list[UIElement]:
+        """
+        Find UI elements near a specific point
+
+        Args:
+            point: Center point (x, y)
+            radius: Search radius in pixels
+
+        Returns:
+            List of nearby UIElement objects sorted by distance
+        """
+        indices, distances = self.element_index.within_radius(point, radius)
+
+        nearby_elements = []
+        for index, distance in zip(indices.tolist(), distances.tolist(), strict=True):
+            # Add distance info (on a copy, the index is shared)
+            element = copy.copy(self.elements[index])
+            element.distance = distance  # type: ignore
+            nearby_elements.append(element)
+
+        return nearby_elements
+
+    def find_in_region(
+        self, region: tuple[int, int, int, int], fully_inside: bool = False
+    ) -> list[UIElement]:
+        """
+        Find UI elements inside a region
+
+        Args:
+            region: Region coordinates (x1, y1, x2, y2)
+            fully_inside: If True, only elements entirely inside the region; otherwise
+                elements whose center lies in the region
+
+        Returns:
+            List of UIElement objects in the region
+        """
+        if fully_inside:
+            indices = self.element_index.contained_in(region)
+        else:
+            indices = self.element_index.centers_in(region)
+
+        return [copy.copy(self.elements[index]) for index in indices.tolist()]
+
+    def reread_text(self, elements: list[UIElement]) -> list[TextResult | None]:
+        """
+        Re-read the text of known elements with the recognition model only
+
+        Reads each element's OCR text box (or its bbox if it has no text) in this
+        screenshot without running detection or full-frame OCR, e.g. to check a
+        label found on an earlier frame.
+
+        Args:
+            elements: Elements whose boxes hold a single line of text
+
+        Returns:
+            One TextResult per element, or None where no text was read
+        """
+        boxes = [
+            element.text_detection.bbox if element.text_detection else element.bbox
+            for element in elements
+        ]
+        return recognize_text(
+            self.image,
+            boxes,
+            language=self.language,
+            confidence_threshold=self.confidence_threshold,
+        )
+
+    def analyze(self, query: str) -> ScreenAnalysis:
+        """
+        Comprehensive screen analysis with natural language query
+
+        Args:
+            query: Natural language description of what to analyze
+
+        Returns:
+            ScreenAnalysis object with comprehensive results
+        """
+        all_elements = [copy.copy(element) for element in self.elements]
+
+        # Separate by type
+        visual_elements = [e for e in all_elements if e.element_type in ["visual", "combined"]]
+        text_elements = [e for e in all_elements if e.element_type in ["text", "combined"]]
+        clickable_elements = [e for e in all_elements if _is_clickable(e)]
+
+        # Create summary
+        summary = {
+            "total_elements": len(all_elements),
+            "visual_elements": len(visual_elements),
+            "text_elements": len(text_elements),
+            "clickable_elements": len(clickable_elements),
+            "unique_text_content": len({e.text for e in text_elements if e.text}),
+            "visual_classes": list(
+                {e.visual_detection.class_name for e in visual_elements if e.visual_detection}
+            ),
+            "timings": dict(self.timings),
+        }
+
+        return ScreenAnalysis(
+            ui_elements=all_elements,
+            text_elements=text_elements,
+            visual_elements=visual_elements,
+            clickable_elements=clickable_elements,
+            summary=summary,
+            query=query,
+        )
+
+
+@cached_result("find_elements_by_text")
 def find_elements_by_text(
     image: np.ndarray,
     text_query: str,
     confidence_threshold: float = 0.6,
     search_radius: int = 100,
     case_sensitive: bool = False,
+    fuzzy: bool = False,
 ) -> list[UIElement]:
     """
     Find UI elements that contain or are near specific text
@@ -65,6 +458,7 @@ def find_elements_by_text(
         confidence_threshold: Minimum confidence for detections
         search_radius: Radius to search for nearby visual elements
         case_sensitive: Whether text search is case sensitive
+        fuzzy: Also match text within a few OCR errors (e.g. "Subrnit" for "Submit")
 
     Returns:
         List of UIElement objects that match the text query
@@ -75,84 +469,16 @@ def find_elements_by_text(
 
         # Find username input fields
         username_fields = find_elements_by_text(image, "username", case_sensitive=False)
-    """
-    # Get text detections
-    text_results = extract_text(image, confidence_threshold=confidence_threshold)
-
-    # Find matching text
-    query = text_query.strip()
-    if not case_sensitive:
-        query = query.lower()
-
-    matching_text = []
-    for text_result in text_results:
-        detected_text = text_result.text.strip()
-        if not case_sensitive:
-            detected_text = detected_text.lower()
 
-        if query in detected_text:
-            matching_text.append(text_result)
-
-    if not matching_text:
-        return []
-
-    # Get visual detections
-    visual_detections = detect_ui_elements(image, confidence_threshold=confidence_threshold)
-
-    elements = []
-
-    for text_result in matching_text:
-        # Create text element
-        text_element = UIElement(
-            element_type="text",
-            bbox=text_result.rect_bbox,
-            center=text_result.center,
-            confidence=text_result.confidence,
-            area=text_result.area,
-            text_detection=text_result,
-            text=text_result.text,
-            description=f"Text: '{text_result.text}'",
-        )
-
-        # Look for nearby visual elements
-        nearby_visual = None
-        min_distance = float("inf")
-
-        for visual_det in visual_detections:
-            distance = _calculate_distance(text_result.center, visual_det.center)
-            if distance <= search_radius and distance < min_distance:
-                min_distance = distance
-                nearby_visual = visual_det
-
-        if nearby_visual:
-            # Create combined element
-            combined_bbox = _merge_bboxes(text_result.rect_bbox, nearby_visual.bbox)
-            combined_center = (
-                (text_result.center[0] + nearby_visual.center[0]) // 2,
-                (text_result.center[1] + nearby_visual.center[1]) // 2,
-            )
-            combined_area = (combined_bbox[2] - combined_bbox[0]) * (
-                combined_bbox[3] - combined_bbox[1]
-            )
-
-            combined_element = UIElement(
-                element_type="combined",
-                bbox=combined_bbox,
-                center=combined_center,
-                confidence=(text_result.confidence + nearby_visual.confidence) / 2,
-                area=combined_area,
-                visual_detection=nearby_visual,
-                text_detection=text_result,
-                text=text_result.text,
-                description=f"{nearby_visual.class_name}: '{text_result.text}'",
-            )
-            elements.append(combined_element)
-        else:
-            elements.append(text_element)
-
-    return elements
+        # Tolerate OCR noise
+        submit_elements = find_elements_by_text(image, "Submit", fuzzy=True)
+    """
+    return ScreenIndex(image, confidence_threshold).find_text(
+        text_query, search_radius=search_radius, case_sensitive=case_sensitive, fuzzy=fuzzy
+    )
 
 
+@cached_result("find_clickable_elements")
 def find_clickable_elements(
     image: np.ndarray, confidence_threshold: float = 0.6
 ) -> list[UIElement]:
@@ -171,53 +497,7 @@ def find_clickable_elements(
         for element in clickable:
             print(f"Clickable: {element.description} at {element.center}")
     """
-    # Get all elements
-    all_elements = _get_all_ui_elements(image, confidence_threshold)
-
-    clickable_elements = []
-
-    # Define clickable indicators
-    clickable_visual_classes = {"laptop", "mouse", "remote", "keyboard", "cell phone", "book"}
-
-    clickable_text_terms = {
-        "button",
-        "click",
-        "submit",
-        "ok",
-        "cancel",
-        "close",
-        "save",
-        "open",
-        "login",
-        "sign",
-        "next",
-        "back",
-        "menu",
-        "settings",
-    }
-
-    for element in all_elements:
-        is_clickable = False
-
-        # Check visual indicators
-        if element.visual_detection:
-            if element.visual_detection.class_name.lower() in clickable_visual_classes:
-                is_clickable = True
-
-        # Check text indicators
-        if element.text:
-            text_lower = element.text.lower()
-            if any(term in text_lower for term in clickable_text_terms):
-                is_clickable = True
-
-            # Short text often indicates buttons/links
-            if len(element.text.split()) <= 3 and len(element.text) <= 20:
-                is_clickable = True
-
-        if is_clickable:
-            clickable_elements.append(element)
-
-    return clickable_elements
+    return ScreenIndex(image, confidence_threshold).find_clickable()
 
 
 def analyze_screen_content(
@@ -239,42 +519,18 @@ def analyze_screen_content(
         print(f"Found {len(analysis.clickable_elements)} clickable elements")
         print(f"Total UI elements: {analysis.summary['total_elements']}")
     """
-    # Get all UI elements
-    all_elements = _get_all_ui_elements(image, confidence_threshold)
-
-    # Separate by type
-    visual_elements = [e for e in all_elements if e.element_type in ["visual", "combined"]]
-    text_elements = [e for e in all_elements if e.element_type in ["text", "combined"]]
-    clickable_elements = find_clickable_elements(image, confidence_threshold)
-
-    # Create summary
-    summary = {
-        "total_elements": len(all_elements),
-        "visual_elements": len(visual_elements),
-        "text_elements": len(text_elements),
-        "clickable_elements": len(clickable_elements),
-        "unique_text_content": len(set(e.text for e in text_elements if e.text)),
-        "visual_classes": list(
-            set(e.visual_detection.class_name for e in visual_elements if e.visual_detection)
-        ),
-    }
-
-    return ScreenAnalysis(
-        ui_elements=all_elements,
-        text_elements=text_elements,
-        visual_elements=visual_elements,
-        clickable_elements=clickable_elements,
-        summary=summary,
-        query=query,
-    )
+    return ScreenIndex(image, confidence_threshold).analyze(query)
 
 
 def _get_all_ui_elements(image: np.ndarray, confidence_threshold: float) -> list[UIElement]:
     """Get all UI elements combining YOLO and OCR results"""
-    # Get detections
-    visual_detections = detect_ui_elements(image, confidence_threshold=confidence_threshold)
-    text_results = extract_text(image, confidence_threshold=confidence_threshold)
+    return ScreenIndex(image, confidence_threshold).elements
 
+
+def _build_ui_elements(
+    visual_detections: list[Detection], text_results: list[TextResult]
+) -> list[UIElement]:
+    """Combine YOLO detections and OCR results into UI elements"""
     elements = []
 
     # Add visual elements
@@ -310,6 +566,28 @@ def _get_all_ui_elements(image: np.ndarray, confidence_threshold: float) -> list
     return combined_elements
 
 
+def _is_clickable(element: UIElement) -> bool:
+    """Whether an element looks clickable from its visual class or text"""
+    # Check visual indicators
+    if (
+        element.visual_detection
+        and element.visual_detection.class_name.lower() in CLICKABLE_VISUAL_CLASSES
+    ):
+        return True
+
+    # Check text indicators
+    if element.text:
+        text_lower = element.text.lower()
+        if any(term in text_lower for term in CLICKABLE_TEXT_TERMS):
+            return True
+
+        # Short text often indicates buttons/links
+        if len(element.text.split()) <= 3 and len(element.text) <= 20:
+            return True
+
+    return False
+
+
 def _combine_nearby_elements(
     elements: list[UIElement], proximity_threshold: int = 50
 ) -> list[UIElement]:
@@ -320,21 +598,16 @@ def _combine_nearby_elements(
 
     used_text_indices = set()
 
+    # Only text centers in grid cells near each visual are considered
+    text_index = _build_spatial_index(text_elements)
+
     for visual_elem in visual_elements:
-        # Find nearby text elements
-        nearby_texts = []
-        for i, text_elem in enumerate(text_elements):
-            if i in used_text_indices:
-                continue
-
-            distance = _calculate_distance(visual_elem.center, text_elem.center)
-            if distance <= proximity_threshold:
-                nearby_texts.append((i, text_elem, distance))
-
-        if nearby_texts:
-            # Sort by distance and take closest
-            nearby_texts.sort(key=lambda x: x[2])
-            text_idx, closest_text, _ = nearby_texts[0]
+        # Find closest unused text element within the proximity threshold
+        candidates, _ = text_index.within_radius(visual_elem.center, proximity_threshold)
+        text_idx = next((i for i in candidates.tolist() if i not in used_text_indices), None)
+
+        if text_idx is not None:
+            closest_text = text_elements[text_idx]
             used_text_indices.add(text_idx)
 
             # Create combined element
@@ -371,9 +644,9 @@ def _combine_nearby_elements(
     return combined_elements
 
 
-def _calculate_distance(point1: tuple[int, int], point2: tuple[int, int]) -> float:
-    """Calculate Euclidean distance between two points"""
-    return math.sqrt((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2)
+def _build_spatial_index(items: list[Detection] | list[UIElement]) -> SpatialIndex:
+    """Spatial index over the boxes and centers of detections or UI elements"""
+    return SpatialIndex([item.bbox for item in items], centers=[item.center for item in items])
 
 
 def _merge_bboxes(
@@ -406,21 +679,4 @@ def find_elements_near_point(
     Returns:
         List of nearby UIElement objects sorted by distance
     """
-    all_elements = _get_all_ui_elements(image, confidence_threshold)
-    nearby_elements = []
-
-    px, py = point
-
-    for element in all_elements:
-        ex, ey = element.center
-        distance = ((ex - px) ** 2 + (ey - py) ** 2) ** 0.5
-
-        if distance <= radius:
-            # Add distance for sorting
-            element.distance = distance  # type: ignore
-            nearby_elements.append(element)
-
-    # Sort by distance
-    nearby_elements.sort(key=lambda x: getattr(x, "distance", float("inf")))
-
-    return nearby_elements
+    return ScreenIndex(image, confidence_threshold).find_near_point(point, radius)
@@ -0,0 +1,200 @@
+"""Vectorized Box Suppression Functions
+
+NumPy implementations of IoU matrices, greedy Non-Maximum Suppression and
+Soft-NMS shared by the detector and any code that merges boxes.
+
+Box Suppression: Class-aware/agnostic NMS, Soft-NMS and top-k candidate caps
+"""
+
+import numpy as np
+
+
+def box_iou(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Compute pairwise Intersection over Union
+
+    Args:
+        boxes1: Array of shape [N, 4] with x1, y1, x2, y2
+        boxes2: Array of shape [M, 4] with x1, y1, x2, y2
+
+    Returns:
+        IoU matrix of shape [N, M]
+    """
+    boxes1 = np.asarray(boxes1, dtype=np.float32).reshape(-1, 4)
+    boxes2 = np.asarray(boxes2, dtype=np.float32).reshape(-1, 4)
+
+    top_left = np.maximum(boxes1[:, None, :2], boxes2[None, :, :2])
+    bottom_right = np.minimum(boxes1[:, None, 2:], boxes2[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+
+    area1 = np.prod(boxes1[:, 2:] - boxes1[:, :2], axis=1)
+    area2 = np.prod(boxes2[:, 2:] - boxes2[:, :2], axis=1)
+    union = area1[:, None] + area2[None, :] - intersection
+
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def center_distances(centers1: np.ndarray, centers2: np.ndarray) -> np.ndarray:
+    """
+    Compute pairwise Euclidean distances between box centers
+
+    Args:
+        centers1: Array of shape [N, 2] with x, y
+        centers2: Array of shape [M, 2] with x, y
+
+    Returns:
+        Distance matrix of shape [N, M]
+    """
+    centers1 = np.asarray(centers1, dtype=np.float64).reshape(-1, 2)
+    centers2 = np.asarray(centers2, dtype=np.float64).reshape(-1, 2)
+    return np.linalg.norm(centers1[:, None, :] - centers2[None, :, :], axis=2)
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float = 0.5,
+    class_ids: np.ndarray | None = None,
+    top_k: int | None = None,
+    max_output: int | None = None,
+    match_metric: str = "iou",
+) -> np.ndarray:
+    """
+    Greedy Non-Maximum Suppression
+
+    Args:
+        boxes: Array of shape [N, 4] with x1, y1, x2, y2
+        scores: Array of shape [N] with confidences
+        iou_threshold: Boxes overlapping a kept box by more than this are suppressed
+        class_ids: Per-box class ids for class-aware NMS (class-agnostic if None)
+        top_k: Only consider the top_k highest scoring boxes
+        max_output: Stop once this many boxes are kept
+        match_metric: "iou", or "ios" (intersection over the smaller box) to also
+            suppress boxes truncated by a tile edge that lie inside a kept box
+
+    Returns:
+        Indices of kept boxes, highest score first
+
+    Example:
+        keep = non_max_suppression(boxes, scores, iou_threshold=0.5, top_k=300)
+        boxes, scores = boxes[keep], scores[keep]
+    """
+    if match_metric not in ("iou", "ios"):
+        raise ValueError(f"Unknown match metric: {match_metric}")
+
+    scores = np.asarray(scores, dtype=np.float32)
+    order = _top_k_order(scores, top_k)
+    if order.size == 0:
+        return order
+
+    candidates = _offset_by_class(boxes, class_ids)[order]
+    areas = np.prod(candidates[:, 2:] - candidates[:, :2], axis=1)
+
+    kept = []
+    remaining = np.arange(order.size)
+    while remaining.size > 0:
+        current = remaining[0]
+        kept.append(current)
+        if max_output is not None and len(kept) >= max_output:
+            break
+
+        rest = remaining[1:]
+        overlaps = _iou_one_to_many(
+            candidates[current], areas[current], candidates[rest], areas[rest], match_metric
+        )
+        remaining = rest[overlaps <= iou_threshold]
+
+    return order[np.array(kept, dtype=np.int64)]
+
+
+def soft_nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    sigma: float = 0.5,
+    iou_threshold: float = 0.3,
+    score_threshold: float = 0.001,
+    method: str = "gaussian",
+    class_ids: np.ndarray | None = None,
+    top_k: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Soft Non-Maximum Suppression
+
+    Instead of discarding overlapping boxes, decays their scores by overlap.
+
+    Args:
+        boxes: Array of shape [N, 4] with x1, y1, x2, y2
+        scores: Array of shape [N] with confidences
+        sigma: Gaussian decay parameter
+        iou_threshold: Overlap above which linear decay applies
+        score_threshold: Boxes whose decayed score falls below this are dropped
+        method: "gaussian" or "linear"
+        class_ids: Per-box class ids for class-aware decay (class-agnostic if None)
+        top_k: Only consider the top_k highest scoring boxes
+
+    Returns:
+        Tuple of (kept indices, decayed scores), highest decayed score first
+    """
+    if method not in ("gaussian", "linear"):
+        raise ValueError(f"Unknown Soft-NMS method: {method}")
+
+    scores = np.asarray(scores, dtype=np.float32)
+    order = _top_k_order(scores, top_k)
+    if order.size == 0:
+        return order, scores[order]
+
+    candidates = _offset_by_class(boxes, class_ids)[order]
+    areas = np.prod(candidates[:, 2:] - candidates[:, :2], axis=1)
+    decayed = scores[order].copy()
+
+    kept = []
+    remaining = np.arange(order.size)
+    while remaining.size > 0:
+        best = remaining[np.argmax(decayed[remaining])]
+        kept.append(best)
+        remaining = remaining[remaining != best]
+        if remaining.size == 0:
+            break
+
+        ious = _iou_one_to_many(
+            candidates[best], areas[best], candidates[remaining], areas[remaining]
+        )
+        if method == "gaussian":
+            decayed[remaining] *= np.exp(-(ious**2) / sigma)
+        else:
+            decayed[remaining] *= np.where(ious > iou_threshold, 1.0 - ious, 1.0)
+
+        remaining = remaining[decayed[remaining] >= score_threshold]
+
+    kept_array = np.array(kept, dtype=np.int64)
+    return order[kept_array], decayed[kept_array]
+
+
+def _top_k_order(scores: np.ndarray, top_k: int | None) -> np.ndarray:
+    """Indices of the highest scores in descending order, capped at top_k"""
+    order = np.argsort(-scores, kind="stable")
+    return order[:top_k] if top_k is not None else order
+
+
+def _offset_by_class(boxes: np.ndarray, class_ids: np.ndarray | None) -> np.ndarray:
+    """Shift boxes per class so boxes of different classes never overlap"""
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    if class_ids is None or boxes.size == 0:
+        return boxes
+
+    offset = float(boxes.max() - boxes.min()) + 1.0
+    return boxes + (np.asarray(class_ids, dtype=np.float32) * offset)[:, None]
+
+
+def _iou_one_to_many(
+    box: np.ndarray, area: float, boxes: np.ndarray, areas: np.ndarray, metric: str = "iou"
+) -> np.ndarray:
+    """IoU (or intersection over smaller area) of one box against many boxes"""
+    width = np.clip(np.minimum(box[2], boxes[:, 2]) - np.maximum(box[0], boxes[:, 0]), 0, None)
+    height = np.clip(np.minimum(box[3], boxes[:, 3]) - np.maximum(box[1], boxes[:, 1]), 0, None)
+    intersection = width * height
+    union = area + areas - intersection
+    denominator = np.minimum(area, areas) if metric == "ios" else union
+    return np.divide(
+        intersection, denominator, out=np.zeros_like(intersection), where=denominator > 0
+    )
@@ -0,0 +1,349 @@
+"""PaddleOCR Engine Manager
+
+Keeps bounded pools of initialized PaddleOCR engines keyed by language and
+options, so OCR calls reuse warm engines instead of re-initializing models.
+
+Engine Management: Pooled engines, startup pre-warming, LRU eviction of idle languages
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import paddleocr
+
+# Engine key: (language, sorted option items)
+EngineKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+# Options used by extract_text when none are given
+DEFAULT_OCR_OPTIONS: dict[str, Any] = {"use_textline_orientation": True}
+
+# Recognition-only models for single text lines, per language
+RECOGNITION_MODELS = {
+    "en": "en_PP-OCRv5_mobile_rec",
+    "ch": "PP-OCRv5_server_rec",
+    "chinese_cht": "PP-OCRv5_server_rec",
+    "japan": "PP-OCRv5_server_rec",
+    "korean": "korean_PP-OCRv5_mobile_rec",
+}
+
+# Maximum text line crops per recognition batch
+RECOGNITION_BATCH_SIZE = 16
+
+
+def _create_paddle_ocr(language: str, options: dict[str, Any]) -> Any:
+    """Create a full detection + recognition PaddleOCR pipeline"""
+    return paddleocr.PaddleOCR(lang=language, **options)
+
+
+def _create_text_recognizer(language: str, options: dict[str, Any]) -> Any:
+    """Create a recognition-only PaddleOCR model for cropped text lines"""
+    return paddleocr.TextRecognition(model_name=RECOGNITION_MODELS[language], **options)
+
+
+@dataclass
+class _EnginePool:
+    """Ready engines for a single language/options key"""
+
+    idle: list[Any] = field(default_factory=list)
+    created: int = 0
+    in_use: int = 0
+    last_used: float = field(default_factory=time.time)
+
+
+class OCREngineManager:
+    """Bounded, thread-safe pools of OCR engines with LRU eviction of idle languages"""
+
+    def __init__(
+        self,
+        max_engines_per_key: int = 2,
+        max_keys: int = 3,
+        factory: Callable[[str, dict[str, Any]], Any] = _create_paddle_ocr,
+        default_options: dict[str, Any] | None = None,
+    ):
+        """
+        Initialize engine manager
+
+        Args:
+            max_engines_per_key: Maximum engines kept per language/options key
+            max_keys: Maximum language/options keys kept before evicting idle ones
+            factory: Callable creating an engine from (language, options)
+            default_options: Options used when a caller passes none
+        """
+        self.max_engines_per_key = max_engines_per_key
+        self.max_keys = max_keys
+        self._factory = factory
+        self._default_options = dict(
+            DEFAULT_OCR_OPTIONS if default_options is None else default_options
+        )
+        self._pools: OrderedDict[EngineKey, _EnginePool] = OrderedDict()
+        self._condition = threading.Condition()
+        self._stats = {"created": 0, "reused": 0, "evicted": 0, "waits": 0}
+
+    @contextmanager
+    def engine(self, language: str = "en", **options: Any) -> Iterator[Any]:
+        """
+        Check out a ready engine for the duration of a with-block
+
+        Args:
+            language: OCR language code
+            **options: Engine options (defaults used if none given)
+
+        Yields:
+            Initialized OCR engine
+        """
+        key = self._make_key(language, options)
+        engine = self._acquire(key)
+        try:
+            yield engine
+        finally:
+            self._release(key, engine)
+
+    def prewarm(self, language: str = "en", count: int = 1, **options: Any) -> int:
+        """
+        Initialize engines ahead of the first request
+
+        Args:
+            language: OCR language code
+            count: Number of engines to have ready (capped at max_engines_per_key)
+            **options: Engine options (defaults used if none given)
+
+        Returns:
+            Number of engines created
+        """
+        key = self._make_key(language, options)
+        count = min(count, self.max_engines_per_key)
+
+        engines = []
+        try:
+            while True:
+                with self._condition:
+                    pool = self._get_pool(key)
+                    if pool.created >= count:
+                        break
+                    pool.created += 1
+                engines.append(self._create(key))
+        finally:
+            with self._condition:
+                pool = self._get_pool(key)
+                pool.idle.extend(engines)
+                self._condition.notify_all()
+
+        return len(engines)
+
+    def clear(self) -> int:
+        """
+        Drop all idle engines
+
+        Returns:
+            Number of engines released
+        """
+        with self._condition:
+            released = 0
+            for key in list(self._pools):
+                pool = self._pools[key]
+                released += len(pool.idle)
+                pool.created -= len(pool.idle)
+                pool.idle.clear()
+                if pool.in_use == 0:
+                    del self._pools[key]
+            return released
+
+    def stats(self) -> dict[str, Any]:
+        """Get engine pool statistics"""
+        with self._condition:
+            return {
+                **self._stats,
+                "pools": [
+                    {
+                        "language": key[0],
+                        "options": dict(key[1]),
+                        "created": pool.created,
+                        "idle": len(pool.idle),
+                        "in_use": pool.in_use,
+                    }
+                    for key, pool in self._pools.items()
+                ],
+            }
+
+    def _make_key(self, language: str, options: dict[str, Any]) -> EngineKey:
+        merged = options or self._default_options
+        return (language, tuple(sorted(merged.items())))
+
+    def _get_pool(self, key: EngineKey) -> _EnginePool:
+        """Get or create the pool for a key (caller holds the lock)"""
+        pool = self._pools.get(key)
+        if pool is None:
+            self._evict_idle_keys()
+            pool = self._pools[key] = _EnginePool()
+        self._pools.move_to_end(key)
+        pool.last_used = time.time()
+        return pool
+
+    def _evict_idle_keys(self):
+        """Evict least recently used idle pools until a new key fits"""
+        for key in list(self._pools):
+            if len(self._pools) < self.max_keys:
+                return
+            if self._pools[key].in_use == 0:
+                del self._pools[key]
+                self._stats["evicted"] += 1
+
+    def _acquire(self, key: EngineKey) -> Any:
+        with self._condition:
+            while True:
+                pool = self._get_pool(key)
+                if pool.idle:
+                    pool.in_use += 1
+                    self._stats["reused"] += 1
+                    return pool.idle.pop()
+                if pool.created < self.max_engines_per_key:
+                    pool.created += 1
+                    pool.in_use += 1
+                    break
+                self._stats["waits"] += 1
+                self._condition.wait()
+
+        # Initialize outside the lock so other keys stay available
+        try:
+            return self._create(key)
+        except Exception:
+            with self._condition:
+                pool.created -= 1
+                pool.in_use -= 1
+                self._condition.notify_all()
+            raise
+
+    def _release(self, key: EngineKey, engine: Any):
+        with self._condition:
+            # Pools with engines checked out are never evicted
+            pool = self._pools[key]
+            pool.in_use -= 1
+            pool.idle.append(engine)
+            pool.last_used = time.time()
+            self._condition.notify_all()
+
+    def _create(self, key: EngineKey) -> Any:
+        language, option_items = key
+        engine = self._factory(language, dict(option_items))
+        with self._condition:
+            self._stats["created"] += 1
+        return engine
+
+
+# Global engine managers shared by all OCR calls in this process
+_manager = OCREngineManager()
+_recognizer_manager = OCREngineManager(factory=_create_text_recognizer, default_options={})
+
+
+def get_ocr_engine_manager() -> OCREngineManager:
+    """Get the process-wide OCR engine manager"""
+    return _manager
+
+
+def get_text_recognizer_manager() -> OCREngineManager:
+    """Get the process-wide manager of recognition-only engines"""
+    return _recognizer_manager
+
+
+def has_recognition_model(language: str) -> bool:
+    """Whether single text lines in a language can skip the detection stage"""
+    return language in RECOGNITION_MODELS
+
+
+def configure_ocr_engines(
+    max_engines_per_key: int = 2,
+    max_languages: int = 3,
+    max_recognizers_per_language: int | None = None,
+):
+    """
+    Configure OCR engine pool limits
+
+    Args:
+        max_engines_per_key: Maximum ready engines per language/options key
+        max_languages: Maximum language/options keys kept before LRU eviction
+        max_recognizers_per_language: Maximum recognition-only engines per language
+            (same as max_engines_per_key if None)
+    """
+    if max_recognizers_per_language is None:
+        max_recognizers_per_language = max_engines_per_key
+
+    for manager, per_key in (
+        (_manager, max_engines_per_key),
+        (_recognizer_manager, max_recognizers_per_language),
+    ):
+        with manager._condition:
+            manager.max_engines_per_key = per_key
+            manager.max_keys = max_languages
+
+
+def prewarm_ocr_engines(languages: dict[str, int] | list[str] | None = None) -> dict[str, int]:
+    """
+    Initialize OCR engines at startup
+
+    Args:
+        languages: Language codes or {language: engine_count}. If None, read from the
+            VISION_OCR_PREWARM environment variable (e.g. "en:2,fr")
+
+    Returns:
+        Dictionary of language to number of engines created
+
+    Example:
+        prewarm_ocr_engines({"en": 2, "ch": 1})
+    """
+    if languages is None:
+        languages = _parse_prewarm_spec(os.getenv("VISION_OCR_PREWARM", ""))
+    if isinstance(languages, list):
+        languages = dict.fromkeys(languages, 1)
+
+    return {language: _manager.prewarm(language, count) for language, count in languages.items()}
+
+
+def prewarm_text_recognizers(
+    languages: dict[str, int] | list[str] | None = None,
+) -> dict[str, int]:
+    """
+    Initialize recognition-only engines at startup
+
+    Args:
+        languages: Language codes or {language: engine_count}. If None, read from the
+            VISION_OCR_RECOGNIZER_PREWARM environment variable (e.g. "en:2")
+
+    Returns:
+        Dictionary of language to number of engines created
+    """
+    if languages is None:
+        languages = _parse_prewarm_spec(os.getenv("VISION_OCR_RECOGNIZER_PREWARM", ""))
+    if isinstance(languages, list):
+        languages = dict.fromkeys(languages, 1)
+
+    unsupported = [language for language in languages if not has_recognition_model(language)]
+    if unsupported:
+        raise ValueError(f"No recognition model for languages: {', '.join(unsupported)}")
+
+    return {
+        language: _recognizer_manager.prewarm(language, count)
+        for language, count in languages.items()
+    }
+
+
+def get_ocr_engine_stats() -> dict[str, Any]:
+    """Get OCR engine pool statistics (recognition-only pools under "recognizers")"""
+    return {**_manager.stats(), "recognizers": _recognizer_manager.stats()}
+
+
+def _parse_prewarm_spec(spec: str) -> dict[str, int]:
+    """Parse "en:2,fr" into {"en": 2, "fr": 1}"""
+    languages = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        language, _, count = item.partition(":")
+        languages[language.strip()] = int(count) if count else 1
+    return languages
@@ -0,0 +1,458 @@
+"""OCR Worker Process Pool
+
+Runs PaddleOCR in separate worker processes, each holding a warm engine, so OCR
+from many threads or sessions spreads across CPU cores instead of sharing the
+caller's interpreter. Images travel through reusable shared memory slots rather
+than being pickled, and the number of slots bounds how much work can queue.
+
+Worker Pool: Warm engine per process, shared memory transport, bounded submission
+"""
+
+import asyncio
+import atexit
+import contextlib
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .reader import TextResult
+
+# How often the collector checks for exited workers, in seconds
+WORKER_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class _Slot:
+    """Reusable shared memory buffer for one in-flight image"""
+
+    index: int
+    shm: shared_memory.SharedMemory | None = None
+
+
+@dataclass
+class _Task:
+    """In-flight OCR request as tracked by the parent process"""
+
+    slot: _Slot
+    future: Future
+    worker: int
+
+
+@dataclass
+class _PoolStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    restarts: int = 0
+    backpressure_waits: int = 0
+    per_worker: dict[int, int] = field(default_factory=dict)
+
+
+class OCRWorkerPool:
+    """
+    Pool of OCR worker processes with sync and asyncio clients
+
+    Example:
+        with OCRWorkerPool(num_workers=4) as pool:
+            text_results = pool.extract_text(image)
+            future = pool.submit(other_image)
+
+        # From a coroutine
+        text_results = await pool.aextract_text(image)
+    """
+
+    def __init__(
+        self,
+        num_workers: int | None = None,
+        language: str = "en",
+        max_pending: int | None = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Start worker processes
+
+        Args:
+            num_workers: Worker processes (CPU count if None)
+            language: Language each worker pre-warms an engine for
+            max_pending: Images queued or in flight before submit blocks
+                (two per worker if None)
+            start_method: multiprocessing start method for the workers
+        """
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.language = language
+        self.max_pending = max_pending or 2 * self.num_workers
+
+        self._context = multiprocessing.get_context(start_method)
+        self._results_queue = self._context.Queue()
+
+        # Workers must share this process's tracker, or one started for a worker
+        # would unlink the slots it attached to when that worker exits
+        resource_tracker.ensure_running()
+
+        self._slots = [_Slot(i) for i in range(self.max_pending)]
+        self._free_slots: queue.Queue[_Slot] = queue.Queue()
+        for slot in self._slots:
+            self._free_slots.put(slot)
+
+        self._task_ids = itertools.count()
+        self._pending: dict[int, _Task] = {}
+        self._lock = threading.Lock()
+        self._stats = _PoolStats()
+        self._closed = False
+
+        # Each worker has its own task queue so the parent knows what it holds
+        self._task_queues: list[Any] = []
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+        for worker_id in range(self.num_workers):
+            queue_, process = self._spawn_worker(worker_id)
+            self._task_queues.append(queue_)
+            self._workers.append(process)
+        self._collector = threading.Thread(
+            target=self._collect_results, name="ocr-worker-results", daemon=True
+        )
+        self._collector.start()
+
+    def __enter__(self) -> "OCRWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(
+        self,
+        image: np.ndarray,
+        language: str = "en",
+        confidence_threshold: float = 0.5,
+        max_results: int = 100,
+        timeout: float | None = None,
+    ) -> Future:
+        """
+        Queue an image for OCR, blocking while max_pending images are in flight
+
+        Args:
+            image: Input image as numpy array (BGR format from cv2)
+            language: Language code for OCR
+            confidence_threshold: Minimum confidence for text results
+            max_results: Maximum number of text results to return
+            timeout: Seconds to wait for a free slot (forever if None)
+
+        Returns:
+            Future resolving to a list of TextResult objects
+
+        Raises:
+            TimeoutError: If no slot became free within the timeout
+        """
+        slot = self._acquire_slot(block=True, timeout=timeout)
+        return self._dispatch(slot, image, language, confidence_threshold, max_results)
+
+    def extract_text(
+        self,
+        image: np.ndarray,
+        language: str = "en",
+        confidence_threshold: float = 0.5,
+        max_results: int = 100,
+        timeout: float | None = None,
+    ) -> list["TextResult"]:
+        """
+        Run OCR in a worker and wait for the result
+
+        Args:
+            image: Input image as numpy array (BGR format from cv2)
+            language: Language code for OCR
+            confidence_threshold: Minimum confidence for text results
+            max_results: Maximum number of text results to return
+            timeout: Seconds to wait for a slot and again for the result
+
+        Returns:
+            List of TextResult objects sorted by confidence
+        """
+        future = self.submit(image, language, confidence_threshold, max_results, timeout)
+        return future.result(timeout)
+
+    async def aextract_text(
+        self,
+        image: np.ndarray,
+        language: str = "en",
+        confidence_threshold: float = 0.5,
+        max_results: int = 100,
+    ) -> list["TextResult"]:
+        """
+        Run OCR in a worker without blocking the event loop
+
+        Waits for a free slot by polling, so a cancelled caller never holds one.
+
+        Args:
+            image: Input image as numpy array (BGR format from cv2)
+            language: Language code for OCR
+            confidence_threshold: Minimum confidence for text results
+            max_results: Maximum number of text results to return
+
+        Returns:
+            List of TextResult objects sorted by confidence
+        """
+        delay = 0.005
+        while (slot := self._acquire_slot(block=False)) is None:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+        future = self._dispatch(slot, image, language, confidence_threshold, max_results)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, timeout: float = 5.0):
+        """
+        Stop the workers, fail unfinished requests and free shared memory
+
+        Args:
+            timeout: Seconds to wait for each worker to exit before terminating it
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for process in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self._collector.join(timeout)
+
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for task in pending:
+            _fail(task.future, RuntimeError("OCR worker pool shut down"))
+
+        for slot in self._slots:
+            if slot.shm is not None:
+                slot.shm.close()
+                slot.shm.unlink()
+                slot.shm = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get worker pool statistics"""
+        with self._lock:
+            return {
+                "workers": self.num_workers,
+                "alive": sum(process.is_alive() for process in self._workers),
+                "max_pending": self.max_pending,
+                "pending": len(self._pending),
+                "submitted": self._stats.submitted,
+                "completed": self._stats.completed,
+                "failed": self._stats.failed,
+                "restarts": self._stats.restarts,
+                "backpressure_waits": self._stats.backpressure_waits,
+                "per_worker": dict(self._stats.per_worker),
+            }
+
+    def _acquire_slot(self, block: bool, timeout: float | None = None) -> _Slot | None:
+        if self._closed:
+            raise RuntimeError("OCR worker pool is shut down")
+        try:
+            return self._free_slots.get_nowait()
+        except queue.Empty:
+            if not block:
+                return None
+
+        with self._lock:
+            self._stats.backpressure_waits += 1
+        try:
+            return self._free_slots.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No OCR worker slot became free in time") from None
+
+    def _dispatch(
+        self,
+        slot: _Slot,
+        image: np.ndarray,
+        language: str,
+        confidence_threshold: float,
+        max_results: int,
+    ) -> Future:
+        """Copy an image into its slot and queue it for the workers"""
+        try:
+            image = np.ascontiguousarray(image)
+            if slot.shm is None or slot.shm.size < image.nbytes:
+                if slot.shm is not None:
+                    slot.shm.close()
+                    slot.shm.unlink()
+                slot.shm = shared_memory.SharedMemory(create=True, size=max(image.nbytes, 1))
+            np.ndarray(image.shape, image.dtype, buffer=slot.shm.buf)[...] = image
+
+            future: Future = Future()
+            task_id = next(self._task_ids)
+            with self._lock:
+                # Least loaded worker, counting queued and running requests
+                loads = [0] * self.num_workers
+                for task in self._pending.values():
+                    loads[task.worker] += 1
+                worker_id = loads.index(min(loads))
+                self._pending[task_id] = _Task(slot, future, worker_id)
+                self._stats.submitted += 1
+                task_queue = self._task_queues[worker_id]
+
+            task_queue.put(
+                (
+                    task_id,
+                    slot.shm.name,
+                    image.shape,
+                    image.dtype.str,
+                    (language, confidence_threshold, max_results),
+                )
+            )
+            return future
+        except BaseException:
+            self._free_slots.put(slot)
+            raise
+
+    def _spawn_worker(self, worker_id: int) -> tuple[Any, multiprocessing.process.BaseProcess]:
+        task_queue = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, self.language, task_queue, self._results_queue),
+            name=f"ocr-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        return task_queue, process
+
+    def _collect_results(self):
+        """Resolve futures from worker messages and replace exited workers"""
+        while True:
+            try:
+                message = self._results_queue.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                if self._closed:
+                    return
+                self._check_workers()
+                continue
+
+            kind, worker_id, task_id, payload = message
+            with self._lock:
+                task = self._pending.pop(task_id, None)
+                if task is None:
+                    continue
+                self._stats.per_worker[worker_id] = self._stats.per_worker.get(worker_id, 0) + 1
+                if kind == "done":
+                    self._stats.completed += 1
+                else:
+                    self._stats.failed += 1
+
+            self._free_slots.put(task.slot)
+            if kind == "done":
+                _resolve(task.future, payload)
+            else:
+                _fail(task.future, RuntimeError(f"OCR worker error: {payload}"))
+            self._check_workers()
+
+    def _check_workers(self):
+        """Fail the requests of any worker that exited and start a replacement"""
+        for worker_id, process in enumerate(self._workers):
+            if process.is_alive() or self._closed:
+                continue
+
+            # Fresh queue, so the replacement never reads requests that are failed here
+            task_queue, replacement = self._spawn_worker(worker_id)
+            with self._lock:
+                self._task_queues[worker_id], self._workers[worker_id] = task_queue, replacement
+                lost = [i for i, task in self._pending.items() if task.worker == worker_id]
+                lost = [self._pending.pop(i) for i in lost]
+                self._stats.failed += len(lost)
+                self._stats.restarts += 1
+
+            for task in lost:
+                self._free_slots.put(task.slot)
+                _fail(task.future, RuntimeError(f"OCR worker exited with code {process.exitcode}"))
+
+
+def _resolve(future: Future, value: Any):
+    # The caller may have cancelled the future meanwhile
+    with contextlib.suppress(InvalidStateError):
+        future.set_result(value)
+
+
+def _fail(future: Future, error: Exception):
+    with contextlib.suppress(InvalidStateError):
+        future.set_exception(error)
+
+
+def _worker_main(worker_id: int, language: str, tasks, results):
+    """Worker process loop: warm an engine, then OCR images from shared memory"""
+    from .ocr_engines import get_ocr_engine_manager
+    from .reader import _run_ocr
+
+    # A failed warm-up is reported per request rather than crash-looping the worker
+    with contextlib.suppress(Exception):
+        get_ocr_engine_manager().prewarm(language)
+
+    while (task := tasks.get()) is not None:
+        task_id, shm_name, shape, dtype, (task_language, threshold, max_results) = task
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                image = np.ndarray(shape, np.dtype(dtype), buffer=shm.buf)
+                text_results = _run_ocr(image, task_language, threshold, max_results)
+                del image
+            finally:
+                shm.close()
+            results.put(("done", worker_id, task_id, text_results))
+        except Exception as e:
+            results.put(("error", worker_id, task_id, repr(e)))
+
+
+# Process-wide pool that extract_text routes through once started
+_pool: OCRWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def start_ocr_workers(
+    num_workers: int | None = None, language: str = "en", max_pending: int | None = None
+) -> OCRWorkerPool | None:
+    """
+    Start the process-wide OCR worker pool used by extract_text
+
+    Args:
+        num_workers: Worker processes. If None, read from the VISION_OCR_WORKERS
+            environment variable; 0 or unset leaves OCR in-process
+        language: Language each worker pre-warms an engine for
+        max_pending: Images queued or in flight before callers block
+
+    Returns:
+        The running pool, or None if no workers were requested
+    """
+    global _pool
+    if num_workers is None:
+        num_workers = int(os.getenv("VISION_OCR_WORKERS") or 0)
+    if num_workers <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = OCRWorkerPool(num_workers, language=language, max_pending=max_pending)
+            atexit.register(stop_ocr_workers)
+        return _pool
+
+
+def stop_ocr_workers():
+    """Stop the process-wide OCR worker pool, returning OCR to the caller's process"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def get_ocr_worker_pool() -> OCRWorkerPool | None:
+    """Get the process-wide OCR worker pool if one is running"""
+    return _pool
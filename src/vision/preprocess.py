@@ -0,0 +1,184 @@
+"""YOLO Input Preprocessing Functions
+
+Aspect-preserving letterbox resize into reusable input buffers, the inverse
+mapping from model coordinates back to the original image, and the tile grid
+used for high-resolution detection.
+
+Preprocessing: Letterbox resize, BGR->RGB CHW float32 tensors without per-frame allocations
+"""
+
+import math
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+# Padding value used by Ultralytics letterboxing
+LETTERBOX_PAD_VALUE = 114
+
+# Tiles are at most this many times the model input, so elements shrink by at most 2x
+TILE_MAX_SCALE = 2.0
+
+# Overlap between neighbouring tiles, as a fraction of the tile and in pixels at minimum
+TILE_OVERLAP_RATIO = 0.2
+TILE_MIN_OVERLAP = 64
+
+
+@dataclass(frozen=True)
+class LetterboxTransform:
+    """Mapping between original image coordinates and letterboxed model input"""
+
+    scale: float
+    pad_x: int
+    pad_y: int
+    resized_width: int
+    resized_height: int
+    original_width: int
+    original_height: int
+
+    def points_to_original(self, points: np.ndarray) -> np.ndarray:
+        """Map [N, 2] model-input x, y points to original image coordinates"""
+        return (points - np.array([self.pad_x, self.pad_y], dtype=np.float32)) / self.scale
+
+    def sizes_to_original(self, sizes: np.ndarray) -> np.ndarray:
+        """Map [N, 2] model-input widths/heights to original image scale"""
+        return sizes / self.scale
+
+
+def get_letterbox_transform(
+    image_shape: tuple[int, ...], target_width: int, target_height: int
+) -> LetterboxTransform:
+    """
+    Compute the letterbox scale and padding for an image
+
+    Args:
+        image_shape: Image shape (height, width, ...)
+        target_width: Model input width
+        target_height: Model input height
+
+    Returns:
+        LetterboxTransform for the image
+    """
+    height, width = image_shape[:2]
+    scale = min(target_width / width, target_height / height)
+
+    resized_width = round(width * scale)
+    resized_height = round(height * scale)
+
+    return LetterboxTransform(
+        scale=scale,
+        pad_x=(target_width - resized_width) // 2,
+        pad_y=(target_height - resized_height) // 2,
+        resized_width=resized_width,
+        resized_height=resized_height,
+        original_width=width,
+        original_height=height,
+    )
+
+
+class LetterboxBuffer:
+    """Reusable letterbox canvas and CHW float32 input tensor for one model input size"""
+
+    def __init__(self, target_width: int, target_height: int, batch_size: int = 1):
+        """
+        Initialize buffers
+
+        Args:
+            target_width: Model input width
+            target_height: Model input height
+            batch_size: Number of frames the tensor holds
+        """
+        self.target_width = target_width
+        self.target_height = target_height
+        self.canvas = np.full((target_height, target_width, 3), LETTERBOX_PAD_VALUE, dtype=np.uint8)
+        self.tensor = np.empty((batch_size, 3, target_height, target_width), dtype=np.float32)
+        self._last_transform: LetterboxTransform | None = None
+
+    def fill(self, image: np.ndarray, index: int = 0) -> LetterboxTransform:
+        """
+        Letterbox an image into the tensor at a batch index
+
+        Args:
+            image: Input image as numpy array (BGR format from cv2)
+            index: Batch index to write
+
+        Returns:
+            LetterboxTransform for mapping boxes back to the image
+        """
+        transform = get_letterbox_transform(image.shape, self.target_width, self.target_height)
+
+        # Only repaint the padding when the letterbox geometry changes
+        if transform != self._last_transform:
+            self.canvas[:] = LETTERBOX_PAD_VALUE
+            self._last_transform = transform
+
+        resized_width, resized_height = transform.resized_width, transform.resized_height
+        content = self.canvas[
+            transform.pad_y : transform.pad_y + resized_height,
+            transform.pad_x : transform.pad_x + resized_width,
+        ]
+
+        # Resize straight into the canvas
+        if image.shape[:2] == (resized_height, resized_width):
+            content[:] = image[:, :, :3]
+        else:
+            cv2.resize(image[:, :, :3], (resized_width, resized_height), dst=content)
+
+        # BGR HWC uint8 -> RGB CHW float32 in [0, 1], written into the tensor
+        for channel in range(3):
+            np.multiply(
+                self.canvas[:, :, 2 - channel],
+                np.float32(1.0 / 255.0),
+                out=self.tensor[index, channel],
+            )
+
+        return transform
+
+    def batch(self, size: int) -> np.ndarray:
+        """Get a view of the first `size` frames of the tensor"""
+        return self.tensor[:size]
+
+
+def get_tile_rects(
+    image_shape: tuple[int, ...],
+    input_size: int = 640,
+    tile_size: int | None = None,
+    overlap: int | None = None,
+) -> list[tuple[int, int, int, int]]:
+    """
+    Split an image into overlapping square tiles covering every pixel
+
+    Args:
+        image_shape: Image shape (height, width, ...)
+        input_size: Model input size the tiles are letterboxed into
+        tile_size: Tile side in pixels. If None, adapts to the image: the largest tile
+            downscaled by at most TILE_MAX_SCALE, but no larger than the short image side
+        overlap: Overlap between neighbouring tiles in pixels (adapts to tile_size if None)
+
+    Returns:
+        List of (x1, y1, x2, y2) tile rectangles, row by row
+
+    Example:
+        tiles = get_tile_rects((1440, 5120, 3))  # dual 2560x1440 monitors
+    """
+    height, width = image_shape[:2]
+
+    if tile_size is None:
+        tile_size = max(input_size, min(int(input_size * TILE_MAX_SCALE), width, height))
+    if overlap is None:
+        overlap = max(TILE_MIN_OVERLAP, int(tile_size * TILE_OVERLAP_RATIO))
+    overlap = min(overlap, tile_size // 2)
+
+    xs = _tile_starts(width, tile_size, overlap)
+    ys = _tile_starts(height, tile_size, overlap)
+    return [(x, y, min(x + tile_size, width), min(y + tile_size, height)) for y in ys for x in xs]
+
+
+def _tile_starts(length: int, tile_size: int, overlap: int) -> list[int]:
+    """Evenly spaced tile offsets along one axis with at least `overlap` between tiles"""
+    if length <= tile_size:
+        return [0]
+
+    count = math.ceil((length - overlap) / (tile_size - overlap))
+    step = (length - tile_size) / (count - 1)
+    return [round(index * step) for index in range(count)]
@@ -5,11 +5,25 @@ Standalone PaddleOCR-based text recognition with no external dependencies.
 Text Recognition: PaddleOCR for text extraction (true OCR)
 """
 
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
 
 import cv2
 import numpy as np
-import paddleocr
+
+from .cache import cached_result
+from .ocr_engines import (
+    RECOGNITION_BATCH_SIZE,
+    get_ocr_engine_manager,
+    get_text_recognizer_manager,
+    has_recognition_model,
+)
+from .ocr_workers import get_ocr_worker_pool
+from .spatial import SpatialIndex, expand_to_cover
+from .text_index import TextIndex, normalize_text
 
 
 @dataclass
@@ -48,69 +62,102 @@ def extract_text(
         for result in text_results:
             print(f"Found text: '{result.text}' at {result.center}")
     """
-    # Initialize PaddleOCR with new API
-    ocr = paddleocr.PaddleOCR(use_textline_orientation=True, lang=language)
-
-    # Run OCR using new predict method
+    # Failed OCR runs are reported as no text and never cached
     try:
+        return _extract_text(image, language, confidence_threshold, max_results)
+    except Exception as e:
+        print(f"OCR error: {e}")
+        return []
+
+
+@cached_result("extract_text")
+def _extract_text(
+    image: np.ndarray, language: str, confidence_threshold: float, max_results: int
+) -> list[TextResult]:
+    """Run OCR in a worker process if a pool is running, otherwise in this process"""
+    pool = get_ocr_worker_pool()
+    if pool is not None:
+        return pool.extract_text(image, language, confidence_threshold, max_results)
+    return _run_ocr(image, language, confidence_threshold, max_results)
+
+
+def _run_ocr(
+    image: np.ndarray, language: str, confidence_threshold: float, max_results: int
+) -> list[TextResult]:
+    """Run OCR and convert page results to TextResult objects"""
+    # Run OCR on a pooled, already-initialized PaddleOCR engine
+    with get_ocr_engine_manager().engine(language) as ocr:
         results = ocr.predict(image)
 
-        if not results:
-            return []
-
-        text_results = []
-
-        # Process each page result (usually just one for single image)
-        for page_result in results:
-            if not page_result:
-                continue
-
-            # Extract text data from OCRResult object
-            rec_texts = page_result.get("rec_texts", [])
-            rec_scores = page_result.get("rec_scores", [])
-            rec_polys = page_result.get("rec_polys", [])
-
-            # Process each detected text
-            for i, (text, confidence, bbox_points) in enumerate(
-                zip(rec_texts, rec_scores, rec_polys, strict=False)
-            ):
-                if confidence < confidence_threshold:
-                    continue
-
-                # Convert bbox points to integer coordinates
-                bbox_points = [(int(x), int(y)) for x, y in bbox_points]
-
-                # Calculate rectangular bounding box
-                x_coords = [point[0] for point in bbox_points]
-                y_coords = [point[1] for point in bbox_points]
-
-                x1, y1 = min(x_coords), min(y_coords)
-                x2, y2 = max(x_coords), max(y_coords)
-
-                # Calculate center and area
-                center_x = (x1 + x2) // 2
-                center_y = (y1 + y2) // 2
-                area = (x2 - x1) * (y2 - y1)
-
-                text_result = TextResult(
-                    text=text.strip(),
-                    confidence=confidence,
-                    bbox=bbox_points,
-                    rect_bbox=(x1, y1, x2, y2),
-                    center=(center_x, center_y),
-                    area=area,
-                )
+    text_results = []
 
-                text_results.append(text_result)
+    # Process each page result (usually just one for single image)
+    for page_result in results or []:
+        text_results.extend(_parse_page_result(page_result, confidence_threshold))
 
-        # Sort by confidence and limit results
-        text_results.sort(key=lambda x: x.confidence, reverse=True)
-        return text_results[:max_results]
+    # Sort by confidence and limit results
+    text_results.sort(key=lambda x: x.confidence, reverse=True)
+    return text_results[:max_results]
 
-    except Exception as e:
-        print(f"OCR error: {e}")
+
+def _parse_page_result(page_result, confidence_threshold: float) -> list[TextResult]:
+    """Convert one PaddleOCR page result to TextResult objects"""
+    if not page_result:
         return []
 
+    text_results = []
+
+    # Extract text data from OCRResult object
+    rec_texts = page_result.get("rec_texts", [])
+    rec_scores = page_result.get("rec_scores", [])
+    rec_polys = page_result.get("rec_polys", [])
+
+    # Process each detected text
+    for text, confidence, bbox_points in zip(rec_texts, rec_scores, rec_polys, strict=False):
+        if confidence < confidence_threshold:
+            continue
+
+        # Convert bbox points to integer coordinates
+        bbox_points = [(int(x), int(y)) for x, y in bbox_points]
+
+        # Calculate rectangular bounding box
+        x_coords = [point[0] for point in bbox_points]
+        y_coords = [point[1] for point in bbox_points]
+
+        x1, y1 = min(x_coords), min(y_coords)
+        x2, y2 = max(x_coords), max(y_coords)
+
+        # Calculate center and area
+        center_x = (x1 + x2) // 2
+        center_y = (y1 + y2) // 2
+        area = (x2 - x1) * (y2 - y1)
+
+        text_result = TextResult(
+            text=text.strip(),
+            confidence=confidence,
+            bbox=bbox_points,
+            rect_bbox=(x1, y1, x2, y2),
+            center=(center_x, center_y),
+            area=area,
+        )
+
+        text_results.append(text_result)
+
+    return text_results
+
+
+def _offset_text_result(result: TextResult, dx: int, dy: int) -> TextResult:
+    """Shift a crop-relative text result into full-image coordinates"""
+    rx1, ry1, rx2, ry2 = result.rect_bbox
+    return TextResult(
+        text=result.text,
+        confidence=result.confidence,
+        bbox=[(x + dx, y + dy) for x, y in result.bbox],
+        rect_bbox=(rx1 + dx, ry1 + dy, rx2 + dx, ry2 + dy),
+        center=(result.center[0] + dx, result.center[1] + dy),
+        area=result.area,
+    )
+
 
 def extract_text_from_region(
     image: np.ndarray,
@@ -143,30 +190,457 @@ def extract_text_from_region(
     text_results = extract_text(cropped_image, language, confidence_threshold)
 
     # Adjust coordinates to full image
-    adjusted_results = []
-    for result in text_results:
-        # Adjust bbox points
-        adjusted_bbox = [(x + x1, y + y1) for x, y in result.bbox]
-
-        # Adjust rect_bbox
-        rx1, ry1, rx2, ry2 = result.rect_bbox
-        adjusted_rect_bbox = (rx1 + x1, ry1 + y1, rx2 + x1, ry2 + y1)
-
-        # Adjust center
-        adjusted_center = (result.center[0] + x1, result.center[1] + y1)
-
-        adjusted_result = TextResult(
-            text=result.text,
-            confidence=result.confidence,
-            bbox=adjusted_bbox,
-            rect_bbox=adjusted_rect_bbox,
-            center=adjusted_center,
-            area=result.area,
+    return [_offset_text_result(result, x1, y1) for result in text_results]
+
+
+def extract_text_from_regions(
+    image: np.ndarray,
+    regions: list[tuple[int, int, int, int]],
+    language: str = "en",
+    confidence_threshold: float = 0.5,
+    single_line: bool | list[bool] = False,
+) -> list[list[TextResult]]:
+    """
+    Extract text from many regions of one image in a single batched OCR pass
+
+    Args:
+        image: Input image as numpy array
+        regions: Region coordinates (x1, y1, x2, y2) to crop
+        language: Language code for OCR
+        confidence_threshold: Minimum confidence for results
+        single_line: Whether each region (or all regions) holds exactly one line of
+            text. Single-line regions skip text detection and only run recognition
+
+    Returns:
+        One list of TextResult objects per region, with coordinates in the full image
+
+    Example:
+        # Read three form fields, each a single line
+        name, dob, mrn = extract_text_from_regions(image, field_boxes, single_line=True)
+    """
+    if isinstance(single_line, bool):
+        single_line = [single_line] * len(regions)
+    if len(single_line) != len(regions):
+        raise ValueError("single_line must be a bool or have one entry per region")
+
+    # Failed OCR runs are reported as no text and never cached
+    try:
+        return _extract_text_from_regions(
+            image, regions, language, confidence_threshold, single_line
+        )
+    except Exception as e:
+        print(f"OCR error: {e}")
+        return [[] for _ in regions]
+
+
+@cached_result("extract_text_from_regions")
+def _extract_text_from_regions(
+    image: np.ndarray,
+    regions: list[tuple[int, int, int, int]],
+    language: str,
+    confidence_threshold: float,
+    single_line: list[bool],
+) -> list[list[TextResult]]:
+    """Crop regions and run detection+recognition or recognition-only batches"""
+    height, width = image.shape[:2]
+    results: list[list[TextResult]] = [[] for _ in regions]
+
+    # Clip regions to the image and split by pipeline
+    line_regions, block_regions = [], []
+    for i, (x1, y1, x2, y2) in enumerate(regions):
+        x1, x2 = max(0, min(x1, width)), max(0, min(x2, width))
+        y1, y2 = max(0, min(y1, height)), max(0, min(y2, height))
+        if x2 <= x1 or y2 <= y1:
+            continue
+        if single_line[i] and has_recognition_model(language):
+            line_regions.append((i, (x1, y1, x2, y2)))
+        else:
+            block_regions.append((i, (x1, y1, x2, y2)))
+
+    # Full pipeline, all crops in one predict call
+    if block_regions:
+        crops = [image[y1:y2, x1:x2] for _, (x1, y1, x2, y2) in block_regions]
+        with get_ocr_engine_manager().engine(language) as ocr:
+            pages = ocr.predict(crops)
+
+        for (i, (x1, y1, _, _)), page_result in zip(block_regions, pages, strict=True):
+            page_results = _parse_page_result(page_result, confidence_threshold)
+            results[i] = [_offset_text_result(result, x1, y1) for result in page_results]
+
+    # Recognition only, the region itself is the text line box
+    if line_regions:
+        crops = [image[y1:y2, x1:x2] for _, (x1, y1, x2, y2) in line_regions]
+        outputs = _recognize_crops(crops, language)
+
+        for (i, box), (text, confidence) in zip(line_regions, outputs, strict=True):
+            if text and confidence >= confidence_threshold:
+                results[i] = [_corner_text_result(text, confidence, box)]
+
+    for region_results in results:
+        region_results.sort(key=lambda x: x.confidence, reverse=True)
+    return results
+
+
+@dataclass
+class OCRScalePolicy:
+    """When the two-stage OCR mode trusts its reduced-resolution pass"""
+
+    scale: float = 0.5  # pre-pass resolution relative to the input image
+    min_confidence: float = 0.85  # lower pre-pass confidence is re-read at full resolution
+    min_text_height: int = 16  # shorter text (full-resolution pixels) is re-read
+    padding: int = 8  # pixels added around re-read regions
+    max_refine_fraction: float = 0.5  # re-read the whole image when regions cover more
+
+
+# Pre-pass keeps low-confidence text so it can be re-read, so allow more results
+PREPASS_MAX_RESULTS = 1000
+
+
+@dataclass
+class _StageStats:
+    """Work done by one stage of the two-stage OCR mode"""
+
+    runs: int = 0
+    pixels: int = 0
+    regions: int = 0
+    texts: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class _TwoStageStats:
+    calls: int = 0
+    stages: dict[str, _StageStats] = field(
+        default_factory=lambda: {name: _StageStats() for name in ("prepass", "refine", "full")}
+    )
+
+
+_two_stage_stats = _TwoStageStats()
+_two_stage_lock = threading.Lock()
+
+
+def extract_text_two_stage(
+    image: np.ndarray,
+    language: str = "en",
+    confidence_threshold: float = 0.5,
+    max_results: int = 100,
+    policy: OCRScalePolicy | None = None,
+) -> list[TextResult]:
+    """
+    Extract text with a reduced-resolution pass plus full-resolution re-reads
+
+    The whole image is read at policy.scale first. Text read with high confidence
+    and tall enough is kept; everything else is re-read at full resolution in one
+    batched region pass. Text too small to be detected at all in the pre-pass is
+    not re-read, so choose the scale for the smallest text that matters.
+
+    Args:
+        image: Input image as numpy array (BGR format from cv2)
+        language: Language code for OCR
+        confidence_threshold: Minimum confidence for text results (0.0-1.0)
+        max_results: Maximum number of text results to return
+        policy: Scaling policy (OCRScalePolicy defaults if None)
+
+    Returns:
+        List of TextResult objects in full-image coordinates sorted by confidence
+
+    Example:
+        policy = OCRScalePolicy(scale=0.5, min_text_height=20)
+        text_results = extract_text_two_stage(image, policy=policy)
+    """
+    policy = policy or OCRScalePolicy()
+    with _two_stage_lock:
+        _two_stage_stats.calls += 1
+
+    if policy.scale >= 1.0:
+        return _run_stage(
+            "full", image, lambda: extract_text(image, language, confidence_threshold, max_results)
+        )
+
+    # Failed OCR runs are reported as no text and never cached
+    try:
+        return _extract_text_two_stage(image, language, confidence_threshold, max_results, policy)
+    except Exception as e:
+        print(f"OCR error: {e}")
+        return []
+
+
+def get_two_stage_ocr_stats() -> dict[str, Any]:
+    """Get work done by each stage of extract_text_two_stage"""
+    with _two_stage_lock:
+        return {
+            "calls": _two_stage_stats.calls,
+            "stages": {
+                name: {
+                    "runs": stage.runs,
+                    "pixels": stage.pixels,
+                    "regions": stage.regions,
+                    "texts": stage.texts,
+                    "seconds": stage.seconds,
+                }
+                for name, stage in _two_stage_stats.stages.items()
+            },
+        }
+
+
+def reset_two_stage_ocr_stats():
+    """Reset extract_text_two_stage metrics"""
+    global _two_stage_stats
+    with _two_stage_lock:
+        _two_stage_stats = _TwoStageStats()
+
+
+def _extract_text_two_stage(
+    image: np.ndarray,
+    language: str,
+    confidence_threshold: float,
+    max_results: int,
+    policy: OCRScalePolicy,
+) -> list[TextResult]:
+    height, width = image.shape[:2]
+    small = cv2.resize(
+        image,
+        (max(1, round(width * policy.scale)), max(1, round(height * policy.scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+    scale_x, scale_y = width / small.shape[1], height / small.shape[0]
+
+    prepass = _run_stage(
+        "prepass",
+        small,
+        lambda: _extract_text(small, language, 0.0, PREPASS_MAX_RESULTS),
+    )
+    prepass = [_scale_text_result(result, scale_x, scale_y) for result in prepass]
+
+    # Regions around text the pre-pass cannot be trusted on
+    regions = []
+    for result in prepass:
+        x1, y1, x2, y2 = result.rect_bbox
+        if result.confidence < policy.min_confidence or y2 - y1 < policy.min_text_height:
+            regions.append(
+                (
+                    max(0, x1 - policy.padding),
+                    max(0, y1 - policy.padding),
+                    min(width, x2 + policy.padding),
+                    min(height, y2 + policy.padding),
+                )
+            )
+
+    if not regions:
+        kept = [result for result in prepass if result.confidence >= confidence_threshold]
+        return kept[:max_results]
+
+    # Re-read whole lines only, and never the same text twice
+    regions, covered = expand_to_cover(regions, [result.rect_bbox for result in prepass])
+    refine_area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in regions)
+    if refine_area > policy.max_refine_fraction * width * height:
+        return _run_stage(
+            "full",
+            image,
+            lambda: _extract_text(image, language, confidence_threshold, max_results),
         )
 
-        adjusted_results.append(adjusted_result)
+    refined = _run_stage(
+        "refine",
+        None,
+        lambda: _extract_text_from_regions(
+            image, regions, language, confidence_threshold, [False] * len(regions)
+        ),
+        regions=regions,
+    )
+
+    kept = [
+        result
+        for i, result in enumerate(prepass)
+        if i not in covered and result.confidence >= confidence_threshold
+    ]
+    text_results = kept + [result for results in refined for result in results]
+    text_results.sort(key=lambda x: x.confidence, reverse=True)
+    return text_results[:max_results]
+
+
+def _run_stage(
+    name: str,
+    image: np.ndarray | None,
+    run: Callable[[], Any],
+    regions: list[tuple[int, int, int, int]] | None = None,
+) -> Any:
+    """Run one two-stage OCR stage and record its work"""
+    start_time = time.perf_counter()
+    results = run()
+    elapsed = time.perf_counter() - start_time
+
+    if regions is None:
+        pixels, texts = image.shape[0] * image.shape[1], len(results)
+    else:
+        pixels = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in regions)
+        texts = sum(len(region_results) for region_results in results)
+
+    with _two_stage_lock:
+        stage = _two_stage_stats.stages[name]
+        stage.runs += 1
+        stage.pixels += pixels
+        stage.regions += len(regions or ())
+        stage.texts += texts
+        stage.seconds += elapsed
+    return results
+
+
+def _scale_text_result(result: TextResult, scale_x: float, scale_y: float) -> TextResult:
+    """Map a text result from a resized image back to original coordinates"""
+    bbox = [(round(x * scale_x), round(y * scale_y)) for x, y in result.bbox]
+    rx1, ry1, rx2, ry2 = result.rect_bbox
+    x1, y1 = round(rx1 * scale_x), round(ry1 * scale_y)
+    x2, y2 = round(rx2 * scale_x), round(ry2 * scale_y)
+    return TextResult(
+        text=result.text,
+        confidence=result.confidence,
+        bbox=bbox,
+        rect_bbox=(x1, y1, x2, y2),
+        center=((x1 + x2) // 2, (y1 + y2) // 2),
+        area=(x2 - x1) * (y2 - y1),
+    )
+
+
+def recognize_text(
+    image: np.ndarray,
+    boxes: list[tuple[int, int, int, int] | list[tuple[int, int]]],
+    language: str = "en",
+    confidence_threshold: float = 0.5,
+) -> list[TextResult | None]:
+    """
+    Read text in known text line boxes with the recognition model only
+
+    Skips text detection entirely, so re-reading a label whose box is already known
+    (a detection, a previous OCR result, a form field) costs one batched recognition
+    call instead of a full-frame OCR pass.
+
+    Args:
+        image: Input image as numpy array
+        boxes: Text line boxes, each (x1, y1, x2, y2) or 4 corner points (e.g. a
+            previous TextResult.bbox). Rotated corner boxes are rectified first
+        language: Language code with a recognition model (see RECOGNITION_MODELS)
+        confidence_threshold: Minimum confidence for results
+
+    Returns:
+        One TextResult per box, or None where no text was read above the threshold
+
+    Example:
+        label = extract_text(image)[0]
+        reread = recognize_text(new_image, [label.bbox])[0]
+    """
+    if not has_recognition_model(language):
+        raise ValueError(f"No recognition model for language: {language}")
+
+    # Failed OCR runs are reported as no text and never cached
+    try:
+        return _recognize_text(image, boxes, language, confidence_threshold)
+    except Exception as e:
+        print(f"OCR error: {e}")
+        return [None] * len(boxes)
+
+
+@cached_result("recognize_text")
+def _recognize_text(
+    image: np.ndarray,
+    boxes: list[tuple[int, int, int, int] | list[tuple[int, int]]],
+    language: str,
+    confidence_threshold: float,
+) -> list[TextResult | None]:
+    """Crop boxes and run recognition-only batches"""
+    results: list[TextResult | None] = [None] * len(boxes)
+
+    crops, positions = [], []
+    for i, box in enumerate(boxes):
+        crop = _crop_text_box(image, box)
+        if crop is not None:
+            crops.append(crop)
+            positions.append(i)
+
+    outputs = _recognize_crops(crops, language)
+    for i, (text, confidence) in zip(positions, outputs, strict=True):
+        if text and confidence >= confidence_threshold:
+            results[i] = _corner_text_result(text, confidence, boxes[i])
+    return results
+
+
+def _recognize_crops(crops: list[np.ndarray], language: str) -> list[tuple[str, float]]:
+    """Run the recognition model on text line crops, returning (text, confidence) per crop"""
+    if not crops:
+        return []
+
+    # Batch crops of similar aspect ratio together so each batch pads less
+    order = sorted(range(len(crops)), key=lambda i: crops[i].shape[1] / crops[i].shape[0])
+    with get_text_recognizer_manager().engine(language) as recognizer:
+        outputs = recognizer.predict(
+            [crops[i] for i in order], batch_size=min(len(crops), RECOGNITION_BATCH_SIZE)
+        )
 
-    return adjusted_results
+    results: list[tuple[str, float]] = [("", 0.0)] * len(crops)
+    for i, output in zip(order, outputs, strict=True):
+        results[i] = (output["rec_text"].strip(), float(output["rec_score"]))
+    return results
+
+
+def _crop_text_box(
+    image: np.ndarray, box: tuple[int, int, int, int] | list[tuple[int, int]]
+) -> np.ndarray | None:
+    """Crop a rectangle or rectify a 4-corner text box, None if empty after clipping"""
+    height, width = image.shape[:2]
+    points = _box_corners(box)
+    bounds = (*points.min(axis=0), *points.max(axis=0))
+
+    x1, y1 = int(np.floor(bounds[0])), int(np.floor(bounds[1]))
+    x2, y2 = int(np.ceil(bounds[2])), int(np.ceil(bounds[3]))
+    x1, x2 = max(0, min(x1, width)), max(0, min(x2, width))
+    y1, y2 = max(0, min(y1, height)), max(0, min(y2, height))
+    if x2 <= x1 or y2 <= y1:
+        return None
+
+    # Axis-aligned boxes are a plain slice, rotated ones are warped upright
+    if np.array_equal(points, _box_corners(bounds)):
+        return image[y1:y2, x1:x2]
+
+    top, right, bottom, left = (np.linalg.norm(points[i] - points[(i + 1) % 4]) for i in range(4))
+    crop_width, crop_height = int(max(top, bottom)), int(max(left, right))
+    if crop_width < 1 or crop_height < 1:
+        return None
+
+    target = np.float32([[0, 0], [crop_width, 0], [crop_width, crop_height], [0, crop_height]])
+    matrix = cv2.getPerspectiveTransform(points, target)
+    crop = cv2.warpPerspective(
+        image, matrix, (crop_width, crop_height), borderMode=cv2.BORDER_REPLICATE
+    )
+
+    # Vertical text lines are read rotated, as PaddleOCR does for its own crops
+    if crop_height >= 1.5 * crop_width:
+        crop = np.rot90(crop)
+    return crop
+
+
+def _box_corners(box: tuple[int, int, int, int] | list[tuple[int, int]]) -> np.ndarray:
+    """Corner points (top-left, top-right, bottom-right, bottom-left) of a box"""
+    if len(box) == 4 and np.isscalar(box[0]):
+        x1, y1, x2, y2 = box
+        return np.float32([[x1, y1], [x2, y1], [x2, y2], [x1, y2]])
+    return np.asarray(box, dtype=np.float32).reshape(4, 2)
+
+
+def _corner_text_result(
+    text: str, confidence: float, box: tuple[int, int, int, int] | list[tuple[int, int]]
+) -> TextResult:
+    """TextResult for text recognized in a known rectangle or corner box"""
+    points = _box_corners(box).round().astype(int)
+    x1, y1 = points.min(axis=0)
+    x2, y2 = points.max(axis=0)
+    return TextResult(
+        text=text,
+        confidence=confidence,
+        bbox=[(int(x), int(y)) for x, y in points],
+        rect_bbox=(int(x1), int(y1), int(x2), int(y2)),
+        center=(int(x1 + x2) // 2, int(y1 + y2) // 2),
+        area=int((x2 - x1) * (y2 - y1)),
+    )
 
 
 def find_text_by_content(
@@ -183,11 +657,11 @@ def find_text_by_content(
         image: Input image
         target_text: Text to search for
         language: Language for OCR
-        similarity_threshold: Minimum similarity for matches (0-1)
-        case_sensitive: Whether to match case exactly
+        similarity_threshold: Minimum similarity for fuzzy matches (0-1)
+        case_sensitive: Whether to match case exactly (fuzzy matches ignore case)
 
     Returns:
-        List of matching TextResult objects
+        List of matching TextResult objects, best matches first
 
     Example:
         # Find all occurrences of "Submit" button
@@ -195,20 +669,23 @@ def find_text_by_content(
     """
     # Extract all text
     all_text = extract_text(image, language)
-    matches = []
-
-    # Prepare target text for comparison
-    target = target_text.strip()
-    if not case_sensitive:
-        target = target.lower()
 
-    for text_result in all_text:
-        detected = text_result.text.strip()
-        if not case_sensitive:
-            detected = detected.lower()
-
-        # Simple substring matching
-        if target in detected or detected in target:
+    # Target inside detected text, or within similarity_threshold of it
+    target = normalize_text(target_text, case_sensitive)
+    found = TextIndex(all_text).search(
+        target_text,
+        mode="fuzzy",
+        case_sensitive=case_sensitive,
+        max_distance=int(len(target) * (1 - similarity_threshold)),
+        min_score=similarity_threshold,
+    )
+    matches = [match.result for match in found]
+    matched = {match.index for match in found}
+
+    # Detected text that is part of the target (e.g. "Submit" for "Submit Form")
+    for i, text_result in enumerate(all_text):
+        detected = normalize_text(text_result.text, case_sensitive)
+        if i not in matched and detected and detected in target:
             matches.append(text_result)
 
     return matches
@@ -233,20 +710,17 @@ def get_text_near_point(
     all_text = extract_text(image, language)
     nearby_text = []
 
-    px, py = point
-
-    for text_result in all_text:
-        tx, ty = text_result.center
-        distance = ((tx - px) ** 2 + (ty - py) ** 2) ** 0.5
-
-        if distance <= radius:
-            # Add distance info for sorting
-            text_result_with_distance = text_result
-            text_result_with_distance.distance = distance  # type: ignore
-            nearby_text.append(text_result_with_distance)
-
-    # Sort by distance
-    nearby_text.sort(key=lambda x: getattr(x, "distance", float("inf")))
+    # Look up text centers within the radius
+    index = SpatialIndex(
+        [result.rect_bbox for result in all_text], centers=[result.center for result in all_text]
+    )
+    indices, distances = index.within_radius(point, radius)
+
+    for i, distance in zip(indices.tolist(), distances.tolist(), strict=True):
+        # Add distance info
+        text_result_with_distance = all_text[i]
+        text_result_with_distance.distance = distance  # type: ignore
+        nearby_text.append(text_result_with_distance)
 
     return nearby_text
 
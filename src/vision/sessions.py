@@ -0,0 +1,515 @@
+"""ONNX Runtime Session Registry
+
+Process-wide cache of ONNX Runtime inference sessions so model load and graph
+optimization happen once per process instead of once per call.
+
+Session Management: Shared, thread-safe access to warm YOLO sessions
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+import numpy as np
+import onnxruntime as ort
+
+# Session key: (absolute model path, providers, session option items)
+SessionKey = tuple[str, tuple[str, ...], tuple[tuple[str, Any], ...]]
+
+# String values accepted for enum-typed session options
+_EXECUTION_MODES = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+_OPTIMIZATION_LEVELS = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+@dataclass(frozen=True)
+class ExecutionProfile:
+    """Named ONNX Runtime threading, optimization and memory settings"""
+
+    name: str
+    intra_op_num_threads: int = 0  # 0 lets ONNX Runtime use all physical cores
+    inter_op_num_threads: int = 0
+    execution_mode: str = "sequential"
+    graph_optimization_level: str = "all"
+    enable_cpu_mem_arena: bool = True
+    enable_mem_pattern: bool = True
+
+    def session_options(self) -> dict[str, Any]:
+        """Get ort.SessionOptions attributes for this profile"""
+        return {
+            "intra_op_num_threads": self.intra_op_num_threads,
+            "inter_op_num_threads": self.inter_op_num_threads,
+            "execution_mode": self.execution_mode,
+            "graph_optimization_level": self.graph_optimization_level,
+            "enable_cpu_mem_arena": self.enable_cpu_mem_arena,
+            "enable_mem_pattern": self.enable_mem_pattern,
+        }
+
+
+EXECUTION_PROFILES = {
+    # One detection as fast as possible: all cores, full optimization (ORT defaults)
+    "latency": ExecutionProfile(name="latency"),
+    # Many agents per host: one thread per session so sessions don't oversubscribe cores
+    "throughput": ExecutionProfile(
+        name="throughput", intra_op_num_threads=1, inter_op_num_threads=1
+    ),
+    # Dense packing on small nodes: no memory arena or pattern planning
+    "low_memory": ExecutionProfile(
+        name="low_memory",
+        intra_op_num_threads=1,
+        inter_op_num_threads=1,
+        graph_optimization_level="basic",
+        enable_cpu_mem_arena=False,
+        enable_mem_pattern=False,
+    ),
+}
+
+
+@dataclass
+class SessionEntry:
+    """A loaded inference session and its cached input metadata"""
+
+    session: ort.InferenceSession
+    model_path: str
+    input_name: str
+    input_shape: list[Any]
+    load_time: float
+    hits: int = 0
+    last_used: float = field(default_factory=time.time)
+    source_path: str | None = None  # Original model when loaded from an optimized copy
+
+    # Per-thread scratch space (e.g. reusable input buffers) tied to this session
+    local: threading.local = field(default_factory=threading.local)
+
+
+@dataclass
+class SessionStats:
+    """Registry-wide session statistics"""
+
+    loads: int = 0
+    hits: int = 0
+    unloads: int = 0
+    total_load_time: float = 0.0
+
+
+class SessionRegistry:
+    """Thread-safe registry of ONNX Runtime sessions keyed by model and options"""
+
+    def __init__(self):
+        self._entries: dict[SessionKey, SessionEntry] = {}
+        self._load_locks: dict[SessionKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = SessionStats()
+
+    def get(
+        self,
+        model_path: str,
+        providers: list[str] | None = None,
+        session_options: dict[str, Any] | None = None,
+        warmup: bool = True,
+        source_path: str | None = None,
+    ) -> SessionEntry:
+        """
+        Get a session for a model, loading it on first use
+
+        Args:
+            model_path: Path to ONNX model
+            providers: Execution providers (defaults to CPU)
+            session_options: ort.SessionOptions attributes to apply (e.g. intra_op_num_threads)
+            warmup: Run one dummy inference after loading to allocate buffers
+            source_path: Original model model_path was derived from (e.g. optimized),
+                so the session can be unloaded by either path
+
+        Returns:
+            SessionEntry with the shared session
+        """
+        key = _make_key(model_path, providers, session_options)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._record_hit(entry)
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so other models stay available
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return self._record_hit(entry)
+
+            entry = _load_session(key, warmup)
+            if source_path is not None and os.path.abspath(source_path) != key[0]:
+                entry.source_path = os.path.abspath(source_path)
+
+            with self._lock:
+                self._entries[key] = entry
+                self._stats.loads += 1
+                self._stats.total_load_time += entry.load_time
+
+        return entry
+
+    def preload(
+        self,
+        model_path: str,
+        providers: list[str] | None = None,
+        session_options: dict[str, Any] | None = None,
+        source_path: str | None = None,
+    ) -> SessionEntry:
+        """Load and warm up a session ahead of the first request"""
+        return self.get(
+            model_path, providers, session_options, warmup=True, source_path=source_path
+        )
+
+    def unload(self, model_path: str | None = None) -> int:
+        """
+        Drop cached sessions
+
+        Args:
+            model_path: Only unload sessions for this model, including sessions loaded
+                from a copy derived from it (all sessions if None)
+
+        Returns:
+            Number of sessions unloaded
+        """
+        target = os.path.abspath(model_path) if model_path else None
+
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if target is None or target in (key[0], entry.source_path)
+            ]
+            for key in keys:
+                del self._entries[key]
+                self._load_locks.pop(key, None)
+            self._stats.unloads += len(keys)
+
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Get registry statistics"""
+        with self._lock:
+            return {
+                "loads": self._stats.loads,
+                "hits": self._stats.hits,
+                "unloads": self._stats.unloads,
+                "total_load_time": self._stats.total_load_time,
+                "loaded_sessions": [
+                    {
+                        "model_path": entry.model_path,
+                        "providers": list(key[1]),
+                        "options": dict(key[2]),
+                        "load_time": entry.load_time,
+                        "hits": entry.hits,
+                    }
+                    for key, entry in self._entries.items()
+                ],
+            }
+
+    def _record_hit(self, entry: SessionEntry) -> SessionEntry:
+        entry.hits += 1
+        entry.last_used = time.time()
+        self._stats.hits += 1
+        return entry
+
+
+def _make_key(
+    model_path: str, providers: list[str] | None, session_options: dict[str, Any] | None
+) -> SessionKey:
+    """Build a hashable registry key"""
+    return (
+        os.path.abspath(model_path),
+        tuple(providers or ["CPUExecutionProvider"]),
+        tuple(sorted((session_options or {}).items())),
+    )
+
+
+def _load_session(key: SessionKey, warmup: bool) -> SessionEntry:
+    """Create an inference session for a registry key"""
+    model_path, providers, option_items = key
+
+    options = ort.SessionOptions()
+    for name, value in option_items:
+        if name == "execution_mode" and isinstance(value, str):
+            value = _EXECUTION_MODES[value]
+        elif name == "graph_optimization_level" and isinstance(value, str):
+            value = _OPTIMIZATION_LEVELS[value]
+        setattr(options, name, value)
+
+    start_time = time.perf_counter()
+    session = ort.InferenceSession(model_path, sess_options=options, providers=list(providers))
+
+    model_input = session.get_inputs()[0]
+    input_shape = list(model_input.shape)
+
+    if warmup and all(isinstance(dim, int) for dim in input_shape):
+        session.run(None, {model_input.name: np.zeros(input_shape, dtype=np.float32)})
+
+    load_time = time.perf_counter() - start_time
+
+    return SessionEntry(
+        session=session,
+        model_path=model_path,
+        input_name=model_input.name,
+        input_shape=input_shape,
+        load_time=load_time,
+    )
+
+
+def _profile_from_env() -> ExecutionProfile:
+    """Build the startup profile from VISION_EXECUTION_PROFILE and thread overrides"""
+    name = os.getenv("VISION_EXECUTION_PROFILE", "latency").strip().lower()
+    profile = EXECUTION_PROFILES.get(name)
+    if profile is None:
+        print(f"Unknown VISION_EXECUTION_PROFILE '{name}', using 'latency'")
+        profile = EXECUTION_PROFILES["latency"]
+
+    overrides = {}
+    for variable, option in (
+        ("VISION_INTRA_OP_THREADS", "intra_op_num_threads"),
+        ("VISION_INTER_OP_THREADS", "inter_op_num_threads"),
+    ):
+        value = os.getenv(variable)
+        if not value:
+            continue
+        try:
+            overrides[option] = int(value)
+        except ValueError:
+            print(f"Invalid {variable} '{value}', using the '{profile.name}' profile value")
+
+    return replace(profile, **overrides)
+
+
+# Global registry instance shared by all detection calls in this process
+_registry = SessionRegistry()
+
+# Execution profile applied to sessions created without explicit options
+_active_profile = _profile_from_env()
+
+
+def set_execution_profile(name: str, **overrides: Any) -> ExecutionProfile:
+    """
+    Select the execution profile for new detector sessions
+
+    Sessions already loaded under another profile stay cached until unloaded.
+
+    Args:
+        name: Profile name ("latency", "throughput" or "low_memory")
+        **overrides: ExecutionProfile fields to override (e.g. intra_op_num_threads=2)
+
+    Returns:
+        The active ExecutionProfile
+
+    Example:
+        set_execution_profile("throughput")
+    """
+    global _active_profile
+
+    if name not in EXECUTION_PROFILES:
+        raise ValueError(
+            f"Unknown execution profile '{name}'. Choose from: {', '.join(EXECUTION_PROFILES)}"
+        )
+
+    _active_profile = replace(EXECUTION_PROFILES[name], **overrides)
+    return _active_profile
+
+
+def get_execution_profile() -> ExecutionProfile:
+    """Get the active execution profile"""
+    return _active_profile
+
+
+# Offline optimization level for cached models. EXTENDED fusions are portable across
+# CPUs, unlike the hardware-specific layout transforms added by ALL.
+OFFLINE_OPTIMIZATION_LEVEL = "extended"
+
+
+def get_optimized_model_path(
+    model_path: str, optimization_level: str = OFFLINE_OPTIMIZATION_LEVEL
+) -> str:
+    """
+    Get the cache path of an offline-optimized model
+
+    The path is keyed by ONNX Runtime version and optimization level, so upgrading
+    ONNX Runtime never loads a graph serialized by a different version. A model file
+    replaced after optimization is detected by modification time (see
+    is_optimized_model_current).
+
+    Args:
+        model_path: Path to the original ONNX model
+        optimization_level: Graph optimization level ("basic", "extended" or "all")
+
+    Returns:
+        Path like models/yolov8s.ort1.22.1-extended.onnx
+    """
+    stem, extension = os.path.splitext(model_path)
+    return f"{stem}.ort{ort.__version__}-{optimization_level}{extension}"
+
+
+def is_optimized_model_current(
+    model_path: str, optimization_level: str = OFFLINE_OPTIMIZATION_LEVEL
+) -> bool:
+    """
+    Check that the optimized model exists and was built from the current model file
+
+    Args:
+        model_path: Path to the original ONNX model
+        optimization_level: Graph optimization level ("basic", "extended" or "all")
+
+    Returns:
+        False if the optimized model is missing or older than the original model
+    """
+    optimized_path = get_optimized_model_path(model_path, optimization_level)
+    if not os.path.exists(optimized_path) or not os.path.exists(model_path):
+        return False
+    return os.path.getmtime(optimized_path) >= os.path.getmtime(model_path)
+
+
+def optimize_model(
+    model_path: str, optimization_level: str = OFFLINE_OPTIMIZATION_LEVEL, force: bool = False
+) -> str:
+    """
+    Run ONNX Runtime graph optimization once and save the optimized model
+
+    Args:
+        model_path: Path to the original ONNX model
+        optimization_level: Graph optimization level ("basic", "extended" or "all")
+        force: Re-create the optimized model even if it is up to date
+
+    Returns:
+        Path to the optimized model
+
+    Example:
+        optimized_path = optimize_model("models/yolov8s.onnx")
+    """
+    optimized_path = get_optimized_model_path(model_path, optimization_level)
+    if is_optimized_model_current(model_path, optimization_level) and not force:
+        return optimized_path
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = _OPTIMIZATION_LEVELS[optimization_level]
+    options.optimized_model_filepath = optimized_path
+    ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+    return optimized_path
+
+
+def _resolve_profile_session(model_path: str) -> tuple[str, dict[str, Any]]:
+    """Get model path and session options for the active profile"""
+    session_options = _active_profile.session_options()
+
+    optimized_path = get_optimized_model_path(model_path)
+    if is_optimized_model_current(model_path):
+        # Offline fusions are already applied; only hardware layout passes remain for "all"
+        if session_options["graph_optimization_level"] != "all":
+            session_options["graph_optimization_level"] = "disable"
+        return optimized_path, session_options
+
+    if os.path.exists(optimized_path):
+        print(f"Optimized model {optimized_path} is older than {model_path}, not using it")
+    return model_path, session_options
+
+
+def get_session(
+    model_path: str,
+    providers: list[str] | None = None,
+    session_options: dict[str, Any] | None = None,
+) -> SessionEntry:
+    """
+    Get a shared inference session, loading and warming it on first use
+
+    Args:
+        model_path: Path to ONNX model
+        providers: Execution providers (defaults to CPU)
+        session_options: ort.SessionOptions attributes. If None, the active profile is
+            used and a cached optimized model (see optimize_model) is loaded when present
+
+    Returns:
+        SessionEntry with the shared session and its input metadata
+
+    Example:
+        entry = get_session("models/yolov8s.onnx")
+        outputs = entry.session.run(None, {entry.input_name: tensor})
+    """
+    source_path = model_path
+    if session_options is None:
+        model_path, session_options = _resolve_profile_session(model_path)
+
+    return _registry.get(model_path, providers, session_options, source_path=source_path)
+
+
+def preload_model(
+    model_path: str | None = None,
+    providers: list[str] | None = None,
+    session_options: dict[str, Any] | None = None,
+) -> SessionEntry:
+    """
+    Load a model into the registry before the first detection request
+
+    Args:
+        model_path: Path to ONNX model (uses default YOLO model if None)
+        providers: Execution providers (defaults to CPU)
+        session_options: ort.SessionOptions attributes. If None, the active profile is
+            used and a cached optimized model (see optimize_model) is loaded when present
+
+    Returns:
+        SessionEntry for the preloaded session
+
+    Example:
+        # At worker startup
+        preload_model()
+    """
+    if model_path is None:
+        from .detector import _get_default_model_path
+
+        model_path = _get_default_model_path()
+
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(
+            f"ONNX model not found at {model_path}. Run setup_models() to download the model."
+        )
+
+    source_path = model_path
+    if session_options is None:
+        model_path, session_options = _resolve_profile_session(model_path)
+
+    return _registry.preload(model_path, providers, session_options, source_path=source_path)
+
+
+def unload_model(model_path: str | None = None) -> int:
+    """
+    Release cached sessions
+
+    Args:
+        model_path: Only unload sessions for this model, including ones loaded from
+            its optimized copy (all sessions if None)
+
+    Returns:
+        Number of sessions unloaded
+    """
+    return _registry.unload(model_path)
+
+
+def get_session_stats() -> dict[str, Any]:
+    """
+    Get session registry statistics
+
+    Returns:
+        Dictionary with loads, hits, unloads, total load time, loaded sessions
+        and the active execution profile
+
+    Example:
+        stats = get_session_stats()
+        print(f"{stats['hits']} hits, {stats['loads']} loads, profile {stats['profile']}")
+    """
+    return {**_registry.stats(), "profile": _active_profile.name}
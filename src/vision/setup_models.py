@@ -4,6 +4,7 @@ Downloads and manages YOLO and PaddleOCR models for computer vision tasks.
 """
 
 import os
+import sys
 from pathlib import Path
 
 import paddleocr
@@ -21,30 +22,51 @@ def get_model_paths() -> dict[str, str]:
         paths = get_model_paths()
         yolo_path = paths['yolo_onnx']
     """
+    from vision.sessions import get_optimized_model_path
+
     models_dir = Path(__file__).parent / "models"
 
     return {
         "models_dir": str(models_dir),
         "yolo_onnx": str(models_dir / "yolov8s.onnx"),
+        "yolo_onnx_optimized": get_optimized_model_path(str(models_dir / "yolov8s.onnx")),
+        "yolo_onnx_int8": str(models_dir / "yolov8s.int8.onnx"),
         "yolo_pt": str(models_dir / "yolov8s.pt"),
     }
 
 
-def download_models() -> dict[str, str]:
+def download_models(
+    quantize: str | None = None, calibration_dir: str | None = None
+) -> dict[str, str]:
     """
     Download and setup all required models
 
+    Args:
+        quantize: Also create the INT8 detector ("dynamic" or "static"), used by
+            model_variant="int8". Defaults to VISION_QUANTIZE; skipped if unset
+        calibration_dir: Screenshots for static quantization (defaults to
+            VISION_QUANTIZE_CALIBRATION_DIR)
+
     Returns:
         Dictionary with downloaded model paths
 
     Example:
         paths = download_models()
         print(f"Models ready at: {paths}")
+
+        # Also build the INT8 detector for CPU-only nodes
+        download_models(quantize="dynamic")
     """
     print("🔍 Setting up computer vision models...")
 
+    quantize = quantize or os.getenv("VISION_QUANTIZE") or None
+    calibration_dir = calibration_dir or os.getenv("VISION_QUANTIZE_CALIBRATION_DIR") or None
+
     # Setup YOLO
     yolo_path = setup_yolo_model()
+    setup_optimized_yolo_model(yolo_path)
+    if quantize:
+        setup_quantized_yolo_model(yolo_path, mode=quantize, calibration_dir=calibration_dir)
 
     # Setup PaddleOCR
     setup_paddle_ocr()
@@ -55,9 +77,9 @@ def download_models() -> dict[str, str]:
     return paths
 
 
-def setup_models() -> dict[str, str]:
+def setup_models(quantize: str | None = None, calibration_dir: str | None = None) -> dict[str, str]:
     """Alias for download_models() for backward compatibility"""
-    return download_models()
+    return download_models(quantize, calibration_dir)
 
 
 def setup_yolo_model() -> str:
@@ -108,6 +130,140 @@ def setup_yolo_model() -> str:
     return str(onnx_path)
 
 
+def setup_optimized_yolo_model(onnx_path: str | None = None, force: bool = False) -> str:
+    """
+    Serialize an ONNX Runtime-optimized copy of the YOLO model
+
+    The detector loads this artifact when it exists, so processes skip graph
+    optimization at startup.
+
+    Args:
+        onnx_path: Path to YOLO ONNX model (uses default if None)
+        force: Re-create the optimized model even if it already exists
+
+    Returns:
+        Path to optimized ONNX model file
+    """
+    from vision.sessions import (
+        get_optimized_model_path,
+        is_optimized_model_current,
+        optimize_model,
+    )
+
+    if onnx_path is None:
+        onnx_path = get_model_paths()["yolo_onnx"]
+
+    optimized_path = get_optimized_model_path(onnx_path)
+    if is_optimized_model_current(onnx_path) and not force:
+        print(f"✅ Optimized YOLOv8s already exists: {optimized_path}")
+        return optimized_path
+
+    print("⚙️  Optimizing YOLOv8s graph for ONNX Runtime...")
+
+    try:
+        optimize_model(onnx_path, force=force)
+        print(f"✅ Optimized YOLOv8s saved to: {optimized_path}")
+
+    except Exception as e:
+        print(f"❌ YOLOv8s optimization failed: {e}")
+        raise
+
+    return optimized_path
+
+
+def setup_quantized_yolo_model(
+    onnx_path: str | None = None,
+    mode: str = "dynamic",
+    calibration_dir: str | None = None,
+    max_calibration_images: int = 50,
+    force: bool = False,
+) -> str:
+    """
+    Create an INT8 quantized copy of the YOLO model
+
+    Select it at detection time with detect_ui_elements(..., model_variant="int8").
+    Compare it against FP32 with scripts/benchmark_quantized_detector.py.
+
+    Args:
+        onnx_path: Path to FP32 YOLO ONNX model (uses default if None)
+        mode: "dynamic" (weights only) or "static" (weights and activations)
+        calibration_dir: Directory of representative screenshots (required for static)
+        max_calibration_images: Maximum screenshots used for static calibration
+        force: Re-create the quantized model even if it already exists
+
+    Returns:
+        Path to INT8 ONNX model file
+    """
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+    paths = get_model_paths()
+    if onnx_path is None:
+        onnx_path = paths["yolo_onnx"]
+    int8_path = str(Path(onnx_path).with_suffix(".int8.onnx"))
+
+    if os.path.exists(int8_path) and not force:
+        print(f"✅ YOLOv8s INT8 already exists: {int8_path}")
+        return int8_path
+
+    print(f"📉 Quantizing YOLOv8s to INT8 ({mode})...")
+
+    try:
+        if mode == "dynamic":
+            # ONNX Runtime's CPU ConvInteger kernel only supports uint8 weights
+            quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QUInt8)
+        elif mode == "static":
+            if calibration_dir is None:
+                raise ValueError("Static quantization requires calibration_dir")
+            quantize_static(
+                onnx_path,
+                int8_path,
+                _ScreenshotCalibrationReader(onnx_path, calibration_dir, max_calibration_images),
+                quant_format=QuantFormat.QDQ,
+                per_channel=True,
+                activation_type=QuantType.QUInt8,
+                weight_type=QuantType.QInt8,
+            )
+        else:
+            raise ValueError(f"Unknown quantization mode: {mode}")
+
+        print(f"✅ YOLOv8s INT8 saved to: {int8_path}")
+
+    except Exception as e:
+        print(f"❌ YOLOv8s quantization failed: {e}")
+        raise
+
+    return int8_path
+
+
+class _ScreenshotCalibrationReader:
+    """Feeds letterboxed screenshots to ONNX Runtime static quantization"""
+
+    def __init__(self, onnx_path: str, calibration_dir: str, max_images: int):
+        import cv2
+        import onnxruntime as ort
+
+        from vision.preprocess import LetterboxBuffer
+
+        model_input = ort.InferenceSession(onnx_path).get_inputs()[0]
+        self.input_name = model_input.name
+        self.buffer = LetterboxBuffer(model_input.shape[3], model_input.shape[2])
+
+        image_paths = sorted(
+            path
+            for path in Path(calibration_dir).iterdir()
+            if path.suffix.lower() in (".png", ".jpg", ".jpeg", ".bmp")
+        )
+        self.images = (cv2.imread(str(path)) for path in image_paths[:max_images])
+
+    def get_next(self) -> dict | None:
+        for image in self.images:
+            if image is None:
+                continue
+            self.buffer.fill(image)
+            return {self.input_name: self.buffer.batch(1).copy()}
+        return None
+
+
 def setup_paddle_ocr() -> bool:
     """
     Initialize PaddleOCR (downloads models on first use)
@@ -179,12 +335,26 @@ def cleanup_temp_files():
 
 
 if __name__ == "__main__":
+    import argparse
+
+    # Allow `from vision...` imports when run directly as a script
+    sys.path.append(str(Path(__file__).parent.parent))
+
+    parser = argparse.ArgumentParser(description="Download and set up vision models")
+    parser.add_argument(
+        "--quantize",
+        choices=["dynamic", "static"],
+        help="Also create the INT8 detector (model_variant='int8')",
+    )
+    parser.add_argument("--calibration-dir", help="Screenshots for --quantize static")
+    args = parser.parse_args()
+
     # Run setup when called directly
     print("Computer Vision Model Setup")
     print("=" * 40)
 
     try:
-        paths = download_models()
+        paths = download_models(quantize=args.quantize, calibration_dir=args.calibration_dir)
         print("\n📋 Model Summary:")
         for name, path in paths.items():
             print(f"  {name}: {path}")
@@ -0,0 +1,287 @@
+"""Spatial Index Over UI Element Boxes
+
+NumPy-backed uniform grid over box centers answering radius, k-nearest,
+containment and overlap queries without scanning every element.
+
+Spatial Queries: Grid bucketing of centers, exact filtering of candidate cells
+"""
+
+import math
+
+import numpy as np
+
+
+class SpatialIndex:
+    """
+    Uniform grid index over [N, 4] boxes (x1, y1, x2, y2) and their centers
+
+    Centers are bucketed into square cells stored in CSR form (one sorted index
+    array plus per-cell offsets), so a query only visits the cells its area
+    touches. All queries return indices into the original boxes.
+
+    Example:
+        index = SpatialIndex([d.bbox for d in detections])
+        nearby = index.within_radius((640, 400), radius=100)
+        closest = index.nearest((640, 400), k=3)
+    """
+
+    def __init__(
+        self,
+        boxes: np.ndarray | list,
+        centers: np.ndarray | list | None = None,
+        cell_size: float | None = None,
+    ):
+        """
+        Build the index
+
+        Args:
+            boxes: Boxes of shape [N, 4] with x1, y1, x2, y2
+            centers: Centers of shape [N, 2] (box midpoints if None)
+            cell_size: Grid cell side in pixels (about one element per cell if None)
+        """
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        if centers is None:
+            self.centers = (self.boxes[:, :2] + self.boxes[:, 2:]) / 2
+        else:
+            self.centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+
+        count = len(self.centers)
+        if count == 0:
+            self._origin = np.zeros(2)
+            self.cell_size = cell_size or 1.0
+            self._grid_width, self._grid_height = 1, 1
+            self._order = np.zeros(0, dtype=np.int64)
+            self._offsets = np.zeros(2, dtype=np.int64)
+            self._half_extent = np.zeros(2)
+            return
+
+        self._origin = self.centers.min(axis=0)
+        width, height = self.centers.max(axis=0) - self._origin
+        if cell_size is None:
+            cell_size = math.sqrt(max(width * height, 1.0) / count)
+        self.cell_size = max(float(cell_size), 1.0)
+
+        self._grid_width = int(width // self.cell_size) + 1
+        self._grid_height = int(height // self.cell_size) + 1
+
+        # CSR layout: indices sorted by cell id, offsets[cell] .. offsets[cell + 1]
+        cells = self._cell_coords(self.centers)
+        cell_ids = cells[:, 1] * self._grid_width + cells[:, 0]
+        self._order = np.argsort(cell_ids, kind="stable")
+        counts = np.bincount(cell_ids, minlength=self._grid_width * self._grid_height)
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        # Largest half box size, so box queries can search by center
+        self._half_extent = ((self.boxes[:, 2:] - self.boxes[:, :2]) / 2).max(axis=0)
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    def within_radius(
+        self, point: tuple[float, float], radius: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find elements whose center lies within a radius of a point
+
+        Args:
+            point: Query point (x, y)
+            radius: Search radius in pixels (inclusive)
+
+        Returns:
+            Tuple of (indices, distances) sorted by distance, ties by index
+        """
+        x, y = point
+        candidates = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        distances = np.hypot(self.centers[candidates, 0] - x, self.centers[candidates, 1] - y)
+
+        keep = distances <= radius
+        candidates, distances = candidates[keep], distances[keep]
+        order = np.lexsort((candidates, distances))
+        return candidates[order], distances[order]
+
+    def nearest(
+        self, point: tuple[float, float], k: int = 1, max_distance: float | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k elements with centers closest to a point
+
+        Args:
+            point: Query point (x, y)
+            k: Number of neighbours
+            max_distance: Ignore elements farther than this
+
+        Returns:
+            Tuple of (indices, distances) sorted by distance, ties by index
+        """
+        if len(self) == 0 or k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        # Grow the search ring until it holds k elements or covers the whole grid
+        limit = max_distance if max_distance is not None else math.inf
+        span = self.cell_size * (self._grid_width + self._grid_height)
+        far = np.abs(np.asarray(point, dtype=np.float64) - self._origin).sum() + span
+        radius = self.cell_size
+        while True:
+            radius = min(radius, limit)
+            indices, distances = self.within_radius(point, radius)
+            if len(indices) >= k or radius >= limit or radius >= far:
+                return indices[:k], distances[:k]
+            radius *= 2
+
+    def contained_in(self, region: tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Find elements whose box lies entirely inside a region
+
+        Args:
+            region: Region coordinates (x1, y1, x2, y2)
+
+        Returns:
+            Sorted indices of contained elements
+        """
+        rx1, ry1, rx2, ry2 = region
+        candidates = self._candidates(rx1, ry1, rx2, ry2)
+        boxes = self.boxes[candidates]
+        keep = (
+            (boxes[:, 0] >= rx1)
+            & (boxes[:, 1] >= ry1)
+            & (boxes[:, 2] <= rx2)
+            & (boxes[:, 3] <= ry2)
+        )
+        return np.sort(candidates[keep])
+
+    def centers_in(self, region: tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Find elements whose center lies inside a region (inclusive)
+
+        Args:
+            region: Region coordinates (x1, y1, x2, y2)
+
+        Returns:
+            Sorted indices of matching elements
+        """
+        rx1, ry1, rx2, ry2 = region
+        candidates = self._candidates(rx1, ry1, rx2, ry2)
+        centers = self.centers[candidates]
+        keep = (
+            (centers[:, 0] >= rx1)
+            & (centers[:, 1] >= ry1)
+            & (centers[:, 0] <= rx2)
+            & (centers[:, 1] <= ry2)
+        )
+        return np.sort(candidates[keep])
+
+    def overlapping(self, region: tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Find elements whose box overlaps a region with positive area
+
+        Args:
+            region: Region coordinates (x1, y1, x2, y2)
+
+        Returns:
+            Sorted indices of overlapping elements
+        """
+        rx1, ry1, rx2, ry2 = region
+        half_width, half_height = self._half_extent
+        candidates = self._candidates(
+            rx1 - half_width, ry1 - half_height, rx2 + half_width, ry2 + half_height
+        )
+        boxes = self.boxes[candidates]
+        keep = (boxes[:, 0] < rx2) & (boxes[:, 2] > rx1) & (boxes[:, 1] < ry2) & (boxes[:, 3] > ry1)
+        return np.sort(candidates[keep])
+
+    def _cell_coords(self, points: np.ndarray) -> np.ndarray:
+        """Grid cell (column, row) of each point, clamped to the grid"""
+        cells = np.floor((points - self._origin) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, [self._grid_width - 1, self._grid_height - 1])
+
+    def _candidates(self, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+        """Indices of all elements whose center cell intersects a rectangle"""
+        if len(self) == 0:
+            return self._order
+
+        low = (np.array([x1, y1]) - self._origin) / self.cell_size
+        high = (np.array([x2, y2]) - self._origin) / self.cell_size
+        if (high < 0).any() or low[0] >= self._grid_width or low[1] >= self._grid_height:
+            return self._order[:0]
+
+        last = [self._grid_width - 1, self._grid_height - 1]
+        col1, row1 = np.floor(np.clip(low, 0, last)).astype(np.int64)
+        col2, row2 = np.floor(np.clip(high, 0, last)).astype(np.int64)
+
+        # Cells of one grid row are contiguous in the CSR layout
+        slices = [
+            self._order[
+                self._offsets[row * self._grid_width + col1] : self._offsets[
+                    row * self._grid_width + col2 + 1
+                ]
+            ]
+            for row in range(row1, row2 + 1)
+        ]
+        return np.concatenate(slices) if slices else self._order[:0]
+
+
+def merge_overlapping_rects(
+    rects: list[tuple[int, int, int, int]],
+) -> list[tuple[int, int, int, int]]:
+    """
+    Union rectangles until none overlap
+
+    Args:
+        rects: Rectangles (x1, y1, x2, y2)
+
+    Returns:
+        Sorted, pairwise non-overlapping rectangles covering the input
+    """
+    merged: list[tuple[int, int, int, int]] = []
+    for rect in sorted(rects):
+        i = 0
+        while i < len(merged):
+            other = merged[i]
+            if (
+                rect[0] < other[2]
+                and other[0] < rect[2]
+                and rect[1] < other[3]
+                and other[1] < rect[3]
+            ):
+                rect = _union(rect, merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return sorted(merged)
+
+
+def expand_to_cover(
+    rects: list[tuple[int, int, int, int]], boxes: list[tuple[int, int, int, int]]
+) -> tuple[list[tuple[int, int, int, int]], set[int]]:
+    """
+    Grow rectangles over every box they overlap, so no box is cut by a rectangle
+
+    Args:
+        rects: Rectangles (x1, y1, x2, y2) to grow
+        boxes: Boxes (x1, y1, x2, y2) that must end up entirely inside or outside
+
+    Returns:
+        Tuple of (non-overlapping grown rectangles, indices of covered boxes)
+    """
+    index = SpatialIndex(boxes)
+    covered: set[int] = set()
+    rects = merge_overlapping_rects(rects)
+
+    while True:
+        expanded = []
+        for rect in rects:
+            hits = [i for i in index.overlapping(rect).tolist() if i not in covered]
+            covered.update(hits)
+            for i in hits:
+                rect = _union(rect, boxes[i])
+            expanded.append(rect)
+
+        expanded = merge_overlapping_rects(expanded)
+        if expanded == rects:
+            return rects, covered
+        rects = expanded
+
+
+def _union(a: tuple[int, int, int, int], b: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
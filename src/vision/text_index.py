@@ -0,0 +1,275 @@
+"""Fuzzy Text Search Over OCR Results
+
+Index built once per OCR pass answering normalized exact, prefix and substring
+lookups, plus bounded edit-distance matching that tolerates OCR noise such as
+"Subrnit" for "Submit".
+
+Text Search: Normalized lookups, trigram candidate filtering, bounded Levenshtein scoring
+"""
+
+import bisect
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .reader import TextResult
+
+# Match types from strongest to weakest
+MATCH_TYPES = ("exact", "prefix", "substring", "fuzzy")
+
+# Character sequences OCR commonly confuses, folded before fuzzy comparison
+OCR_CONFUSIONS = (("rn", "m"), ("vv", "w"), ("0", "o"), ("1", "l"), ("|", "l"))
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str, case_sensitive: bool = False) -> str:
+    """
+    Normalize text for comparison
+
+    Applies Unicode NFKC, collapses whitespace and (unless case_sensitive) casefolds.
+
+    Args:
+        text: Text to normalize
+        case_sensitive: Keep letter case
+
+    Returns:
+        Normalized text
+    """
+    text = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+    return text if case_sensitive else text.casefold()
+
+
+def text_similarity(query: str, text: str, case_sensitive: bool = False) -> float:
+    """
+    Similarity of a query to the best matching part of a text
+
+    Args:
+        query: Text to look for
+        text: Text to search in
+        case_sensitive: Whether letter case matters
+
+    Returns:
+        Score in [0, 1], 1.0 when the normalized query occurs in the text
+    """
+    query = _fold_confusions(normalize_text(query, case_sensitive))
+    text = _fold_confusions(normalize_text(text, case_sensitive))
+    if not query:
+        return 0.0
+
+    distance = _partial_edit_distance(query, text, len(query))
+    return 1.0 - distance / len(query)
+
+
+@dataclass
+class TextMatch:
+    """Text index lookup result"""
+
+    result: "TextResult"
+    index: int  # position in the indexed results
+    match_type: str  # "exact", "prefix", "substring" or "fuzzy"
+    score: float  # 1.0 for exact/prefix/substring, 1 - edits / query length for fuzzy
+
+
+class TextIndex:
+    """
+    Search index over one OCR pass
+
+    Example:
+        index = TextIndex(extract_text(image))
+        submit = index.search("Submit", mode="fuzzy")
+        fields = index.search_many(["Username", "Password"])
+    """
+
+    def __init__(self, results: list["TextResult"]):
+        """
+        Build the index
+
+        Args:
+            results: OCR results to index
+        """
+        self.results = results
+        self._normalized = [normalize_text(r.text) for r in results]
+        self._cased = [normalize_text(r.text, case_sensitive=True) for r in results]
+        self._folded = [_fold_confusions(text) for text in self._normalized]
+
+        # Exact and prefix lookups over normalized text
+        self._exact: dict[str, list[int]] = defaultdict(list)
+        for i, text in enumerate(self._normalized):
+            self._exact[text].append(i)
+        self._sorted = sorted((text, i) for i, text in enumerate(self._normalized))
+
+        # Trigram inverted index for fuzzy candidate filtering
+        self._trigrams: dict[str, list[int]] = defaultdict(list)
+        for i, text in enumerate(self._folded):
+            for gram in _trigrams(text):
+                self._trigrams[gram].append(i)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def search(
+        self,
+        query: str,
+        mode: str = "substring",
+        case_sensitive: bool = False,
+        max_distance: int | None = None,
+        min_score: float = 0.0,
+    ) -> list[TextMatch]:
+        """
+        Find OCR results matching a query
+
+        Args:
+            query: Text to look for
+            mode: "exact", "prefix", "substring" or "fuzzy". Each mode also returns
+                the stronger match types (e.g. "substring" includes exact and prefix)
+            case_sensitive: Whether letter case matters (exact/prefix/substring only)
+            max_distance: Maximum edits for fuzzy matches (about one per four
+                characters if None)
+            min_score: Drop matches scoring below this
+
+        Returns:
+            Matches ordered by match type, then score, then OCR confidence
+        """
+        return self.search_many(
+            [query], mode, case_sensitive, max_distance=max_distance, min_score=min_score
+        )[query]
+
+    def search_many(
+        self,
+        queries: list[str],
+        mode: str = "substring",
+        case_sensitive: bool = False,
+        max_distance: int | None = None,
+        min_score: float = 0.0,
+    ) -> dict[str, list[TextMatch]]:
+        """
+        Look up several queries in a single pass over the indexed text
+
+        Args:
+            queries: Texts to look for
+            mode: Weakest match type to return (see search)
+            case_sensitive: Whether letter case matters (exact/prefix/substring only)
+            max_distance: Maximum edits for fuzzy matches
+            min_score: Drop matches scoring below this
+
+        Returns:
+            Dictionary of query to its ordered matches
+        """
+        if mode not in MATCH_TYPES:
+            raise ValueError(f"Unknown text match mode: {mode}")
+        allowed = MATCH_TYPES[: MATCH_TYPES.index(mode) + 1]
+        texts = self._cased if case_sensitive else self._normalized
+
+        normalized = {query: normalize_text(query, case_sensitive) for query in queries}
+        found: dict[str, dict[int, TextMatch]] = {query: {} for query in queries}
+
+        # Exact and prefix via hash and sorted lookups (case-insensitive index)
+        if not case_sensitive:
+            for query, target in normalized.items():
+                for i in self._exact.get(target, []):
+                    found[query][i] = self._match(i, "exact", 1.0)
+                if "prefix" in allowed and target:
+                    start = bisect.bisect_left(self._sorted, (target, -1))
+                    for text, i in self._sorted[start:]:
+                        if not text.startswith(target):
+                            break
+                        found[query].setdefault(i, self._match(i, "prefix", 1.0))
+
+        # One pass over the text for everything the lookups above cannot answer
+        if case_sensitive or "substring" in allowed:
+            for i, text in enumerate(texts):
+                for query, target in normalized.items():
+                    if not target or i in found[query]:
+                        continue
+                    match_type = _containment_type(target, text)
+                    if match_type in allowed:
+                        found[query][i] = self._match(i, match_type, 1.0)
+
+        if "fuzzy" in allowed:
+            for query in queries:
+                self._add_fuzzy_matches(normalize_text(query), found[query], max_distance)
+
+        return {
+            query: sorted(
+                (m for m in matches.values() if m.score >= min_score),
+                key=lambda m: (MATCH_TYPES.index(m.match_type), -m.score, -m.result.confidence),
+            )
+            for query, matches in found.items()
+        }
+
+    def _add_fuzzy_matches(
+        self, target: str, found: dict[int, TextMatch], max_distance: int | None
+    ):
+        """Add bounded edit-distance matches for one normalized query"""
+        folded = _fold_confusions(target)
+        if not folded:
+            return
+        if max_distance is None:
+            max_distance = max(1, len(folded) // 4)
+
+        # q-gram lemma: each edit destroys at most 3 of the query's distinct trigrams
+        query_grams = _trigrams(folded)
+        required = len(query_grams) - 3 * max_distance
+        if required > 0:
+            counts = Counter(i for gram in query_grams for i in self._trigrams.get(gram, ()))
+            candidates = [i for i, count in counts.items() if count >= required]
+        else:
+            candidates = range(len(self.results))
+
+        for i in candidates:
+            if i in found:
+                continue
+            distance = _partial_edit_distance(folded, self._folded[i], max_distance)
+            if distance <= max_distance:
+                found[i] = self._match(i, "fuzzy", 1.0 - distance / len(folded))
+
+    def _match(self, index: int, match_type: str, score: float) -> TextMatch:
+        return TextMatch(self.results[index], index, match_type, score)
+
+
+def _containment_type(target: str, text: str) -> str | None:
+    if text == target:
+        return "exact"
+    if text.startswith(target):
+        return "prefix"
+    if target in text:
+        return "substring"
+    return None
+
+
+def _fold_confusions(text: str) -> str:
+    """Replace commonly confused OCR sequences with a canonical form"""
+    for confused, canonical in OCR_CONFUSIONS:
+        text = text.replace(confused, canonical)
+    return text
+
+
+def _trigrams(text: str) -> set[str]:
+    # Unpadded, so grams of a query found mid-text are all present in the text
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _partial_edit_distance(query: str, text: str, max_distance: int) -> int:
+    """
+    Fewest edits turning the query into any substring of the text
+
+    Semi-global Levenshtein: the match may start and end anywhere in the text.
+    Stops early and returns max_distance + 1 once no alignment can stay in bounds.
+    """
+    previous = [0] * (len(text) + 1)  # empty query matches anywhere for free
+    for row, query_char in enumerate(query, start=1):
+        current = [row] + [0] * len(text)
+        for col, text_char in enumerate(text, start=1):
+            current[col] = min(
+                previous[col - 1] + (query_char != text_char),
+                previous[col] + 1,
+                current[col - 1] + 1,
+            )
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous)
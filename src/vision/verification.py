@@ -6,6 +6,7 @@ instead of the old object-oriented UIFinder approach.
 Visual Verification: Screenshot comparison and visual validation
 """
 
+import math
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -13,7 +14,20 @@ from typing import Any
 import cv2
 import numpy as np
 
-from . import detect_ui_elements, extract_text_from_region, find_elements_by_text
+from .change import detect_screen_change
+from .detector import detect_ui_elements, detect_ui_elements_batch
+from .finder import ScreenIndex, find_elements_by_text
+from .reader import TextResult, extract_text_from_region, recognize_text
+from .text_index import normalize_text, text_similarity
+
+# Minimum similarity for a mismatched input to be reported as a close match
+TEXT_INPUT_SIMILARITY = 0.8
+
+# wait_for_element capture cadence: first poll, backoff ceiling and forced search,
+# all in seconds
+WAIT_POLL_INTERVAL = 0.1
+WAIT_MAX_POLL_INTERVAL = 1.0
+WAIT_HEARTBEAT = 5.0
 
 
 @dataclass
@@ -43,9 +57,8 @@ def verify_click_success(
     Returns:
         VerificationResult
     """
-    # Calculate difference between screenshots
-    diff = cv2.absdiff(before_screenshot, after_screenshot)
-    change_percentage = np.mean(diff > 10) * 100  # Pixels that changed significantly
+    # Calculate difference between screenshots on downsampled thumbnails
+    change_percentage = detect_screen_change(before_screenshot, after_screenshot).score * 100
 
     if change_percentage < 1.0:
         return VerificationResult(
@@ -58,8 +71,9 @@ def verify_click_success(
     # Look for specific changes based on expected_change
     if expected_change == "dialog":
         # Look for new dialog boxes or windows
-        elements_before = detect_ui_elements(before_screenshot, confidence_threshold=0.6)
-        elements_after = detect_ui_elements(after_screenshot, confidence_threshold=0.6)
+        elements_before, elements_after = detect_ui_elements_batch(
+            [before_screenshot, after_screenshot], confidence_threshold=0.6
+        )
 
         new_elements = len(elements_after) - len(elements_before)
         if new_elements > 0:
@@ -83,7 +97,10 @@ def verify_click_success(
 
 
 def verify_text_input(
-    screenshot: np.ndarray, input_region: tuple[int, int, int, int], expected_text: str
+    screenshot: np.ndarray,
+    input_region: tuple[int, int, int, int],
+    expected_text: str,
+    single_line: bool = True,
 ) -> VerificationResult:
     """
     Verify that text was correctly entered in an input field
@@ -92,13 +109,28 @@ def verify_text_input(
         screenshot: Screenshot after text input
         input_region: Region of the input field (x1, y1, x2, y2)
         expected_text: Text that should be present
+        single_line: Read the field as one text line with the recognition model
+            first, running full OCR on the region only if that does not verify
 
     Returns:
         VerificationResult
     """
+    if single_line:
+        reread = recognize_text(screenshot, [input_region], confidence_threshold=0.5)[0]
+        if reread is not None:
+            result = _match_input_text(screenshot, [reread], expected_text)
+            if result.success:
+                return result
+
     # Read text from the input region
     detected_text = extract_text_from_region(screenshot, input_region, confidence_threshold=0.5)
+    return _match_input_text(screenshot, detected_text, expected_text)
+
 
+def _match_input_text(
+    screenshot: np.ndarray, detected_text: list[TextResult], expected_text: str
+) -> VerificationResult:
+    """Compare the most confident text read from an input field with the expected text"""
     if not detected_text:
         return VerificationResult(
             success=False,
@@ -110,9 +142,9 @@ def verify_text_input(
     # Get the most confident text detection
     best_detection = max(detected_text, key=lambda x: x.confidence)
 
-    # Simple text matching (could be improved with fuzzy matching)
-    detected_clean = best_detection.text.strip().lower()
-    expected_clean = expected_text.strip().lower()
+    # Normalized containment only; a value one character off is a wrong value
+    detected_clean = normalize_text(best_detection.text)
+    expected_clean = normalize_text(expected_text)
 
     if expected_clean in detected_clean or detected_clean in expected_clean:
         confidence = 0.9 if detected_clean == expected_clean else 0.7
@@ -123,6 +155,16 @@ def verify_text_input(
             screenshot=screenshot,
         )
 
+    similarity = text_similarity(expected_text, best_detection.text)
+    if similarity >= TEXT_INPUT_SIMILARITY:
+        return VerificationResult(
+            success=False,
+            message=f"Text mismatch: close match: '{best_detection.text}', expected "
+            f"'{expected_text}' (similarity {similarity:.2f})",
+            confidence=0.2,
+            screenshot=screenshot,
+        )
+
     return VerificationResult(
         success=False,
         message=f"Text mismatch: found '{best_detection.text}', expected '{expected_text}'",
@@ -183,30 +225,41 @@ def verify_element_present(
 
 
 def verify_page_loaded(
-    screenshot: np.ndarray, expected_indicators: list[str], confidence_threshold: float = 0.5
+    screenshot: np.ndarray,
+    expected_indicators: list[str],
+    confidence_threshold: float = 0.5,
+    quorum: float = 0.5,
+    text_results: list[TextResult] | None = None,
 ) -> VerificationResult:
     """
     Verify that a page/application has loaded completely
 
+    The screenshot is read once and all indicators are looked up in its text index
+    in one pass. Every indicator is matched, even once the quorum is met, so the
+    reported count and confidence cover all indicators on screen; each indicator
+    scores its most confident exact, prefix or substring match.
+
     Args:
         screenshot: Current screenshot
         expected_indicators: List of text/elements that should be present
         confidence_threshold: Minimum confidence threshold
+        quorum: Fraction of indicators that must be present
+        text_results: OCR results already read from the screenshot, if any
 
     Returns:
         VerificationResult
     """
-    found_indicators = []
-    total_confidence = 0
+    text_index = ScreenIndex(screenshot, confidence_threshold, text_results=text_results).text_index
+    required = max(1, math.ceil(quorum * len(expected_indicators)))
 
-    for indicator in expected_indicators:
-        elements = find_elements_by_text(
-            screenshot, indicator, confidence_threshold=confidence_threshold
-        )
-        if elements:
-            found_indicators.append(indicator)
-            total_confidence += max(elem.confidence for elem in elements)
+    # Substring lookups include exact and prefix matches
+    best_confidence = {
+        indicator: max(m.result.confidence for m in matches)
+        for indicator, matches in text_index.search_many(expected_indicators, "substring").items()
+        if matches
+    }
 
+    found_indicators = [i for i in expected_indicators if i in best_confidence]
     if not found_indicators:
         return VerificationResult(
             success=False,
@@ -216,10 +269,10 @@ def verify_page_loaded(
         )
 
     success_rate = len(found_indicators) / len(expected_indicators)
-    avg_confidence = total_confidence / len(found_indicators)
+    avg_confidence = sum(best_confidence[i] for i in found_indicators) / len(found_indicators)
 
     return VerificationResult(
-        success=success_rate >= 0.5,  # At least half the indicators should be present
+        success=len(found_indicators) >= required,
         message=f"Page loaded - found {len(found_indicators)}/{len(expected_indicators)} indicators: {found_indicators}",
         confidence=avg_confidence * success_rate,
         screenshot=screenshot,
@@ -232,36 +285,86 @@ def wait_for_element(
     max_attempts: int = 10,
     delay: float = 1.0,
     confidence_threshold: float = 0.5,
+    timeout: float | None = None,
+    poll_interval: float = WAIT_POLL_INTERVAL,
+    max_poll_interval: float = WAIT_MAX_POLL_INTERVAL,
+    heartbeat: float = WAIT_HEARTBEAT,
 ) -> VerificationResult:
     """
     Wait for a specific element to appear
 
+    Screenshots are captured every poll interval and compared on thumbnails; the
+    element search only runs on the first frame, once the screen has changed and
+    settled since the last search (or delay seconds into a continuous change),
+    and every heartbeat seconds otherwise. The poll interval backs off while the
+    screen is static and resets when it moves. Without a timeout, time spent
+    searching extends the deadline, as each attempt's search used to run on top
+    of its delay.
+
     Args:
         capture_func: Function to capture current screenshot
         element_description: Description of element to wait for
-        max_attempts: Maximum number of attempts
-        delay: Delay between attempts in seconds
+        max_attempts: Maximum number of element searches
+        delay: Minimum seconds between searches while the screen keeps changing
         confidence_threshold: Minimum confidence threshold
+        timeout: Overall deadline in seconds (max_attempts * delay plus search time
+            if None)
+        poll_interval: Initial seconds between captures
+        max_poll_interval: Longest seconds between captures after backoff
+        heartbeat: Seconds after which an unchanged screen is searched again
 
     Returns:
         VerificationResult
     """
-    for attempt in range(max_attempts):
+    start_time = time.monotonic()
+    deadline = start_time + (max_attempts * delay if timeout is None else timeout)
+    interval = poll_interval
+    searched_frame = previous_frame = None
+    last_search = start_time
+    attempts = 0
+
+    while True:
         screenshot = capture_func()
-        if screenshot is None:
-            continue
+        now = time.monotonic()
 
-        result = verify_element_present(screenshot, element_description, confidence_threshold)
-        if result.success:
-            result.message += f" (found after {attempt + 1} attempts)"
-            return result
-
-        if attempt < max_attempts - 1:  # Don't sleep on last attempt
-            time.sleep(delay)
+        if screenshot is not None:
+            moving = (
+                previous_frame is None or detect_screen_change(previous_frame, screenshot).changed
+            )
+            if searched_frame is None:
+                due = True
+            else:
+                since_search = now - last_search
+                changed = detect_screen_change(searched_frame, screenshot).changed
+                due = (changed and (not moving or since_search >= delay)) or (
+                    since_search >= heartbeat
+                )
+
+            if due:
+                attempts += 1
+                result = verify_element_present(
+                    screenshot, element_description, confidence_threshold
+                )
+                if result.success:
+                    result.message += f" (found after {attempts} attempts, {now - start_time:.1f}s)"
+                    return result
+                searched_frame, last_search = screenshot, time.monotonic()
+                if timeout is None:
+                    deadline += last_search - now
+                if attempts >= max_attempts:
+                    break
+
+            interval = poll_interval if moving else min(interval * 2, max_poll_interval)
+            previous_frame = screenshot
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
 
     return VerificationResult(
         success=False,
-        message=f"Element '{element_description}' not found after {max_attempts} attempts",
+        message=f"Element '{element_description}' not found after {attempts} attempts",
         confidence=0.1,
     )
 
@@ -280,12 +383,10 @@ def compare_screenshots(screen1: np.ndarray, screen2: np.ndarray) -> dict[str, f
     if screen1.shape != screen2.shape:
         return {"similarity": 0.0, "mse": float("inf"), "change_percentage": 100.0}
 
-    # Mean Squared Error
-    mse = np.mean((screen1.astype(float) - screen2.astype(float)) ** 2)
-
-    # Change percentage
-    diff = cv2.absdiff(screen1, screen2)
-    change_percentage = np.mean(diff > 10) * 100
+    # Mean Squared Error and change percentage, measured on grayscale thumbnails
+    change = detect_screen_change(screen1, screen2)
+    mse = change.mse
+    change_percentage = change.score * 100
 
     # Similarity score (inverse of normalized MSE)
     max_possible_mse = 255**2
@@ -0,0 +1 @@
+"""Unit tests for automation.remote.tools module."""
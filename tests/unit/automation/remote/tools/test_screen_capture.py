@@ -0,0 +1,60 @@
+"""Unit tests for automation.remote.tools.screen_capture module."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from automation.remote.tools.screen_capture import ScreenCapture
+
+
+def _screen():
+    return np.full((1080, 1920, 3), 40, dtype=np.uint8)
+
+
+@pytest.fixture
+def capture():
+    with patch("automation.remote.tools.screen_capture.create_connection"):
+        capture = ScreenCapture("vnc")
+    capture.is_connected = True
+    return capture
+
+
+class TestScreensDifferent:
+    """Test cases for ScreenCapture._screens_different method."""
+
+    def test_dialog_is_a_change(self, capture):
+        """Test that a dialog opening counts as a change with the default threshold."""
+        after = _screen()
+        after[300:700, 600:1300] = 230
+
+        assert capture._screens_different(_screen(), after, None)
+
+    def test_caret_blink_is_not_a_change(self, capture):
+        """Test that a blinking caret does not count as a change."""
+        after = _screen()
+        after[50:66, 30:32] = 0
+
+        assert not capture._screens_different(_screen(), after, None)
+
+    def test_threshold_is_fraction_of_screen(self, capture):
+        """Test that a threshold requires that fraction of the screen to change."""
+        after = _screen()
+        after[:270] = 230
+
+        assert capture._screens_different(_screen(), after, 0.2)
+        assert not capture._screens_different(_screen(), after, 0.5)
+
+
+class TestWaitForScreenChange:
+    """Test cases for ScreenCapture.wait_for_screen_change method."""
+
+    @patch("automation.remote.tools.screen_capture.time.sleep")
+    def test_detects_dialog(self, _, capture):
+        """Test that a dialog appearing after the first poll is reported."""
+        dialog = _screen()
+        dialog[300:700, 600:1300] = 230
+        frames = iter([_screen(), _screen(), dialog])
+
+        with patch.object(capture, "capture_screen", side_effect=lambda: next(frames)):
+            assert capture.wait_for_screen_change(timeout=10)
@@ -0,0 +1,13 @@
+"""Fixtures for vision unit tests."""
+
+import pytest
+
+from vision.cache import clear_result_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    """Keep cached results from leaking between tests."""
+    clear_result_cache()
+    yield
+    clear_result_cache()
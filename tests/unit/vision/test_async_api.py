@@ -0,0 +1,165 @@
+"""Unit tests for vision.async_api module."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from vision.async_api import aextract_text, call_vision, configure_async_vision, run_vision_call
+
+session_id = contextvars.ContextVar("session_id", default=None)
+
+
+@pytest.fixture(autouse=True)
+def _executor():
+    configure_async_vision(2)
+    yield
+    configure_async_vision(2)
+
+
+class TestRunVisionCall:
+    """Test cases for run_vision_call function."""
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more calls run at once than the pool allows."""
+        running, peak, lock = 0, 0, threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        async def run():
+            await asyncio.gather(*(run_vision_call(work) for _ in range(6)))
+
+        asyncio.run(run())
+
+        assert peak == 2
+
+    def test_timeout(self):
+        """Test that a slow call raises TimeoutError without blocking the loop."""
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            tick_task = asyncio.create_task(ticker())
+            with pytest.raises(TimeoutError):
+                await run_vision_call(time.sleep, 0.3, timeout=0.1)
+            tick_task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) >= 5
+
+    def test_cancelled_queued_call_never_runs(self):
+        """Test that cancelling a call still waiting for a thread drops it."""
+        configure_async_vision(1)
+        release = threading.Event()
+        queued = MagicMock()
+
+        async def run():
+            busy = asyncio.create_task(run_vision_call(release.wait, 5))
+            await asyncio.sleep(0.05)
+            waiting = asyncio.create_task(run_vision_call(queued))
+            await asyncio.sleep(0.05)
+            waiting.cancel()
+            await asyncio.sleep(0.05)
+            release.set()
+            await busy
+            await asyncio.sleep(0.05)
+            return waiting.cancelled()
+
+        assert asyncio.run(run())
+        queued.assert_not_called()
+
+    def test_pool_replaced_after_fetch(self):
+        """Test that a call racing configure_async_vision runs on the new pool."""
+        stale = ThreadPoolExecutor(max_workers=1)
+        stale.shutdown()
+        current = ThreadPoolExecutor(max_workers=1)
+
+        with patch("vision.async_api._get_executor", side_effect=[stale, current]):
+            assert asyncio.run(run_vision_call(lambda: 42)) == 42
+        current.shutdown()
+
+    def test_context_variables_propagate(self):
+        """Test that the caller's context variables are visible in the call."""
+
+        async def run():
+            session_id.set("vm-7")
+            return await run_vision_call(session_id.get)
+
+        assert asyncio.run(run()) == "vm-7"
+
+
+class TestCallVision:
+    """Test cases for call_vision function."""
+
+    def test_runs_on_vision_pool(self):
+        """Test that a worker thread's call runs on the shared vision pool."""
+        assert call_vision(lambda: threading.current_thread().name).startswith("vision")
+
+    def test_shares_bound_with_awaitable_calls(self):
+        """Test that calls from worker threads count against the same pool size."""
+        configure_async_vision(1)
+        release = threading.Event()
+        started = []
+
+        async def run():
+            busy = asyncio.create_task(run_vision_call(release.wait, 5))
+            await asyncio.sleep(0.05)
+            waiter = asyncio.create_task(asyncio.to_thread(call_vision, started.append, 1))
+            await asyncio.sleep(0.05)
+            queued = not started
+            release.set()
+            await asyncio.gather(busy, waiter)
+            return queued
+
+        assert asyncio.run(run())
+        assert started == [1]
+
+    def test_nested_call_runs_inline(self):
+        """Test that a vision call made from the pool does not wait for a free thread."""
+        configure_async_vision(1)
+
+        assert call_vision(call_vision, lambda: 7, timeout=1) == 7
+
+    def test_timeout(self):
+        """Test that a slow call raises TimeoutError."""
+        with pytest.raises(TimeoutError):
+            call_vision(time.sleep, 0.3, timeout=0.05)
+
+
+class TestAwaitableFunctions:
+    """Test cases for the awaitable vision functions."""
+
+    def test_aextract_text(self):
+        """Test that aextract_text runs OCR off the event loop thread."""
+        manager = MagicMock()
+        engine = manager.engine.return_value.__enter__.return_value
+        ocr_threads = []
+        engine.predict.side_effect = lambda image: (
+            ocr_threads.append(threading.current_thread().name)
+            or [{"rec_texts": ["OK"], "rec_scores": [0.9], "rec_polys": [[(0, 0)] * 4]}]
+        )
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            results = asyncio.run(aextract_text(np.zeros((10, 10, 3), dtype=np.uint8)))
+
+        assert [r.text for r in results] == ["OK"]
+        assert ocr_threads[0].startswith("vision")
+        assert "timeout" in aextract_text.__doc__
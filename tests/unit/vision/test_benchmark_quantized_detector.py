@@ -0,0 +1,50 @@
+"""Unit tests for scripts/benchmark_quantized_detector.py."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from vision.cache import get_result_cache
+
+SCRIPT_PATH = Path(__file__).parents[3] / "scripts" / "benchmark_quantized_detector.py"
+
+
+@pytest.fixture
+def benchmark():
+    """Load the benchmark script as a module."""
+    spec = importlib.util.spec_from_file_location("benchmark_quantized_detector", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestTimeVariant:
+    """Test cases for time_variant function."""
+
+    def test_runs_one_inference_per_timed_call(self, benchmark):
+        """Test that repeated runs on the same image are not served from the result cache."""
+        images = [
+            ("a.png", np.zeros((32, 48, 3), np.uint8)),
+            ("b.png", np.ones((32, 48, 3), np.uint8)),
+        ]
+
+        with patch("vision.detector.detect_ui_elements_batch", return_value=[[]]) as mock_batch:
+            latencies, detections = benchmark.time_variant(images, "fp32", 3, 0.25)
+
+        # One warm-up plus runs per image
+        assert mock_batch.call_count == 1 + 3 * len(images)
+        assert len(latencies) == 3 * len(images)
+        assert set(detections) == {"a.png", "b.png"}
+
+    def test_restores_cache_budget(self, benchmark):
+        """Test that the result cache budget is restored after timing."""
+        budget = get_result_cache().max_bytes
+        images = [("a.png", np.zeros((32, 48, 3), np.uint8))]
+
+        with patch("vision.detector.detect_ui_elements_batch", return_value=[[]]):
+            benchmark.time_variant(images, "fp32", 2, 0.25)
+
+        assert get_result_cache().max_bytes == budget
@@ -0,0 +1,173 @@
+"""Unit tests for vision.cache module."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from vision.cache import (
+    DEFAULT_CACHE_MB,
+    ResultCache,
+    _cache_bytes_from_env,
+    cached_result,
+    get_result_cache_stats,
+    image_fingerprint,
+)
+from vision.detector import Detection
+from vision.reader import extract_text
+
+
+def _image(value: int = 0) -> np.ndarray:
+    return np.full((32, 48, 3), value, dtype=np.uint8)
+
+
+class TestImageFingerprint:
+    """Test cases for image_fingerprint function."""
+
+    def test_same_content_same_fingerprint(self):
+        """Test that equal pixel content fingerprints equally across arrays."""
+        assert image_fingerprint(_image()) == image_fingerprint(_image())
+
+    def test_single_pixel_change(self):
+        """Test that changing one pixel changes the fingerprint."""
+        image = _image()
+        before = image_fingerprint(image)
+        image[5, 5, 1] = 1
+
+        assert image_fingerprint(image) != before
+
+    def test_views_are_fingerprinted_by_content(self):
+        """Test that a non-contiguous crop matches a contiguous copy."""
+        image = np.arange(32 * 48 * 3, dtype=np.uint8).reshape(32, 48, 3)
+        crop = image[4:20, 8:40]
+
+        assert image_fingerprint(crop) == image_fingerprint(crop.copy())
+
+
+class TestResultCache:
+    """Test cases for ResultCache class."""
+
+    def test_hit_returns_isolated_copy(self):
+        """Test that callers mutating a hit do not alter the cached entry."""
+        cache = ResultCache()
+        detection = Detection("laptop", 0.9, (0, 0, 10, 10), (5, 5), 100)
+        cache.put(("detect", (), ()), [detection])
+
+        _, first = cache.get(("detect", (), ()))
+        first[0].distance = 3.0
+        first.clear()
+        hit, second = cache.get(("detect", (), ()))
+
+        assert hit
+        assert len(second) == 1
+        assert not hasattr(second[0], "distance")
+
+    def test_lru_eviction_within_budget(self):
+        """Test that the least recently used entry is evicted to fit the budget."""
+        cache = ResultCache(max_bytes=3000)
+        cache.put(("a", (), ()), ["x" * 1000])
+        cache.put(("b", (), ()), ["y" * 1000])
+        cache.get(("a", (), ()))
+        cache.put(("c", (), ()), ["z" * 1000])
+
+        assert cache.get(("a", (), ()))[0]
+        assert not cache.get(("b", (), ()))[0]
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 3000
+
+    def test_oversized_results_are_not_cached(self):
+        """Test that a result larger than the whole budget is skipped."""
+        cache = ResultCache(max_bytes=100)
+        cache.put(("a", (), ()), ["x" * 1000])
+
+        assert cache.stats()["entries"] == 0
+
+
+class TestCacheBudgetFromEnv:
+    """Test cases for reading the cache budget from VISION_RESULT_CACHE_MB."""
+
+    def test_reads_megabytes(self, monkeypatch):
+        """Test that the budget is read in megabytes."""
+        monkeypatch.setenv("VISION_RESULT_CACHE_MB", "0.5")
+
+        assert _cache_bytes_from_env() == 512 * 1024
+
+    @pytest.mark.parametrize("value", ["lots", "inf"])
+    def test_malformed_value_falls_back(self, monkeypatch, value):
+        """Test that a malformed budget uses the default instead of failing import."""
+        monkeypatch.setenv("VISION_RESULT_CACHE_MB", value)
+
+        assert _cache_bytes_from_env() == DEFAULT_CACHE_MB * 1024 * 1024
+
+
+class TestCachedResult:
+    """Test cases for the cached_result decorator."""
+
+    def test_identical_calls_hit(self):
+        """Test that positional and keyword spellings share one entry."""
+        compute = Mock(return_value=[1, 2])
+
+        @cached_result("test_identical")
+        def analyze(image, threshold=0.5):
+            return compute(image, threshold)
+
+        assert analyze(_image(), 0.5) == [1, 2]
+        assert analyze(_image(), threshold=0.5) == [1, 2]
+        assert analyze(_image()) == [1, 2]
+
+        assert compute.call_count == 1
+        assert get_result_cache_stats()["namespaces"]["test_identical"] == {"hits": 2, "misses": 1}
+
+    def test_parameters_and_content_are_keyed(self):
+        """Test that different parameters or pixels miss."""
+        compute = Mock(return_value=[])
+
+        @cached_result("test_keyed")
+        def analyze(image, regions=None):
+            return compute()
+
+        analyze(_image(), regions=[(0, 0, 10, 10)])
+        analyze(_image(), regions=[(0, 0, 10, 20)])
+        analyze(_image(1), regions=[(0, 0, 10, 10)])
+        analyze(_image(), regions=[(0, 0, 10, 10)])
+
+        assert compute.call_count == 3
+
+    def test_exceptions_are_not_cached(self):
+        """Test that a failing call is retried on the next request."""
+        compute = Mock(side_effect=[RuntimeError("boom"), ["ok"]])
+
+        @cached_result("test_errors")
+        def analyze(image):
+            return compute()
+
+        with pytest.raises(RuntimeError):
+            analyze(_image())
+
+        assert analyze(_image()) == ["ok"]
+
+
+class TestExtractTextCaching:
+    """Test cases for extract_text result caching."""
+
+    def test_ocr_errors_are_not_cached(self):
+        """Test that an OCR failure returns no text and is retried next call."""
+        manager = MagicMock()
+        engine = manager.engine.return_value.__enter__.return_value
+        engine.predict.side_effect = [
+            RuntimeError("engine crashed"),
+            [
+                {
+                    "rec_texts": ["OK"],
+                    "rec_scores": [0.9],
+                    "rec_polys": [[(0, 0), (10, 0), (10, 5), (0, 5)]],
+                }
+            ],
+        ]
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            assert extract_text(_image()) == []
+            assert [r.text for r in extract_text(_image())] == ["OK"]
+            assert [r.text for r in extract_text(_image())] == ["OK"]
+
+        assert engine.predict.call_count == 2
@@ -0,0 +1,131 @@
+"""Unit tests for vision.change module."""
+
+import numpy as np
+
+from vision.change import CHANGE_MIN_AREA, detect_screen_change, screen_thumbnail
+from vision.verification import compare_screenshots, verify_click_success
+
+
+def _screen(shape=(402, 642, 3)):
+    return np.full(shape, 40, dtype=np.uint8)
+
+
+class TestScreenThumbnail:
+    """Test cases for screen_thumbnail function."""
+
+    def test_grayscale_downsampled(self):
+        """Test that thumbnails are single channel at a quarter of each side."""
+        thumbnail = screen_thumbnail(_screen())
+
+        assert thumbnail.shape == (100, 160)
+        assert thumbnail.dtype == np.uint8
+
+    def test_cached_by_content(self):
+        """Test that equal frames share a thumbnail and in-place edits are not served stale."""
+        frame = _screen()
+        thumbnail = screen_thumbnail(frame)
+
+        assert screen_thumbnail(frame.copy()) is thumbnail
+        frame[:100] = 255
+        assert screen_thumbnail(frame) is not thumbnail
+        assert screen_thumbnail(frame)[0, 0] == 255
+
+
+class TestDetectScreenChange:
+    """Test cases for detect_screen_change function."""
+
+    def test_identical_frames(self):
+        """Test that identical frames report no change."""
+        change = detect_screen_change(_screen(), _screen())
+
+        assert not change.changed
+        assert change.mse == 0.0
+        assert change.regions == []
+
+    def test_caret_blink_is_not_a_change(self):
+        """Test that a few changed pixels are measured but do not count as a change."""
+        after = _screen()
+        after[50:66, 30:33] = 0
+
+        change = detect_screen_change(_screen(), after)
+
+        assert 0 < change.area < CHANGE_MIN_AREA
+        assert not change.changed
+
+    def test_small_control_on_large_screen_is_a_change(self):
+        """Test that a 100x20 control appearing on a 1080p screen counts as a change."""
+        before = _screen((1080, 1920, 3))
+        after = before.copy()
+        after[500:520, 900:1000] = 230
+
+        change = detect_screen_change(before, after)
+
+        assert change.score < 0.001
+        assert change.changed
+
+    def test_regions_are_plain_ints(self):
+        """Test that region coordinates are Python ints, not numpy scalars."""
+        after = _screen()
+        after[40:60, 40:100] = 255
+
+        change = detect_screen_change(_screen(), after)
+
+        assert all(type(value) is int for region in change.regions for value in region)
+
+    def test_changed_regions_in_full_resolution(self):
+        """Test that separate changes map to block-aligned full resolution regions."""
+        after = _screen()
+        after[40:60, 40:100] = 255
+        after[300:320, 500:560] = 255
+
+        change = detect_screen_change(_screen(), after)
+
+        assert len(change.regions) == 2
+        for (x1, y1, x2, y2), (cx, cy) in zip(
+            sorted(change.regions), [(70, 50), (530, 310)], strict=True
+        ):
+            assert x1 <= cx < x2 and y1 <= cy < y2
+            assert x1 % 32 == 0 and y1 % 32 == 0
+        assert 0 < change.score < 0.02
+
+    def test_edge_region_reaches_frame_border(self):
+        """Test that changes in the last partial row and column are covered."""
+        after = _screen()
+        after[-4:, -4:] = 255
+
+        change = detect_screen_change(_screen(), after)
+
+        assert change.regions[0][2:] == (642, 402)
+
+    def test_shape_mismatch(self):
+        """Test that differently sized frames count as a full change."""
+        change = detect_screen_change(_screen(), _screen((200, 300, 3)))
+
+        assert change.score == 1.0
+        assert change.regions == [(0, 0, 300, 200)]
+
+
+class TestVerificationUsesThumbnails:
+    """Test cases for verification functions built on change detection."""
+
+    def test_verify_click_success(self):
+        """Test that a dialog sized change verifies and a caret blink does not."""
+        before = _screen()
+        dialog = before.copy()
+        dialog[100:300, 200:450] = 230
+        caret = before.copy()
+        caret[50:62, 30:31] = 0
+
+        assert verify_click_success(before, dialog).success
+        assert not verify_click_success(before, caret).success
+
+    def test_compare_screenshots(self):
+        """Test similarity metrics for equal and changed frames."""
+        before = _screen()
+        after = before.copy()
+        after[:201] = 240
+
+        assert compare_screenshots(before, before.copy())["similarity"] == 1.0
+        metrics = compare_screenshots(before, after)
+        assert 40 < metrics["change_percentage"] < 60
+        assert 0.6 < metrics["similarity"] < 0.8
@@ -0,0 +1,291 @@
+"""Unit tests for vision.detector module."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from vision.detector import (
+    FULL_COCO_CLASSES,
+    UI_FOCUSED_CLASSES,
+    Detection,
+    _postprocess_outputs,
+    detect_ui_elements,
+    detect_ui_elements_batch,
+)
+from vision.nms import non_max_suppression
+from vision.preprocess import get_letterbox_transform
+
+
+def _transform(height: int, width: int):
+    """Letterbox transform from an image of the given size to a 640x640 input."""
+    return get_letterbox_transform((height, width), 640, 640)
+
+
+def _make_outputs(boxes: list[tuple[float, float, float, float, int, float]], anchors: int = 50):
+    """Build a YOLOv8-style [1, 84, anchors] output with the given (cx, cy, w, h, class, score)."""
+    predictions = np.zeros((1, 84, anchors), dtype=np.float32)
+    for index, (cx, cy, w, h, class_id, score) in enumerate(boxes):
+        predictions[0, 0:4, index] = [cx, cy, w, h]
+        predictions[0, 4 + class_id, index] = score
+    return [predictions]
+
+
+class TestPostprocessOutputs:
+    """Test cases for _postprocess_outputs function."""
+
+    def test_scales_boxes_to_original_image(self):
+        """Test that boxes are rescaled from model input to image coordinates."""
+        outputs = _make_outputs([(320, 320, 64, 32, 63, 0.9)])
+
+        detections = _postprocess_outputs(outputs, _transform(1280, 1280), UI_FOCUSED_CLASSES, 0.5)
+
+        assert len(detections) == 1
+        detection = detections[0]
+        assert detection.class_name == "laptop"
+        assert detection.bbox == (576, 608, 704, 672)
+        assert detection.center == (640, 640)
+        assert detection.area == 128 * 64
+        assert isinstance(detection.bbox[0], int)
+        assert isinstance(detection.confidence, float)
+
+    def test_filters_threshold_and_class_set(self):
+        """Test that low scores and classes outside the active set are dropped."""
+        outputs = _make_outputs(
+            [
+                (100, 100, 20, 20, 62, 0.4),  # below threshold
+                (200, 200, 20, 20, 2, 0.9),  # car, not UI-focused
+                (300, 300, 20, 20, 74, 0.8),  # clock
+            ]
+        )
+
+        ui_detections = _postprocess_outputs(outputs, _transform(640, 640), UI_FOCUSED_CLASSES, 0.5)
+        all_detections = _postprocess_outputs(outputs, _transform(640, 640), FULL_COCO_CLASSES, 0.5)
+
+        assert [d.class_name for d in ui_detections] == ["clock"]
+        assert [d.class_name for d in all_detections] == ["car", "clock"]
+
+    def test_suppresses_overlapping_boxes(self):
+        """Test that overlapping boxes are suppressed keeping the most confident."""
+        outputs = _make_outputs(
+            [
+                (100, 100, 50, 50, 62, 0.7),
+                (102, 101, 50, 50, 62, 0.95),
+                (400, 400, 50, 50, 62, 0.8),
+            ]
+        )
+
+        detections = _postprocess_outputs(outputs, _transform(640, 640), UI_FOCUSED_CLASSES, 0.5)
+
+        assert [round(d.confidence, 2) for d in detections] == [0.95, 0.8]
+
+    def test_clips_boxes_to_image_bounds(self):
+        """Test that boxes extending past the image are clipped."""
+        outputs = _make_outputs([(5, 635, 40, 40, 0, 0.9)])
+
+        detections = _postprocess_outputs(outputs, _transform(640, 640), UI_FOCUSED_CLASSES, 0.5)
+
+        assert detections[0].bbox == (0, 615, 25, 640)
+
+    def test_undoes_letterbox_padding(self):
+        """Test that boxes on a padded 16:9 input map back without distortion."""
+        # 1920x1080 -> scale 1/3, content 640x360 padded by 140 rows top and bottom
+        outputs = _make_outputs([(320, 320, 60, 30, 62, 0.9)])
+
+        detections = _postprocess_outputs(outputs, _transform(1080, 1920), UI_FOCUSED_CLASSES, 0.5)
+
+        assert detections[0].bbox == (870, 495, 1050, 585)
+        assert detections[0].center == (960, 540)
+
+    def test_top_k_and_max_output_cap_candidates(self):
+        """Test that only the top_k candidates enter NMS and at most max_output are kept."""
+        outputs = _make_outputs([(40 + 60 * i, 320, 40, 40, 62, 0.6 + 0.03 * i) for i in range(10)])
+
+        top_three = _postprocess_outputs(
+            outputs, _transform(640, 640), UI_FOCUSED_CLASSES, 0.5, top_k=3
+        )
+        top_two = _postprocess_outputs(
+            outputs, _transform(640, 640), UI_FOCUSED_CLASSES, 0.5, top_k=None, max_output=2
+        )
+
+        assert [round(d.confidence, 2) for d in top_three] == [0.87, 0.84, 0.81]
+        assert [round(d.confidence, 2) for d in top_two] == [0.87, 0.84]
+
+    def test_no_detections(self):
+        """Test that an empty score matrix produces no detections."""
+        outputs = _make_outputs([])
+
+        assert _postprocess_outputs(outputs, _transform(640, 640), UI_FOCUSED_CLASSES, 0.5) == []
+
+
+def _mock_entry(batch_axis):
+    """Create a mock session entry whose run echoes the batch size."""
+    entry = Mock()
+    entry.input_name = "images"
+    entry.input_shape = [batch_axis, 3, 640, 640]
+    entry.local = threading.local()
+    entry.session.run.side_effect = lambda _, feed: [
+        np.zeros((feed["images"].shape[0], 84, 8400), dtype=np.float32)
+    ]
+    return entry
+
+
+class TestDetectUIElementsBatch:
+    """Test cases for detect_ui_elements_batch function."""
+
+    @patch("vision.detector.os.path.exists", return_value=True)
+    def test_dynamic_batch_stacks_frames(self, _):
+        """Test that a dynamic batch axis runs frames together."""
+        entry = _mock_entry("batch")
+        images = [np.zeros((100, 200, 3), dtype=np.uint8) for _ in range(5)]
+
+        with patch("vision.detector.get_session", return_value=entry):
+            results = detect_ui_elements_batch(images, max_batch_size=4)
+
+        assert results == [[]] * 5
+        run_sizes = [c[0][1]["images"].shape[0] for c in entry.session.run.call_args_list]
+        assert run_sizes == [4, 1]
+
+    @patch("vision.detector.os.path.exists", return_value=True)
+    def test_static_batch_micro_batches(self, _):
+        """Test that a fixed batch size of one runs frames one at a time."""
+        entry = _mock_entry(1)
+        images = [np.zeros((100, 200, 3), dtype=np.uint8) for _ in range(3)]
+
+        with patch("vision.detector.get_session", return_value=entry):
+            results = detect_ui_elements_batch(images, max_batch_size=8)
+
+        assert len(results) == 3
+        assert entry.session.run.call_count == 3
+
+    @patch("vision.detector.os.path.exists", return_value=True)
+    def test_nms_top_k_and_max_detections_reach_nms(self, _):
+        """Test that nms_top_k and max_detections bound NMS for every frame."""
+        entry = _mock_entry(1)
+        entry.session.run.side_effect = lambda _, feed: _make_outputs(
+            [(100, 100, 40, 40, 62, 0.9)], anchors=8400
+        )
+
+        with (
+            patch("vision.detector.get_session", return_value=entry),
+            patch("vision.detector.non_max_suppression", wraps=non_max_suppression) as mock_nms,
+        ):
+            results = detect_ui_elements_batch(
+                [np.zeros((640, 640, 3), dtype=np.uint8)], max_detections=5, nms_top_k=50
+            )
+
+        assert len(results[0]) == 1
+        assert mock_nms.call_args.kwargs["top_k"] == 50
+        assert mock_nms.call_args.kwargs["max_output"] == 5
+
+    def test_missing_model_raises(self, tmp_path):
+        """Test that a missing model raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            detect_ui_elements_batch([], model_path=str(tmp_path / "missing.onnx"))
+
+    def test_unknown_model_variant_raises(self):
+        """Test that an unknown model variant raises ValueError."""
+        with pytest.raises(ValueError):
+            detect_ui_elements_batch([], model_variant="fp8")
+
+    @patch("vision.detector.os.path.exists", return_value=True)
+    def test_int8_variant_selects_quantized_model(self, _):
+        """Test that the int8 variant loads the quantized model file."""
+        entry = _mock_entry(1)
+
+        with patch("vision.detector.get_session", return_value=entry) as mock_get_session:
+            detect_ui_elements_batch([np.zeros((10, 10, 3), dtype=np.uint8)], model_variant="int8")
+
+        assert mock_get_session.call_args[0][0].endswith("yolov8s.int8.onnx")
+
+
+def _detection(bbox, confidence=0.9, class_name="laptop"):
+    """Create a detection with the center and area derived from its box."""
+    x1, y1, x2, y2 = bbox
+    return Detection(
+        class_name=class_name,
+        confidence=confidence,
+        bbox=bbox,
+        center=((x1 + x2) // 2, (y1 + y2) // 2),
+        area=(x2 - x1) * (y2 - y1),
+    )
+
+
+class TestDetectRegions:
+    """Test cases for region-of-interest detection."""
+
+    def test_crops_are_batched_and_offset(self):
+        """Test that regions run as one batch and boxes map back to the full image."""
+        image = np.zeros((1080, 1920, 3), dtype=np.uint8)
+        crop_results = [[_detection((10, 10, 50, 30))], [_detection((0, 0, 20, 20), 0.8)]]
+
+        with patch(
+            "vision.detector.detect_ui_elements_batch", return_value=crop_results
+        ) as mock_batch:
+            detections = detect_ui_elements(
+                image, regions=[(100, 200, 400, 500), (1800, 1000, 2000, 1200)]
+            )
+
+        crops = mock_batch.call_args[0][0]
+        assert [crop.shape[:2] for crop in crops] == [(300, 300), (80, 120)]
+        assert [d.bbox for d in detections] == [(110, 210, 150, 230), (1800, 1000, 1820, 1020)]
+        assert detections[0].center == (130, 220)
+
+    def test_duplicates_from_overlapping_regions_are_merged(self):
+        """Test that an element seen by two overlapping regions is reported once."""
+        image = np.zeros((600, 600, 3), dtype=np.uint8)
+        crop_results = [[_detection((100, 100, 200, 150), 0.7)], [_detection((50, 100, 150, 150))]]
+
+        with patch("vision.detector.detect_ui_elements_batch", return_value=crop_results):
+            detections = detect_ui_elements(image, regions=[(0, 0, 300, 300), (50, 0, 350, 300)])
+
+        assert len(detections) == 1
+        assert detections[0].confidence == 0.9
+
+    def test_empty_regions_skip_inference(self):
+        """Test that regions outside the image never reach the model."""
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        with patch("vision.detector.detect_ui_elements_batch") as mock_batch:
+            detections = detect_ui_elements(image, regions=[(200, 200, 300, 300), (50, 50, 50, 80)])
+
+        assert detections == []
+        mock_batch.assert_not_called()
+
+
+class TestDetectTiled:
+    """Test cases for tiled high-resolution detection."""
+
+    def test_tiles_and_full_frame_are_batched(self):
+        """Test that tiles plus a full-frame pass run as one batch and merge across tiles."""
+        image = np.zeros((1440, 5120, 3), dtype=np.uint8)
+
+        def run_batch(crops, **_):
+            results = [[] for _ in crops]
+            # A button cut by the first tile edge, and seen whole by the second tile
+            results[0] = [_detection((1200, 100, 1280, 140), 0.7)]
+            results[1] = [_detection((200, 100, 340, 140), 0.9)]
+            return results
+
+        with patch("vision.detector.detect_ui_elements_batch", side_effect=run_batch) as mock_batch:
+            detections = detect_ui_elements(image, tiled=True)
+
+        crops = mock_batch.call_args[0][0]
+        assert crops[-1].shape[:2] == (1440, 5120)
+        assert len(detections) == 1
+        assert detections[0].confidence == 0.9
+
+    def test_small_frame_skips_tiling(self):
+        """Test that a frame fitting in one tile runs a single untiled pass."""
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        with patch("vision.detector.detect_ui_elements_batch", return_value=[[]]) as mock_batch:
+            detect_ui_elements(image, tiled=True)
+
+        assert len(mock_batch.call_args[0][0]) == 1
+
+    def test_regions_and_tiled_raise(self):
+        """Test that combining regions with tiling raises ValueError."""
+        with pytest.raises(ValueError):
+            detect_ui_elements(np.zeros((10, 10, 3), dtype=np.uint8), regions=[], tiled=True)
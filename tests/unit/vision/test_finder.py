@@ -0,0 +1,206 @@
+"""Unit tests for vision.finder module."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from vision.detector import Detection
+from vision.finder import (
+    ScreenIndex,
+    UIElement,
+    analyze_screen_content,
+    configure_finder_concurrency,
+)
+from vision.reader import TextResult
+
+
+def _text(text, rect_bbox, confidence=0.9):
+    x1, y1, x2, y2 = rect_bbox
+    return TextResult(
+        text=text,
+        confidence=confidence,
+        bbox=[(x1, y1), (x2, y1), (x2, y2), (x1, y2)],
+        rect_bbox=rect_bbox,
+        center=((x1 + x2) // 2, (y1 + y2) // 2),
+        area=(x2 - x1) * (y2 - y1),
+    )
+
+
+DETECTIONS = [Detection("laptop", 0.8, (100, 100, 300, 200), (200, 150), 20000)]
+TEXT_RESULTS = [
+    _text("Username", (20, 20, 120, 40)),
+    _text("Password", (20, 60, 120, 80)),
+    _text("Subrnit", (180, 140, 220, 160)),
+    _text("This is a long paragraph of body text", (400, 400, 800, 420)),
+]
+
+
+@pytest.fixture
+def mock_models():
+    """Patch detection and OCR with fixed results."""
+    with (
+        patch("vision.finder.detect_ui_elements", return_value=DETECTIONS) as detect,
+        patch("vision.finder.extract_text", return_value=TEXT_RESULTS) as ocr,
+    ):
+        yield detect, ocr
+
+
+@pytest.fixture
+def screen():
+    return ScreenIndex(np.zeros((600, 900, 3), dtype=np.uint8))
+
+
+class TestScreenIndex:
+    """Test cases for ScreenIndex class."""
+
+    def test_models_run_once_across_queries(self, mock_models, screen):
+        """Test that many queries share a single detection and OCR pass."""
+        detect, ocr = mock_models
+
+        screen.find_text("username")
+        screen.find_text("password")
+        screen.find_clickable()
+        screen.find_near_point((200, 150))
+        screen.analyze("everything")
+
+        assert detect.call_count == 1
+        assert ocr.call_count == 1
+
+    def test_text_miss_skips_detection(self, mock_models, screen):
+        """Test that detection is not run when no text matches."""
+        detect, _ = mock_models
+
+        assert screen.find_text("nonexistent") == []
+        detect.assert_not_called()
+
+    def test_find_text_combines_nearby_visual(self, mock_models, screen):
+        """Test that matched text is combined with a nearby detection."""
+        elements = screen.find_text("submit", fuzzy=True)
+
+        assert [e.element_type for e in elements] == ["combined"]
+        assert elements[0].bbox == (100, 100, 300, 200)
+        assert screen.find_text("submit") == []
+
+    def test_find_in_region(self, mock_models, screen):
+        """Test center and containment region queries."""
+        by_center = screen.find_in_region((0, 0, 150, 100))
+        inside = screen.find_in_region((0, 0, 150, 50), fully_inside=True)
+
+        assert sorted(e.text for e in by_center) == ["Password", "Username"]
+        assert [e.text for e in inside] == ["Username"]
+
+    def test_near_point_does_not_mutate_index(self, mock_models, screen):
+        """Test that near-point annotations are made on copies."""
+        nearby = screen.find_near_point((70, 30), radius=10)
+
+        assert [e.text for e in nearby] == ["Username"]
+        assert not any(hasattr(e, "distance") for e in screen.elements)
+
+    def test_reread_text_uses_text_boxes_only(self, mock_models, screen):
+        """Test that re-reading labels runs recognition on their boxes, not full OCR."""
+        _, ocr = mock_models
+        username = screen.find_text("username")[0]
+        laptop = UIElement("visual", (100, 100, 300, 200), (200, 150), 0.8, 20000)
+        ocr.reset_mock()
+
+        with patch("vision.finder.recognize_text", return_value=[None, None]) as recognize:
+            ScreenIndex(screen.image).reread_text([username, laptop])
+
+        boxes = recognize.call_args[0][1]
+        assert boxes == [username.text_detection.bbox, laptop.bbox]
+        ocr.assert_not_called()
+
+    def test_precomputed_text_results(self, mock_models):
+        """Test that supplied OCR results replace OCR and are threshold filtered."""
+        _, ocr = mock_models
+        weak = _text("Cancel", (20, 100, 80, 120), confidence=0.3)
+        screen = ScreenIndex(
+            np.zeros((600, 900, 3), dtype=np.uint8), text_results=[*TEXT_RESULTS, weak]
+        )
+
+        assert screen.find_text("cancel") == []
+        assert len(screen.text_results) == len(TEXT_RESULTS)
+        ocr.assert_not_called()
+
+    def test_detection_overlaps_ocr(self, screen):
+        """Test that detection runs on another thread while OCR runs."""
+        configure_finder_concurrency(2)
+        threads = {}
+
+        def detect(*args, **kwargs):
+            threads["detect"] = threading.current_thread()
+            time.sleep(0.1)
+            return DETECTIONS
+
+        def ocr(*args, **kwargs):
+            threads["ocr"] = threading.current_thread()
+            time.sleep(0.1)
+            return TEXT_RESULTS
+
+        with (
+            patch("vision.finder.detect_ui_elements", side_effect=detect),
+            patch("vision.finder.extract_text", side_effect=ocr),
+        ):
+            elements = screen.elements
+
+        assert len(elements) == 4
+        assert threads["detect"] is not threads["ocr"]
+        assert screen.timings["models"] < screen.timings["detection"] + screen.timings["ocr"]
+
+    def test_reconfigure_during_analysis(self, screen):
+        """Test that analyses keep running while the executor is replaced."""
+        stop = threading.Event()
+
+        def reconfigure():
+            while not stop.is_set():
+                configure_finder_concurrency(2)
+
+        def analyze(_):
+            frame = ScreenIndex(screen.image)
+            frame.run_models()
+            return frame.detections
+
+        reconfigurer = threading.Thread(target=reconfigure)
+        with (
+            patch("vision.finder.detect_ui_elements", return_value=DETECTIONS),
+            patch("vision.finder.extract_text", return_value=TEXT_RESULTS),
+            ThreadPoolExecutor(max_workers=4) as callers,
+        ):
+            reconfigurer.start()
+            try:
+                results = list(callers.map(analyze, range(200)))
+            finally:
+                stop.set()
+                reconfigurer.join()
+
+        assert all(result == DETECTIONS for result in results)
+
+    def test_sequential_when_disabled(self, mock_models, screen):
+        """Test that a concurrency of 0 runs both stages in the caller's thread."""
+        configure_finder_concurrency(0)
+        try:
+            screen.run_models()
+        finally:
+            configure_finder_concurrency(2)
+
+        assert {"detection", "ocr"} <= screen.timings.keys()
+        assert "models" not in screen.timings
+
+
+class TestAnalyzeScreenContent:
+    """Test cases for analyze_screen_content function."""
+
+    def test_single_pass(self, mock_models):
+        """Test that a full analysis runs detection and OCR once."""
+        detect, ocr = mock_models
+
+        analysis = analyze_screen_content(np.zeros((600, 900, 3), dtype=np.uint8), "buttons")
+
+        assert detect.call_count == 1
+        assert ocr.call_count == 1
+        assert analysis.summary["total_elements"] == 4
+        assert {e.text for e in analysis.clickable_elements} == {"Username", "Password", "Subrnit"}
@@ -0,0 +1,127 @@
+"""Unit tests for vision.incremental module."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from vision.incremental import IncrementalOCR
+from vision.reader import TextResult
+
+
+def _text(text, rect_bbox, confidence=0.9):
+    x1, y1, x2, y2 = rect_bbox
+    return TextResult(
+        text=text,
+        confidence=confidence,
+        bbox=[(x1, y1), (x2, y1), (x2, y2), (x1, y2)],
+        rect_bbox=rect_bbox,
+        center=((x1 + x2) // 2, (y1 + y2) // 2),
+        area=(x2 - x1) * (y2 - y1),
+    )
+
+
+FULL_RESULTS = [
+    _text("Start", (10, 10, 80, 30), 0.95),
+    _text("10:41", (500, 370, 560, 390), 0.9),
+]
+
+
+@pytest.fixture
+def mock_ocr():
+    """Patch full-frame and region OCR."""
+    with (
+        patch("vision.incremental.extract_text", return_value=FULL_RESULTS) as full,
+        patch("vision.incremental.extract_text_from_regions") as regions,
+    ):
+        regions.side_effect = lambda image, boxes, *args: [[] for _ in boxes]
+        yield full, regions
+
+
+def _frame():
+    return np.zeros((400, 600, 3), dtype=np.uint8)
+
+
+class TestIncrementalOCR:
+    """Test cases for IncrementalOCR class."""
+
+    def test_unchanged_frame_reuses_results(self, mock_ocr):
+        """Test that an identical frame runs no OCR and returns copies."""
+        full, regions = mock_ocr
+        reader = IncrementalOCR()
+
+        first = reader.update(_frame())
+        first[0].text = "mutated"
+        second = reader.update(_frame())
+
+        assert full.call_count == 1
+        regions.assert_not_called()
+        assert [r.text for r in second] == ["Start", "10:41"]
+        assert reader.stats()["unchanged_frames"] == 1
+
+    def test_changed_area_is_reread_and_rest_carried(self, mock_ocr):
+        """Test that only the changed clock is re-read and other text is kept."""
+        full, regions = mock_ocr
+        regions.side_effect = lambda image, boxes, *args: [
+            [_text("10:42", (500, 370, 560, 390), 0.85)] for _ in boxes
+        ]
+        reader = IncrementalOCR()
+        reader.update(_frame())
+
+        frame = _frame()
+        frame[375:385, 540:555] = 255
+        results = reader.update(frame)
+
+        boxes = regions.call_args[0][1]
+        assert len(boxes) == 1
+        x1, y1, x2, y2 = boxes[0]
+        assert x1 <= 500 and y1 <= 370 and x2 >= 560 and y2 >= 390
+        assert x2 - x1 < 200
+        assert [r.text for r in results] == ["Start", "10:42"]
+        assert full.call_count == 1
+
+    def test_reference_tracks_reread_regions(self, mock_ocr):
+        """Test that a change is read once and the same frame is then unchanged."""
+        _, regions = mock_ocr
+        reader = IncrementalOCR()
+        reader.update(_frame())
+
+        frame = _frame()
+        frame[200:210, 200:210] = 255
+        reader.update(frame)
+        reader.update(frame)
+
+        assert regions.call_count == 1
+        assert reader.changed_regions(frame) == []
+
+    def test_large_change_runs_full_pass(self, mock_ocr):
+        """Test that a mostly changed frame falls back to full OCR."""
+        full, regions = mock_ocr
+        reader = IncrementalOCR()
+        reader.update(_frame())
+
+        reader.update(np.full((400, 600, 3), 255, dtype=np.uint8))
+
+        assert full.call_count == 2
+        regions.assert_not_called()
+
+    def test_resolution_change_runs_full_pass(self, mock_ocr):
+        """Test that a new frame size resets the reference frame."""
+        full, _ = mock_ocr
+        reader = IncrementalOCR()
+        reader.update(_frame())
+        reader.update(np.zeros((300, 600, 3), dtype=np.uint8))
+
+        assert full.call_count == 2
+
+    def test_changed_regions_are_merged(self):
+        """Test that nearby changes within the padding become one region."""
+        reader = IncrementalOCR(block_size=8, padding=8)
+        reader._reference = _frame()
+
+        frame = _frame()
+        frame[100:104, 100:104] = 255
+        frame[100:104, 116:120] = 255
+        frame[300:304, 500:504] = 255
+
+        assert reader.changed_regions(frame) == [(88, 88, 128, 112), (488, 288, 512, 312)]
@@ -0,0 +1,115 @@
+"""Unit tests for vision.nms module."""
+
+import numpy as np
+import pytest
+
+from vision.nms import box_iou, center_distances, non_max_suppression, soft_nms
+
+BOXES = np.array(
+    [
+        [0, 0, 10, 10],
+        [1, 1, 11, 11],  # overlaps box 0 heavily
+        [50, 50, 60, 60],
+        [0, 0, 10, 5],  # half of box 0
+    ],
+    dtype=np.float32,
+)
+SCORES = np.array([0.9, 0.95, 0.5, 0.6], dtype=np.float32)
+
+
+class TestBoxIoU:
+    """Test cases for box_iou function."""
+
+    def test_iou_matrix(self):
+        """Test pairwise IoU values."""
+        ious = box_iou(BOXES[:1], BOXES)
+
+        assert ious.shape == (1, 4)
+        assert ious[0, 0] == pytest.approx(1.0)
+        assert ious[0, 1] == pytest.approx(81 / 119)
+        assert ious[0, 2] == 0.0
+        assert ious[0, 3] == pytest.approx(0.5)
+
+    def test_degenerate_boxes(self):
+        """Test that zero-area boxes produce zero IoU instead of NaN."""
+        ious = box_iou([[5, 5, 5, 5]], [[5, 5, 5, 5]])
+
+        assert ious[0, 0] == 0.0
+
+
+class TestCenterDistances:
+    """Test cases for center_distances function."""
+
+    def test_distances(self):
+        """Test pairwise Euclidean distances."""
+        distances = center_distances([(0, 0)], [(3, 4), (0, 0)])
+
+        assert distances.tolist() == [[5.0, 0.0]]
+
+
+class TestNonMaxSuppression:
+    """Test cases for non_max_suppression function."""
+
+    def test_class_agnostic(self):
+        """Test suppression across all boxes regardless of class."""
+        keep = non_max_suppression(BOXES, SCORES, iou_threshold=0.3)
+
+        assert keep.tolist() == [1, 2]
+
+    def test_class_aware(self):
+        """Test that boxes of different classes do not suppress each other."""
+        class_ids = np.array([0, 1, 0, 0])
+
+        keep = non_max_suppression(BOXES, SCORES, iou_threshold=0.3, class_ids=class_ids)
+
+        assert keep.tolist() == [1, 0, 2]
+
+    def test_top_k_and_max_output(self):
+        """Test candidate cap and output cap."""
+        assert non_max_suppression(BOXES, SCORES, 0.3, top_k=2).tolist() == [1]
+        assert non_max_suppression(BOXES, SCORES, 0.3, max_output=1).tolist() == [1]
+
+    def test_intersection_over_smaller(self):
+        """Test that a truncated box inside a larger one is suppressed with the ios metric."""
+        boxes = np.array([[0, 0, 100, 20], [80, 0, 100, 20]], dtype=np.float32)
+        scores = np.array([0.9, 0.8], dtype=np.float32)
+
+        assert non_max_suppression(boxes, scores, 0.5).tolist() == [0, 1]
+        assert non_max_suppression(boxes, scores, 0.5, match_metric="ios").tolist() == [0]
+
+    def test_unknown_match_metric(self):
+        """Test that an unknown match metric raises ValueError."""
+        with pytest.raises(ValueError):
+            non_max_suppression(BOXES, SCORES, match_metric="giou")
+
+    def test_empty(self):
+        """Test that empty input returns no indices."""
+        keep = non_max_suppression(np.zeros((0, 4)), np.zeros(0))
+
+        assert keep.size == 0
+
+
+class TestSoftNMS:
+    """Test cases for soft_nms function."""
+
+    def test_gaussian_decays_overlaps(self):
+        """Test that overlapping boxes are kept with decayed scores."""
+        keep, scores = soft_nms(BOXES, SCORES, sigma=0.5)
+
+        assert keep[0] == 1
+        assert scores[0] == pytest.approx(0.95)
+        decayed = dict(zip(keep.tolist(), scores.tolist(), strict=True))
+        assert decayed[0] < 0.9
+        assert decayed[2] == pytest.approx(0.5)
+
+    def test_linear_with_score_threshold(self):
+        """Test linear decay drops boxes that fall under the score threshold."""
+        keep, _ = soft_nms(BOXES, SCORES, iou_threshold=0.3, method="linear", score_threshold=0.4)
+
+        assert 0 not in keep.tolist()
+        assert {1, 2}.issubset(keep.tolist())
+
+    def test_unknown_method(self):
+        """Test that an unknown method raises ValueError."""
+        with pytest.raises(ValueError):
+            soft_nms(BOXES, SCORES, method="bogus")
@@ -0,0 +1,95 @@
+"""Unit tests for vision.ocr_engines module."""
+
+import threading
+from unittest.mock import Mock
+
+from vision.ocr_engines import OCREngineManager, _parse_prewarm_spec
+
+
+def _make_manager(**kwargs):
+    """Create a manager with a mock engine factory."""
+    factory = Mock(side_effect=lambda language, options: Mock(language=language))
+    return OCREngineManager(factory=factory, **kwargs), factory
+
+
+class TestOCREngineManager:
+    """Test cases for OCREngineManager class."""
+
+    def test_engine_is_reused(self):
+        """Test that sequential checkouts reuse one engine."""
+        manager, factory = _make_manager()
+
+        with manager.engine("en") as first:
+            pass
+        with manager.engine("en") as second:
+            pass
+
+        assert first is second
+        assert factory.call_count == 1
+        factory.assert_called_with("en", {"use_textline_orientation": True})
+        assert manager.stats()["reused"] == 1
+
+    def test_pool_is_bounded(self):
+        """Test that concurrent checkouts never exceed the pool size."""
+        manager, factory = _make_manager(max_engines_per_key=2)
+        barrier = threading.Barrier(4)
+
+        def worker():
+            barrier.wait()
+            with manager.engine("en"):
+                pass
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.call_count <= 2
+        assert manager.stats()["pools"][0]["in_use"] == 0
+
+    def test_lru_evicts_idle_language(self):
+        """Test that the least recently used idle language is evicted."""
+        manager, _ = _make_manager(max_keys=2)
+
+        for language in ["en", "fr", "en", "de"]:
+            with manager.engine(language):
+                pass
+
+        languages = [pool["language"] for pool in manager.stats()["pools"]]
+        assert languages == ["en", "de"]
+        assert manager.stats()["evicted"] == 1
+
+    def test_prewarm(self):
+        """Test that prewarm creates idle engines up to the requested count."""
+        manager, factory = _make_manager(max_engines_per_key=2)
+
+        assert manager.prewarm("fr", count=5) == 2
+        assert manager.prewarm("fr", count=1) == 0
+
+        pool = manager.stats()["pools"][0]
+        assert pool["idle"] == 2
+        assert factory.call_count == 2
+
+    def test_failed_creation_releases_slot(self):
+        """Test that a failing factory does not leak pool capacity."""
+        factory = Mock(side_effect=[RuntimeError("init failed"), Mock()])
+        manager = OCREngineManager(max_engines_per_key=1, factory=factory)
+
+        try:
+            with manager.engine("en"):
+                pass
+        except RuntimeError:
+            pass
+
+        with manager.engine("en") as engine:
+            assert engine is not None
+
+
+class TestParsePrewarmSpec:
+    """Test cases for _parse_prewarm_spec function."""
+
+    def test_parse(self):
+        """Test parsing language counts with defaults."""
+        assert _parse_prewarm_spec("en:2, fr,") == {"en": 2, "fr": 1}
+        assert _parse_prewarm_spec("") == {}
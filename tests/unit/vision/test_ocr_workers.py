@@ -0,0 +1,104 @@
+"""Unit tests for vision.ocr_workers module."""
+
+import asyncio
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from vision.ocr_workers import OCRWorkerPool, get_ocr_worker_pool, start_ocr_workers
+from vision.reader import TextResult, extract_text
+
+
+def _fake_ocr(image, language, confidence_threshold, max_results):
+    """Report the pixel sum, sleep on value 7 and crash the worker on value 9."""
+    value = int(image.reshape(-1)[0])
+    if value == 9:
+        os._exit(3)
+    if value == 7:
+        time.sleep(0.5)
+    return [TextResult(str(int(image.sum())), 0.9, [(0, 0)] * 4, (0, 0, 1, 1), (0, 0), 1)]
+
+
+@pytest.fixture
+def pool():
+    """Forked workers that inherit a fake OCR function and engine manager."""
+    with (
+        patch("vision.reader._run_ocr", side_effect=_fake_ocr),
+        patch("vision.ocr_engines.get_ocr_engine_manager", return_value=MagicMock()),
+    ):
+        pool = OCRWorkerPool(num_workers=2, max_pending=2, start_method="fork")
+        yield pool
+        pool.shutdown()
+
+
+def _image(value: int, shape=(20, 30, 3)) -> np.ndarray:
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class TestOCRWorkerPool:
+    """Test cases for OCRWorkerPool class."""
+
+    def test_images_round_trip_through_shared_memory(self, pool):
+        """Test that workers read the submitted pixels, including larger images."""
+        assert pool.extract_text(_image(1))[0].text == str(20 * 30 * 3)
+        assert pool.extract_text(_image(2, (50, 60, 3)))[0].text == str(2 * 50 * 60 * 3)
+        assert pool.stats()["completed"] == 2
+
+    def test_backpressure_blocks_submission(self, pool):
+        """Test that submit times out while all slots are in flight."""
+        pool.submit(_image(7))
+        pool.submit(_image(7))
+
+        with pytest.raises(TimeoutError):
+            pool.submit(_image(1), timeout=0.05)
+        assert pool.stats()["backpressure_waits"] == 1
+
+    def test_crashed_worker_fails_request_and_restarts(self, pool):
+        """Test that a worker exit fails its request and a replacement serves the next."""
+        future = pool.submit(_image(9))
+
+        with pytest.raises(RuntimeError, match="exited"):
+            future.result(timeout=10)
+        assert pool.extract_text(_image(1), timeout=10)[0].text == str(20 * 30 * 3)
+        assert pool.stats()["restarts"] == 1
+
+    def test_asyncio_client(self, pool):
+        """Test that concurrent coroutines share the bounded slots."""
+
+        async def run():
+            return await asyncio.gather(*(pool.aextract_text(_image(i)) for i in range(1, 5)))
+
+        results = asyncio.run(run())
+
+        assert [r[0].text for r in results] == [str(i * 20 * 30 * 3) for i in range(1, 5)]
+
+    def test_shutdown_rejects_new_work(self, pool):
+        """Test that a shut down pool refuses submissions."""
+        pool.shutdown()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(_image(1))
+
+
+class TestProcessPool:
+    """Test cases for the process-wide worker pool."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that no pool starts unless workers are requested."""
+        monkeypatch.delenv("VISION_OCR_WORKERS", raising=False)
+
+        assert start_ocr_workers() is None
+        assert get_ocr_worker_pool() is None
+
+    def test_extract_text_routes_through_pool(self):
+        """Test that extract_text hands OCR to a running pool."""
+        pool = MagicMock()
+        pool.extract_text.return_value = []
+
+        with patch("vision.reader.get_ocr_worker_pool", return_value=pool):
+            extract_text(_image(1))
+
+        pool.extract_text.assert_called_once()
@@ -0,0 +1,98 @@
+"""Unit tests for vision.preprocess module."""
+
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from vision.preprocess import (
+    LETTERBOX_PAD_VALUE,
+    LetterboxBuffer,
+    get_letterbox_transform,
+    get_tile_rects,
+)
+
+
+class TestGetLetterboxTransform:
+    """Test cases for get_letterbox_transform function."""
+
+    def test_wide_image(self):
+        """Test that a 16:9 image is padded vertically."""
+        transform = get_letterbox_transform((1080, 1920, 3), 640, 640)
+
+        assert transform.scale == pytest.approx(1 / 3)
+        assert (transform.resized_width, transform.resized_height) == (640, 360)
+        assert (transform.pad_x, transform.pad_y) == (0, 140)
+
+    def test_round_trip(self):
+        """Test that mapped points return to original coordinates."""
+        transform = get_letterbox_transform((1000, 400, 3), 640, 640)
+        points = np.array([[100.0, 500.0]], dtype=np.float32)
+
+        model_points = points * transform.scale + [transform.pad_x, transform.pad_y]
+
+        assert transform.points_to_original(model_points) == pytest.approx(points)
+
+
+class TestLetterboxBuffer:
+    """Test cases for LetterboxBuffer class."""
+
+    def test_fill_writes_normalized_rgb_chw(self):
+        """Test tensor layout, channel order, scaling and padding."""
+        buffer = LetterboxBuffer(64, 64)
+        image = np.zeros((18, 32, 3), dtype=np.uint8)
+        image[:, :] = [255, 0, 51]  # BGR
+
+        transform = buffer.fill(image)
+        tensor = buffer.batch(1)
+
+        assert tensor.shape == (1, 3, 64, 64)
+        assert tensor.dtype == np.float32
+        assert transform.pad_y == 14
+        # Content rows are RGB = (51, 0, 255) / 255
+        assert tensor[0, :, 32, 32] == pytest.approx([0.2, 0.0, 1.0])
+        # Padding rows use the letterbox pad value
+        assert tensor[0, 0, 0, 0] == pytest.approx(LETTERBOX_PAD_VALUE / 255)
+
+    def test_buffers_are_reused(self):
+        """Test that repeated fills write into the same tensor."""
+        buffer = LetterboxBuffer(64, 64, batch_size=2)
+        tensor = buffer.tensor
+
+        buffer.fill(np.zeros((64, 64, 3), dtype=np.uint8), index=0)
+        buffer.fill(np.full((32, 64, 3), 255, dtype=np.uint8), index=1)
+
+        assert buffer.tensor is tensor
+        assert buffer.batch(2)[0].max() == 0.0
+        assert buffer.batch(2)[1, 0, 32, 32] == pytest.approx(1.0)
+        assert buffer.batch(2)[1, 0, 0, 0] == pytest.approx(LETTERBOX_PAD_VALUE / 255)
+
+
+class TestGetTileRects:
+    """Test cases for get_tile_rects function."""
+
+    def test_small_image_is_one_tile(self):
+        """Test that an image no larger than a tile is not split."""
+        assert get_tile_rects((480, 640, 3)) == [(0, 0, 640, 480)]
+
+    def test_tiles_cover_image_with_overlap(self):
+        """Test that dual-monitor tiles cover every pixel and overlap their neighbours."""
+        tiles = get_tile_rects((1440, 5120, 3))
+
+        xs = sorted({(x1, x2) for x1, _, x2, _ in tiles})
+        ys = sorted({(y1, y2) for _, y1, _, y2 in tiles})
+        assert xs[0][0] == 0 and xs[-1][1] == 5120
+        assert ys[0][0] == 0 and ys[-1][1] == 1440
+        assert all(prev[1] - nxt[0] >= 256 for prev, nxt in pairwise(xs))
+        assert all(x2 - x1 == 1280 for x1, x2 in xs)
+
+    def test_tile_size_adapts_to_resolution(self):
+        """Test that tiles never exceed the short image side or twice the input size."""
+        assert {y2 - y1 for _, y1, _, y2 in get_tile_rects((1080, 1920, 3))} == {1080}
+        assert {y2 - y1 for _, y1, _, y2 in get_tile_rects((2160, 3840, 3))} == {1280}
+
+    def test_explicit_tile_size_and_overlap(self):
+        """Test that explicit tile size and overlap are honoured."""
+        tiles = get_tile_rects((100, 300, 3), tile_size=100, overlap=0)
+
+        assert tiles == [(0, 0, 100, 100), (100, 0, 200, 100), (200, 0, 300, 100)]
@@ -0,0 +1,236 @@
+"""Unit tests for vision.reader module."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from vision.reader import (
+    OCRScalePolicy,
+    extract_text_from_regions,
+    extract_text_two_stage,
+    get_two_stage_ocr_stats,
+    recognize_text,
+    reset_two_stage_ocr_stats,
+)
+
+
+def _page(text, poly, score=0.9):
+    return {"rec_texts": [text], "rec_scores": [score], "rec_polys": [poly]}
+
+
+def _manager(**predict):
+    """Mock engine manager whose checked-out engine predicts as configured."""
+    manager = MagicMock()
+    engine = manager.engine.return_value.__enter__.return_value
+    engine.predict.configure_mock(**predict)
+    return manager, engine
+
+
+@pytest.fixture
+def image():
+    return np.zeros((400, 600, 3), dtype=np.uint8)
+
+
+class TestExtractTextFromRegions:
+    """Test cases for extract_text_from_regions function."""
+
+    def test_blocks_run_in_one_batch(self, image):
+        """Test that multi-line regions run through the pipeline in one call."""
+        manager, engine = _manager(
+            return_value=[
+                _page("Name", [(0, 0), (40, 0), (40, 10), (0, 10)]),
+                _page("MRN", [(5, 5), (35, 5), (35, 15), (5, 15)]),
+            ]
+        )
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            results = extract_text_from_regions(image, [(10, 20, 200, 60), (300, 100, 500, 150)])
+
+        crops = engine.predict.call_args[0][0]
+        assert [crop.shape[:2] for crop in crops] == [(40, 190), (50, 200)]
+        assert results[0][0].rect_bbox == (10, 20, 50, 30)
+        assert results[1][0].center == (320, 110)
+
+    def test_single_line_skips_detection(self, image):
+        """Test that single-line regions only run text recognition."""
+        pipeline, _ = _manager()
+        recognizer_manager, recognizer = _manager(
+            return_value=[
+                {"rec_text": " Smith, John ", "rec_score": 0.95},
+                {"rec_text": "", "rec_score": 0.1},
+            ]
+        )
+
+        with (
+            patch("vision.reader.get_ocr_engine_manager", return_value=pipeline),
+            patch("vision.reader.get_text_recognizer_manager", return_value=recognizer_manager),
+        ):
+            results = extract_text_from_regions(
+                image, [(10, 10, 110, 30), (10, 40, 110, 60)], single_line=True
+            )
+
+        pipeline.engine.assert_not_called()
+        assert recognizer.predict.call_count == 1
+        assert results[0][0].text == "Smith, John"
+        assert results[0][0].rect_bbox == (10, 10, 110, 30)
+        assert results[1] == []
+
+    def test_single_line_falls_back_without_recognition_model(self, image):
+        """Test that languages without a recognition model use the full pipeline."""
+        pipeline, _ = _manager(return_value=[_page("Nom", [(0, 0), (9, 0), (9, 9), (0, 9)])])
+        recognizer_manager, _ = _manager()
+
+        with (
+            patch("vision.reader.get_ocr_engine_manager", return_value=pipeline),
+            patch("vision.reader.get_text_recognizer_manager", return_value=recognizer_manager),
+        ):
+            results = extract_text_from_regions(
+                image, [(0, 0, 100, 20)], language="fr", single_line=True
+            )
+
+        recognizer_manager.engine.assert_not_called()
+        assert results[0][0].text == "Nom"
+
+    def test_empty_regions_are_skipped(self, image):
+        """Test that regions outside the image return no text without running OCR."""
+        manager, _ = _manager()
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            results = extract_text_from_regions(image, [(700, 0, 800, 50)])
+
+        assert results == [[]]
+        manager.engine.assert_not_called()
+
+    def test_single_line_flags_must_match_regions(self, image):
+        """Test that a mismatched single_line list raises ValueError."""
+        with pytest.raises(ValueError):
+            extract_text_from_regions(image, [(0, 0, 10, 10)], single_line=[True, False])
+
+
+class TestRecognizeText:
+    """Test cases for recognize_text function."""
+
+    def test_batches_by_aspect_ratio_in_input_order(self, image):
+        """Test that crops are batched by aspect ratio and results keep box order."""
+        recognizer_manager, recognizer = _manager(
+            side_effect=lambda crops, batch_size: [
+                {"rec_text": f"w{crop.shape[1]}", "rec_score": 0.9} for crop in crops
+            ]
+        )
+
+        with patch("vision.reader.get_text_recognizer_manager", return_value=recognizer_manager):
+            results = recognize_text(image, [(0, 0, 300, 20), (0, 30, 40, 50), (0, 60, 100, 80)])
+
+        crops = recognizer.predict.call_args[0][0]
+        assert [crop.shape[1] for crop in crops] == [40, 100, 300]
+        assert [r.text for r in results] == ["w300", "w40", "w100"]
+        assert results[1].rect_bbox == (0, 30, 40, 50)
+
+    def test_corner_boxes_and_threshold(self, image):
+        """Test that rotated corner boxes are rectified and weak reads dropped."""
+        recognizer_manager, recognizer = _manager(
+            return_value=[
+                {"rec_text": "Allergies", "rec_score": 0.92},
+                {"rec_text": "??", "rec_score": 0.2},
+            ]
+        )
+        rotated = [(100, 100), (200, 120), (196, 140), (96, 120)]
+
+        with patch("vision.reader.get_text_recognizer_manager", return_value=recognizer_manager):
+            results = recognize_text(image, [rotated, (300, 300, 600, 320)])
+
+        rectified = recognizer.predict.call_args[0][0][0]
+        assert rectified.shape[:2] == (20, 101)
+        assert results[0].text == "Allergies"
+        assert results[0].bbox == rotated
+        assert results[0].rect_bbox == (96, 100, 200, 140)
+        assert results[1] is None
+
+    def test_boxes_outside_image_skip_recognition(self, image):
+        """Test that empty boxes return None without running the model."""
+        recognizer_manager, _ = _manager()
+
+        with patch("vision.reader.get_text_recognizer_manager", return_value=recognizer_manager):
+            assert recognize_text(image, [(700, 0, 800, 50)]) == [None]
+
+        recognizer_manager.engine.assert_not_called()
+
+    def test_language_without_recognition_model(self, image):
+        """Test that languages without a recognition model raise ValueError."""
+        with pytest.raises(ValueError):
+            recognize_text(image, [(0, 0, 10, 10)], language="fr")
+
+
+def _box(x1, y1, x2, y2):
+    return [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+
+
+class TestExtractTextTwoStage:
+    """Test cases for extract_text_two_stage function."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_stats(self):
+        reset_two_stage_ocr_stats()
+
+    def _pipeline(self, prepass_page, refine_page=None):
+        """Engine returning prepass_page for whole images and refine_page per crop."""
+
+        def predict(images):
+            if isinstance(images, list):
+                return [refine_page for _ in images]
+            return [prepass_page]
+
+        return _manager(side_effect=predict)
+
+    def test_confident_large_text_skips_refinement(self, image):
+        """Test that trusted pre-pass text is scaled back without a second pass."""
+        manager, engine = self._pipeline(
+            {"rec_texts": ["Patients"], "rec_scores": [0.97], "rec_polys": [_box(10, 10, 90, 30)]}
+        )
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            results = extract_text_two_stage(image)
+
+        assert engine.predict.call_args[0][0].shape[:2] == (200, 300)
+        assert engine.predict.call_count == 1
+        assert results[0].rect_bbox == (20, 20, 180, 60)
+        assert get_two_stage_ocr_stats()["stages"]["refine"]["runs"] == 0
+
+    def test_low_confidence_and_small_text_are_reread(self, image):
+        """Test that untrusted text is replaced by a full-resolution read."""
+        manager, engine = self._pipeline(
+            {
+                "rec_texts": ["Patients", "D0B", "tiny"],
+                "rec_scores": [0.97, 0.6, 0.95],
+                "rec_polys": [
+                    _box(10, 10, 90, 30),
+                    _box(10, 100, 60, 112),
+                    _box(200, 150, 230, 154),
+                ],
+            },
+            _page("DOB", _box(8, 8, 100, 32), score=0.93),
+        )
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            results = extract_text_two_stage(image, policy=OCRScalePolicy(min_text_height=12))
+
+        crops = engine.predict.call_args[0][0]
+        assert len(crops) == 2
+        assert [r.text for r in results] == ["Patients", "DOB", "DOB"]
+        stages = get_two_stage_ocr_stats()["stages"]
+        assert stages["prepass"]["pixels"] == 200 * 300
+        assert stages["refine"]["regions"] == 2
+        assert stages["refine"]["texts"] == 2
+
+    def test_mostly_untrusted_runs_full_pass(self, image):
+        """Test that refining most of the image falls back to one full pass."""
+        manager, engine = self._pipeline(
+            {"rec_texts": ["blurry"], "rec_scores": [0.4], "rec_polys": [_box(0, 0, 300, 200)]}
+        )
+
+        with patch("vision.reader.get_ocr_engine_manager", return_value=manager):
+            extract_text_two_stage(image)
+
+        assert engine.predict.call_args[0][0].shape[:2] == (400, 600)
+        assert get_two_stage_ocr_stats()["stages"]["full"]["runs"] == 1
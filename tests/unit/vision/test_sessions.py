@@ -0,0 +1,264 @@
+"""Unit tests for vision.sessions module."""
+
+import os
+import threading
+from unittest.mock import Mock, patch
+
+import onnxruntime as ort
+import pytest
+
+from vision import sessions
+from vision.sessions import (
+    EXECUTION_PROFILES,
+    SessionRegistry,
+    _profile_from_env,
+    get_execution_profile,
+    get_optimized_model_path,
+    is_optimized_model_current,
+    optimize_model,
+    preload_model,
+    set_execution_profile,
+)
+
+
+def _mock_session():
+    """Create a mock ONNX session with a static YOLO-style input."""
+    session = Mock()
+    model_input = Mock()
+    model_input.name = "images"
+    model_input.shape = [1, 3, 640, 640]
+    session.get_inputs.return_value = [model_input]
+    return session
+
+
+@pytest.fixture
+def mock_inference_session():
+    """Patch ort.InferenceSession to return fresh mock sessions."""
+    with patch("vision.sessions.ort.InferenceSession") as mock_cls:
+        mock_cls.side_effect = lambda *args, **kwargs: _mock_session()
+        yield mock_cls
+
+
+class TestSessionRegistry:
+    """Test cases for SessionRegistry class."""
+
+    def test_get_loads_once_and_reuses(self, mock_inference_session):
+        """Test that repeated gets share one session."""
+        registry = SessionRegistry()
+
+        first = registry.get("model.onnx")
+        second = registry.get("model.onnx")
+
+        assert first is second
+        assert mock_inference_session.call_count == 1
+        assert first.input_name == "images"
+        assert first.input_shape == [1, 3, 640, 640]
+
+        stats = registry.stats()
+        assert stats["loads"] == 1
+        assert stats["hits"] == 1
+        assert len(stats["loaded_sessions"]) == 1
+
+    def test_warmup_runs_dummy_inference(self, mock_inference_session):
+        """Test that loading warms the session with a zero tensor."""
+        registry = SessionRegistry()
+
+        entry = registry.get("model.onnx")
+
+        entry.session.run.assert_called_once()
+        feed = entry.session.run.call_args[0][1]
+        assert feed["images"].shape == (1, 3, 640, 640)
+
+    def test_options_are_part_of_key(self, mock_inference_session):
+        """Test that different session options produce separate sessions."""
+        registry = SessionRegistry()
+
+        default = registry.get("model.onnx")
+        threaded = registry.get("model.onnx", session_options={"intra_op_num_threads": 2})
+
+        assert default is not threaded
+        assert mock_inference_session.call_count == 2
+
+    def test_unload(self, mock_inference_session):
+        """Test that unload drops sessions and forces a reload."""
+        registry = SessionRegistry()
+        registry.get("a.onnx")
+        registry.get("b.onnx")
+
+        assert registry.unload("a.onnx") == 1
+        assert registry.unload() == 1
+
+        registry.get("a.onnx")
+        assert mock_inference_session.call_count == 3
+        assert registry.stats()["unloads"] == 2
+
+    def test_concurrent_first_use_loads_once(self, mock_inference_session):
+        """Test that concurrent callers share a single load."""
+        registry = SessionRegistry()
+        results = []
+
+        def worker():
+            results.append(registry.get("model.onnx"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_inference_session.call_count == 1
+        assert all(entry is results[0] for entry in results)
+
+
+class TestPreloadModel:
+    """Test cases for preload_model function."""
+
+    def test_missing_model_raises(self, tmp_path):
+        """Test that preloading a missing model raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            preload_model(str(tmp_path / "missing.onnx"))
+
+
+class TestExecutionProfiles:
+    """Test cases for execution profile selection."""
+
+    @pytest.fixture(autouse=True)
+    def restore_profile(self):
+        """Restore the active profile after each test."""
+        profile = get_execution_profile()
+        yield
+        sessions._active_profile = profile
+
+    def test_set_profile_with_overrides(self):
+        """Test selecting a named profile with a thread override."""
+        profile = set_execution_profile("throughput", intra_op_num_threads=2)
+
+        assert get_execution_profile() is profile
+        assert profile.name == "throughput"
+        assert profile.intra_op_num_threads == 2
+        assert profile.inter_op_num_threads == 1
+
+    def test_unknown_profile_raises(self):
+        """Test that an unknown profile name raises ValueError."""
+        with pytest.raises(ValueError):
+            set_execution_profile("turbo")
+
+    def test_sessions_use_active_profile(self, mock_inference_session):
+        """Test that new sessions get the active profile's options applied."""
+        set_execution_profile("low_memory")
+        registry = SessionRegistry()
+
+        with patch.object(sessions, "_registry", registry):
+            sessions.get_session("model.onnx")
+
+        options = mock_inference_session.call_args.kwargs["sess_options"]
+        assert options.intra_op_num_threads == 1
+        assert options.enable_cpu_mem_arena is False
+        assert registry.stats()["loaded_sessions"][0]["options"]["graph_optimization_level"] == (
+            "basic"
+        )
+
+    def test_profile_from_env(self, monkeypatch):
+        """Test reading the profile and thread overrides from the environment."""
+        monkeypatch.setenv("VISION_EXECUTION_PROFILE", "Throughput")
+        monkeypatch.setenv("VISION_INTER_OP_THREADS", "3")
+
+        profile = _profile_from_env()
+
+        assert profile.name == "throughput"
+        assert profile.inter_op_num_threads == 3
+
+    def test_profile_from_env_unknown_falls_back(self, monkeypatch):
+        """Test that an unknown environment profile falls back to latency."""
+        monkeypatch.setenv("VISION_EXECUTION_PROFILE", "bogus")
+
+        assert _profile_from_env() == EXECUTION_PROFILES["latency"]
+
+    def test_profile_from_env_malformed_threads_ignored(self, monkeypatch):
+        """Test that a malformed thread override keeps the profile value."""
+        monkeypatch.setenv("VISION_EXECUTION_PROFILE", "throughput")
+        monkeypatch.setenv("VISION_INTRA_OP_THREADS", "four")
+        monkeypatch.setenv("VISION_INTER_OP_THREADS", "2")
+
+        profile = _profile_from_env()
+
+        assert profile.intra_op_num_threads == 1
+        assert profile.inter_op_num_threads == 2
+
+
+@pytest.fixture
+def tiny_model(tmp_path):
+    """Write a tiny ONNX model with a YOLO-style input to disk."""
+    import numpy as np
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    images = helper.make_tensor_value_info("images", TensorProto.FLOAT, [1, 3, 8, 8])
+    output = helper.make_tensor_value_info("output0", TensorProto.FLOAT, [1, 3, 8, 8])
+    scale = numpy_helper.from_array(np.array(2.0, dtype=np.float32), "scale")
+    nodes = [
+        helper.make_node("Mul", ["images", "scale"], ["scaled"]),
+        helper.make_node("Identity", ["scaled"], ["output0"]),
+    ]
+    graph = helper.make_graph(nodes, "tiny", [images], [output], [scale])
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 8
+
+    path = tmp_path / "tiny.onnx"
+    onnx.save(model, str(path))
+    return str(path)
+
+
+class TestOptimizedModelCache:
+    """Test cases for offline-optimized model caching."""
+
+    def test_optimized_path_is_keyed_by_version_and_level(self):
+        """Test that the cache path includes the ORT version and level."""
+        path = get_optimized_model_path("models/yolov8s.onnx", "basic")
+
+        assert path == f"models/yolov8s.ort{ort.__version__}-basic.onnx"
+
+    def test_optimize_model_writes_artifact(self, tiny_model):
+        """Test that optimize_model serializes the optimized graph once."""
+        optimized_path = optimize_model(tiny_model)
+
+        assert os.path.exists(optimized_path)
+        mtime = os.path.getmtime(optimized_path)
+        assert optimize_model(tiny_model) == optimized_path
+        assert os.path.getmtime(optimized_path) == mtime
+
+    def test_get_session_prefers_optimized_model(self, tiny_model):
+        """Test that profile sessions load the cached optimized model when present."""
+        registry = SessionRegistry()
+
+        with patch.object(sessions, "_registry", registry):
+            assert sessions.get_session(tiny_model).model_path == os.path.abspath(tiny_model)
+
+            optimized_path = optimize_model(tiny_model)
+            entry = sessions.get_session(tiny_model)
+
+        assert entry.model_path == os.path.abspath(optimized_path)
+
+    def test_unload_by_original_path(self, tiny_model):
+        """Test that a session loaded from the optimized copy unloads by the original path."""
+        optimize_model(tiny_model)
+        registry = SessionRegistry()
+
+        with patch.object(sessions, "_registry", registry):
+            first = sessions.get_session(tiny_model)
+            assert sessions.unload_model(tiny_model) == 1
+            assert sessions.get_session(tiny_model) is not first
+
+    def test_replaced_model_invalidates_optimized_model(self, tiny_model):
+        """Test that a model file newer than its optimized copy is loaded and re-optimized."""
+        optimized_path = optimize_model(tiny_model)
+        stale_mtime = os.path.getmtime(optimized_path) - 10
+        os.utime(optimized_path, (stale_mtime, stale_mtime))
+        registry = SessionRegistry()
+
+        assert not is_optimized_model_current(tiny_model)
+        with patch.object(sessions, "_registry", registry):
+            assert sessions.get_session(tiny_model).model_path == os.path.abspath(tiny_model)
+
+        assert optimize_model(tiny_model) == optimized_path
+        assert is_optimized_model_current(tiny_model)
@@ -0,0 +1,77 @@
+"""Unit tests for vision.spatial module."""
+
+import numpy as np
+import pytest
+
+from vision.spatial import SpatialIndex
+
+
+@pytest.fixture
+def random_boxes():
+    """Random boxes on a 1920x1080 screen."""
+    rng = np.random.default_rng(7)
+    corners = rng.uniform(0, [1900, 1060], (200, 2))
+    sizes = rng.uniform(4, 120, (200, 2))
+    return np.concatenate([corners, corners + sizes], axis=1)
+
+
+def _brute_force_radius(boxes, point, radius):
+    centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+    distances = np.hypot(*(centers - point).T)
+    order = np.lexsort((np.arange(len(boxes)), distances))
+    return order[distances[order] <= radius]
+
+
+class TestSpatialIndex:
+    """Test cases for SpatialIndex class."""
+
+    @pytest.mark.parametrize("cell_size", [None, 10, 500])
+    def test_within_radius_matches_brute_force(self, random_boxes, cell_size):
+        """Test radius queries against a linear scan for several cell sizes."""
+        index = SpatialIndex(random_boxes, cell_size=cell_size)
+
+        for point, radius in [((960, 540), 150), ((0, 0), 300), ((-500, 2000), 100)]:
+            indices, distances = index.within_radius(point, radius)
+
+            assert indices.tolist() == _brute_force_radius(random_boxes, point, radius).tolist()
+            assert np.all(np.diff(distances) >= 0)
+
+    def test_nearest(self, random_boxes):
+        """Test k-nearest queries, including points far outside the grid."""
+        index = SpatialIndex(random_boxes)
+
+        for point in [(960, 540), (5000, 5000)]:
+            expected = _brute_force_radius(random_boxes, point, np.inf)[:5]
+            assert index.nearest(point, k=5)[0].tolist() == expected.tolist()
+
+    def test_nearest_respects_max_distance(self):
+        """Test that neighbours beyond max_distance are not returned."""
+        index = SpatialIndex([[0, 0, 10, 10], [100, 0, 110, 10]])
+
+        assert index.nearest((0, 0), k=2, max_distance=20)[0].tolist() == [0]
+        assert index.nearest((60, 5), k=1, max_distance=20)[0].tolist() == []
+
+    def test_region_queries(self):
+        """Test containment, center and overlap queries."""
+        index = SpatialIndex(
+            [
+                [10, 10, 50, 30],  # inside
+                [40, 40, 120, 60],  # crosses the right edge
+                [200, 200, 220, 220],  # outside
+                [0, 0, 400, 400],  # covers the region
+            ]
+        )
+        region = (0, 0, 100, 100)
+
+        assert index.contained_in(region).tolist() == [0]
+        assert index.centers_in(region).tolist() == [0, 1]
+        assert index.overlapping(region).tolist() == [0, 1, 3]
+
+    def test_empty_index(self):
+        """Test that an empty index answers every query with nothing."""
+        index = SpatialIndex([])
+
+        assert len(index) == 0
+        assert index.within_radius((0, 0), 100)[0].size == 0
+        assert index.nearest((0, 0), k=3)[0].size == 0
+        assert index.overlapping((0, 0, 10, 10)).size == 0
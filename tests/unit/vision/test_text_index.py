@@ -0,0 +1,93 @@
+"""Unit tests for vision.text_index module."""
+
+import pytest
+
+from vision.reader import TextResult
+from vision.text_index import TextIndex, normalize_text, text_similarity
+
+
+def _result(text, confidence=0.9):
+    return TextResult(text, confidence, [(0, 0)] * 4, (0, 0, 10, 10), (5, 5), 100)
+
+
+@pytest.fixture
+def index():
+    return TextIndex(
+        [
+            _result("Subrnit"),
+            _result("Submitted", 0.8),
+            _result("Please  submit now"),
+            _result("Cancel"),
+            _result("Username:"),
+            _result("Pasword"),
+        ]
+    )
+
+
+def _texts(matches):
+    return [(m.result.text, m.match_type) for m in matches]
+
+
+class TestNormalizeText:
+    """Test cases for normalize_text function."""
+
+    def test_whitespace_case_and_width(self):
+        """Test that whitespace collapses, case folds and full-width forms normalize."""
+        assert normalize_text("  \uff33ubmit \t  FORM ") == "submit form"
+        assert normalize_text("Submit", case_sensitive=True) == "Submit"
+
+
+class TestTextIndex:
+    """Test cases for TextIndex class."""
+
+    def test_match_types_ordered(self, index):
+        """Test that exact, prefix and substring matches rank in that order."""
+        assert _texts(index.search("cancel", mode="exact")) == [("Cancel", "exact")]
+        assert _texts(index.search("submit")) == [
+            ("Submitted", "prefix"),
+            ("Please  submit now", "substring"),
+        ]
+
+    def test_fuzzy_tolerates_ocr_noise(self, index):
+        """Test that OCR confusions and small typos match in fuzzy mode."""
+        submit = index.search("Submit", mode="fuzzy")
+        password = index.search("Password", mode="fuzzy")
+
+        assert ("Subrnit", "fuzzy") in _texts(submit)
+        assert _texts(password) == [("Pasword", "fuzzy")]
+        assert password[0].score == pytest.approx(1 - 1 / 8)
+
+    def test_fuzzy_respects_distance_and_score(self, index):
+        """Test that distant strings are not matched."""
+        assert index.search("Logout", mode="fuzzy") == []
+        assert index.search("Password", mode="fuzzy", min_score=0.9) == []
+
+    def test_case_sensitive(self, index):
+        """Test that case-sensitive lookups keep letter case."""
+        assert index.search("submit", case_sensitive=True) == index.search(
+            "submit", mode="substring", case_sensitive=True
+        )
+        assert _texts(index.search("Submit", case_sensitive=True)) == [("Submitted", "prefix")]
+
+    def test_search_many(self, index):
+        """Test that several queries are answered together."""
+        results = index.search_many(["user", "cancel", "missing"])
+
+        assert _texts(results["user"]) == [("Username:", "prefix")]
+        assert _texts(results["cancel"]) == [("Cancel", "exact")]
+        assert results["missing"] == []
+
+    def test_unknown_mode(self, index):
+        """Test that an unknown mode raises ValueError."""
+        with pytest.raises(ValueError):
+            index.search("x", mode="regex")
+
+
+class TestTextSimilarity:
+    """Test cases for text_similarity function."""
+
+    def test_similarity(self):
+        """Test partial similarity scores."""
+        assert text_similarity("Submit", "Subrnit button") == 1.0
+        assert text_similarity("John Smith", "Jon Smith") == pytest.approx(0.9)
+        assert text_similarity("", "anything") == 0.0
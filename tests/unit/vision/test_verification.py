@@ -0,0 +1,237 @@
+"""Unit tests for vision.verification module."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from vision.reader import TextResult
+from vision.verification import (
+    VerificationResult,
+    verify_page_loaded,
+    verify_text_input,
+    wait_for_element,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only advances when sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _frame(value):
+    return np.full((120, 160, 3), value, dtype=np.uint8)
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("vision.verification.time", clock):
+        yield clock
+
+
+def _screen(clock, timeline):
+    """Capture function returning the last frame whose start time has passed."""
+
+    def capture():
+        return next(frame for start, frame in reversed(timeline) if clock.now >= start)
+
+    return capture
+
+
+def _found_on(value):
+    """verify_element_present stub that succeeds on frames filled with value."""
+
+    def verify(screenshot, description, confidence_threshold):
+        return VerificationResult(bool(screenshot[0, 0, 0] == value), "Element found", 0.9)
+
+    return verify
+
+
+class TestWaitForElement:
+    """Test cases for wait_for_element function."""
+
+    def test_static_screen_searched_once_per_heartbeat(self, clock):
+        """Test that an unchanged screen is not re-analyzed on every poll."""
+        capture = _screen(clock, [(0, _frame(0))])
+
+        with patch(
+            "vision.verification.verify_element_present", side_effect=_found_on(1)
+        ) as verify:
+            result = wait_for_element(capture, "Submit", timeout=12, heartbeat=5)
+
+        assert not result.success
+        assert verify.call_count == 3  # t=0, then heartbeats near 5s and 10s
+        assert max(clock.sleeps) == 1.0
+
+    def test_caret_blink_does_not_trigger_search(self, clock):
+        """Test that a blinking caret is treated like a static screen."""
+        screen = np.zeros((600, 800, 3), dtype=np.uint8)
+        caret = screen.copy()
+        caret[50:66, 30:33] = 255
+        capture = lambda: caret if int(clock.now * 2) % 2 else screen  # noqa: E731
+
+        with patch(
+            "vision.verification.verify_element_present", side_effect=_found_on(1)
+        ) as verify:
+            wait_for_element(capture, "Submit", timeout=12, heartbeat=5)
+
+        assert verify.call_count == 3
+
+    def test_small_element_found_with_slow_searches(self, clock):
+        """Test that a small control appearing is searched for and searches don't eat the budget."""
+        screen = np.zeros((600, 800, 3), dtype=np.uint8)
+        loaded = screen.copy()
+        loaded[300:320, 350:450] = 230
+        capture = _screen(clock, [(0, screen), (4.4, loaded)])
+
+        def slow_search(screenshot, description, confidence_threshold):
+            clock.now += 2.0
+            return VerificationResult(bool(screenshot[310, 400, 0] == 230), "Element found", 0.9)
+
+        with patch("vision.verification.verify_element_present", side_effect=slow_search):
+            result = wait_for_element(capture, "Submit", max_attempts=3, delay=1.0)
+
+        assert result.success
+        assert "2 attempts" in result.message
+
+    def test_change_triggers_search_once_settled(self, clock):
+        """Test that the element is found right after the screen changes and settles."""
+        capture = _screen(clock, [(0, _frame(0)), (3.0, _frame(200))])
+
+        with patch(
+            "vision.verification.verify_element_present", side_effect=_found_on(200)
+        ) as verify:
+            result = wait_for_element(capture, "Submit", timeout=10, heartbeat=60)
+
+        assert result.success
+        assert verify.call_count == 2
+        assert clock.now < 3.0 + 2 * 1.0 + 0.2
+        assert "2 attempts" in result.message
+
+    def test_continuous_change_limited_by_delay(self, clock):
+        """Test that an animating screen is searched at most once per delay."""
+        capture = lambda: _frame(round(clock.now * 200) % 250)  # noqa: E731
+
+        with patch(
+            "vision.verification.verify_element_present", side_effect=_found_on(255)
+        ) as verify:
+            wait_for_element(capture, "Submit", delay=1.0, timeout=5)
+
+        assert 4 <= verify.call_count <= 6
+        assert max(clock.sleeps) == pytest.approx(0.1)
+
+    def test_max_attempts_and_missing_frames(self, clock):
+        """Test that searches stop at max_attempts and failed captures are skipped."""
+        frames = iter([None, _frame(0), _frame(50), _frame(50), _frame(100), _frame(100)])
+
+        with patch(
+            "vision.verification.verify_element_present", side_effect=_found_on(255)
+        ) as verify:
+            result = wait_for_element(
+                lambda: next(frames), "Submit", max_attempts=2, delay=0, timeout=10
+            )
+
+        assert verify.call_count == 2
+        assert "after 2 attempts" in result.message
+
+
+def _text(text, confidence=0.9):
+    return TextResult(text, confidence, [(0, 0)] * 4, (0, 0, 10, 10), (5, 5), 100)
+
+
+PAGE_TEXT = [_text("File", 0.9), _text("Edit", 0.7), _text("Untitled - Notepad", 0.8)]
+
+
+class TestVerifyPageLoaded:
+    """Test cases for verify_page_loaded function."""
+
+    def test_single_ocr_pass_for_all_indicators(self):
+        """Test that the screenshot is read once however many indicators are checked."""
+        indicators = ["File", "Edit", "View", "Help", "Notepad"]
+
+        with (
+            patch("vision.finder.extract_text", return_value=PAGE_TEXT) as ocr,
+            patch("vision.finder.detect_ui_elements") as detect,
+        ):
+            result = verify_page_loaded(_frame(0), indicators, quorum=1.0)
+
+        assert ocr.call_count == 1
+        detect.assert_not_called()
+        assert not result.success
+        assert "3/5" in result.message
+        assert result.confidence == pytest.approx(0.8 * 3 / 5)
+
+    def test_all_indicators_counted_past_quorum(self):
+        """Test that the message and confidence count every indicator on screen."""
+        result = verify_page_loaded(_frame(0), ["File", "Edit", "Notepad"], text_results=PAGE_TEXT)
+
+        assert result.success
+        assert "3/3" in result.message
+        assert result.confidence == pytest.approx((0.9 + 0.7 + 0.8) / 3)
+
+    def test_substring_match_counts_toward_quorum(self):
+        """Test that indicators contained in longer text are found when needed."""
+        result = verify_page_loaded(
+            _frame(0), ["Notepad", "Format"], quorum=0.5, text_results=PAGE_TEXT
+        )
+
+        assert result.success
+        assert "['Notepad']" in result.message
+
+    def test_best_match_confidence_across_match_types(self):
+        """Test that an indicator scores its most confident match, not its first match type."""
+        text = [_text("Edit", 0.6), _text("Edit Mode", 0.95)]
+
+        result = verify_page_loaded(_frame(0), ["Edit"], text_results=text)
+
+        assert result.success
+        assert result.confidence == pytest.approx(0.95)
+
+    def test_none_found(self):
+        """Test failure when no indicator is present."""
+        result = verify_page_loaded(_frame(0), ["Excel"], text_results=PAGE_TEXT)
+
+        assert not result.success
+        assert result.confidence == 0.1
+
+
+class TestVerifyTextInput:
+    """Test cases for verify_text_input function."""
+
+    @pytest.mark.parametrize(
+        ("expected", "on_screen"),
+        [("12345678", "12345679"), ("01/02/1990", "01/02/1991"), ("Smith", "Smyth")],
+    )
+    def test_close_match_is_not_verified(self, expected, on_screen):
+        """Test that a value one character off fails and is reported as a close match."""
+        with (
+            patch("vision.verification.recognize_text", return_value=[_text(on_screen)]),
+            patch("vision.verification.extract_text_from_region", return_value=[_text(on_screen)]),
+        ):
+            result = verify_text_input(_frame(0), (0, 0, 100, 20), expected)
+
+        assert not result.success
+        assert "close match" in result.message
+
+    def test_exact_match_verified_from_line_recognition(self):
+        """Test that a matching single-line read skips full OCR of the region."""
+        with (
+            patch("vision.verification.recognize_text", return_value=[_text("Smith")]),
+            patch("vision.verification.extract_text_from_region") as ocr,
+        ):
+            result = verify_text_input(_frame(0), (0, 0, 100, 20), "smith")
+
+        ocr.assert_not_called()
+        assert result.success
+        assert result.confidence == 0.9